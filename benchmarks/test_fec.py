@@ -31,9 +31,11 @@ class Base:
 
     def test_decode_systematic(self, benchmark):
         benchmark(self.code_sys.decode, self.C_sys)
+        benchmark.extra_info["codewords/s"] = self.N / benchmark.stats.stats.mean
 
     def test_decode_non_systematic(self, benchmark):
         benchmark(self.code_non_sys.decode, self.C_non_sys)
+        benchmark.extra_info["codewords/s"] = self.N / benchmark.stats.stats.mean
 
 
 @pytest.mark.benchmark(group="BCH(63, 39): N=1_000")
@@ -50,3 +52,30 @@ class TestReedSolomon(Base):
     code_non_sys = galois.ReedSolomon(63, 55, systematic=False)
     GF = code_sys.field
     N = 1_000
+
+
+@pytest.mark.benchmark(group="RS(255, 223): N=10_000")
+class TestReedSolomon_255_223(Base):
+    code_sys = galois.ReedSolomon(255, 223)
+    code_non_sys = galois.ReedSolomon(255, 223, systematic=False)
+    GF = code_sys.field
+    N = 10_000
+
+
+@pytest.mark.benchmark(group="BCH(255, 223): N=20_000")
+class TestBCH_255_223(Base):
+    code_sys = galois.BCH(255, 223)
+    code_non_sys = galois.BCH(255, 223, systematic=False)
+    GF = galois.GF2
+    N = 20_000
+
+    def test_encode_systematic_packed(self, benchmark):
+        M = galois.GF2Packed(self.M)
+        benchmark(self.code_sys.encode, M)
+
+    def test_detect_systematic(self, benchmark):
+        benchmark(self.code_sys.detect, self.C_sys)
+
+    def test_detect_systematic_packed(self, benchmark):
+        C = galois.GF2Packed(self.C_sys)
+        benchmark(self.code_sys.detect, C)
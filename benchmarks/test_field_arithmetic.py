@@ -93,3 +93,184 @@ class Test_GF3_5_calculate(Base):
     order = 3**5
     ufunc_mode = "jit-calculate"
     N = 1_000
+
+
+class BaseScalarMultiply:
+    # Placeholder variables
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    N = -1
+
+    def setup_method(self):
+        self.GF = galois.GF(self.order, compile=self.ufunc_mode)
+
+        np.random.seed(123456789)
+        self.x = self.GF.Random(self.N)
+        self.c = self.GF.Random(low=1)
+
+    def test_scalar_multiply_field_element(self, benchmark):
+        benchmark(np.multiply, self.c, self.x)
+        benchmark.extra_info["GB/s"] = self.x.nbytes / benchmark.stats.stats.mean / 1e9
+
+    def test_scalar_multiply_jit_lookup(self, benchmark):
+        # Baseline: the element-wise "jit-lookup" ufunc, without the scalar's product tables
+        multiply = self.GF._ufunc_lookup("multiply")
+        benchmark(multiply, self.c.view(np.ndarray), self.x.view(np.ndarray))
+        benchmark.extra_info["GB/s"] = self.x.nbytes / benchmark.stats.stats.mean / 1e9
+
+    def test_scalar_multiply_jit_calculate(self, benchmark):
+        # Baseline: the element-wise "jit-calculate" ufunc, without the scalar's product tables
+        multiply = self.GF._ufunc_calculate("multiply")
+        benchmark(multiply, self.c.view(np.ndarray), self.x.view(np.ndarray))
+        benchmark.extra_info["GB/s"] = self.x.nbytes / benchmark.stats.stats.mean / 1e9
+
+
+@pytest.mark.benchmark(group="GF(2^8) Scalar-Array Multiplication: shape=(10_000_000,), ufunc_mode='jit-lookup'")
+class Test_GF2_8_scalar_multiply(BaseScalarMultiply):
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    N = 10_000_000
+
+
+@pytest.mark.benchmark(group="GF(2^16) Scalar-Array Multiplication: shape=(10_000_000,), ufunc_mode='jit-lookup'")
+class Test_GF2_16_scalar_multiply(BaseScalarMultiply):
+    order = 2**16
+    ufunc_mode = "jit-lookup"
+    N = 10_000_000
+
+
+class BaseScalarMultiplyAccumulate:
+    # Placeholder variables
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    N = -1
+
+    def setup_method(self):
+        self.GF = galois.GF(self.order, compile=self.ufunc_mode)
+
+        np.random.seed(123456789)
+        self.x = self.GF.Random(self.N)
+        self.y = self.GF.Random(self.N)
+        self.c = self.GF.Random(low=1)
+
+    def test_multiply_accumulate(self, benchmark):
+        benchmark(self.GF.multiply_accumulate, self.y, self.c, self.x)
+        benchmark.extra_info["GB/s"] = self.x.nbytes / benchmark.stats.stats.mean / 1e9
+
+    def test_multiply_accumulate_jit_lookup(self, benchmark):
+        # Baseline: y + c*x with the element-wise "jit-lookup" ufuncs
+        add = self.GF._ufunc_lookup("add")
+        multiply = self.GF._ufunc_lookup("multiply")
+        y, c, x = self.y.view(np.ndarray), self.c.view(np.ndarray), self.x.view(np.ndarray)
+        benchmark(lambda: add(y, multiply(c, x), out=y, casting="unsafe"))
+        benchmark.extra_info["GB/s"] = self.x.nbytes / benchmark.stats.stats.mean / 1e9
+
+
+@pytest.mark.benchmark(group="GF(2^8) Scalar-Array Multiply-Accumulate: shape=(10_000_000,), ufunc_mode='jit-lookup'")
+class Test_GF2_8_multiply_accumulate(BaseScalarMultiplyAccumulate):
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    N = 10_000_000
+
+
+@pytest.mark.benchmark(group="GF(2^16) Scalar-Array Multiply-Accumulate: shape=(10_000_000,), ufunc_mode='jit-lookup'")
+class Test_GF2_16_multiply_accumulate(BaseScalarMultiplyAccumulate):
+    order = 2**16
+    ufunc_mode = "jit-lookup"
+    N = 10_000_000
+
+
+class BaseNativeArithmetic:
+    # Placeholder variables
+    order = 31
+    dtype = np.uint8
+    N = -1
+
+    def setup_method(self):
+        self.GF = galois.GF(self.order)
+
+        np.random.seed(123456789)
+        self.x = self.GF.Random(self.N, dtype=self.dtype)
+        self.y = self.GF.Random(self.N, dtype=self.dtype)
+        self.out = self.GF.Zeros(self.N, dtype=self.dtype)
+
+    def test_add(self, benchmark):
+        benchmark(np.add, self.x, self.y)
+
+    def test_add_out(self, benchmark):
+        benchmark(np.add, self.x, self.y, out=self.out)
+
+    def test_subtract_out(self, benchmark):
+        benchmark(np.subtract, self.x, self.y, out=self.out)
+
+    def test_multiply_out(self, benchmark):
+        benchmark(np.multiply, self.x, self.y, out=self.out)
+
+    def test_additive_inverse_out(self, benchmark):
+        benchmark(np.negative, self.x, out=self.out)
+
+
+@pytest.mark.benchmark(group="GF(31) Native Array Arithmetic: shape=(1_000_000,), dtype=uint8")
+class Test_GF31_native(BaseNativeArithmetic):
+    order = 31
+    dtype = np.uint8
+    N = 1_000_000
+
+
+@pytest.mark.benchmark(group="GF(31) Native Array Arithmetic: shape=(1_000_000,), dtype=int64 (JIT-compiled ufuncs)")
+class Test_GF31_native_int64(BaseNativeArithmetic):
+    order = 31
+    dtype = np.int64
+    N = 1_000_000
+
+
+@pytest.mark.benchmark(group="GF(65521) Native Array Arithmetic: shape=(1_000_000,), dtype=uint32")
+class Test_GF65521_native(BaseNativeArithmetic):
+    order = 65521
+    dtype = np.uint32
+    N = 1_000_000
+
+
+class BaseMultiplicativeGroup:
+    # Placeholder variables
+    order = 2**32
+    ufunc_mode = "jit-calculate"
+    N = -1
+
+    def setup_method(self):
+        self.GF = galois.GF(self.order, compile=self.ufunc_mode)
+
+        np.random.seed(123456789)
+        self.y = self.GF.Random(self.N, low=1)
+        np.log(self.y[0:1])  # Build the discrete logarithm tables outside of the benchmark
+
+    def test_log(self, benchmark):
+        benchmark(np.log, self.y)
+
+    def test_multiplicative_order(self, benchmark):
+        benchmark(self.y.multiplicative_order)
+
+
+@pytest.mark.benchmark(group="GF(2^32) Multiplicative Group: shape=(10_000,), ufunc_mode='jit-calculate'")
+class Test_GF2_32_multiplicative_group(BaseMultiplicativeGroup):
+    order = 2**32
+    ufunc_mode = "jit-calculate"
+    N = 10_000
+
+
+@pytest.mark.benchmark(group="GF(2^31 - 1) Multiplicative Group: shape=(10_000,), ufunc_mode='jit-calculate'")
+class Test_GF2_31_1_multiplicative_group(BaseMultiplicativeGroup):
+    order = 2**31 - 1
+    ufunc_mode = "jit-calculate"
+    N = 10_000
+
+
+@pytest.mark.benchmark(group="Lookup Table Construction")
+@pytest.mark.parametrize("order", [2**16, 2**20, 3**13, 1048573])
+def test_build_lookup_tables(benchmark, order):
+    GF = galois.GF(order, compile="jit-lookup")
+
+    def setup():
+        GF._EXP = np.array([], dtype=np.int64)
+
+    benchmark.pedantic(GF._build_lookup_tables, setup=setup, rounds=5)
@@ -0,0 +1,18 @@
+"""
+A pytest module to benchmark the time to import the library in a new Python process. Importing NumPy alone is the baseline.
+"""
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.benchmark(group="Import Time")
+@pytest.mark.parametrize("statement", [
+    "import numpy",
+    "import galois",
+    "import galois; galois.is_prime(2**61 - 1)",
+    "import galois; galois.GF(2**8)",
+])
+def test_import(benchmark, statement):
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", statement],), kwargs={"check": True}, rounds=5)
@@ -0,0 +1,156 @@
+"""
+A pytest module to benchmark linear algebra over Galois fields.
+"""
+import pytest
+import numpy as np
+
+import galois
+
+
+class Base:
+    # Placeholder variables
+    order = 2
+    ufunc_mode = "jit-calculate"
+    n = -1
+
+    def setup_method(self):
+        self.GF = galois.GF(self.order, compile=self.ufunc_mode)
+
+        np.random.seed(123456789)
+        self.A = self.GF.Random((self.n, self.n))
+        while np.linalg.matrix_rank(self.A) < self.n:
+            self.A = self.GF.Random((self.n, self.n))
+        self.b = self.GF.Random(self.n)
+
+    def test_matmul(self, benchmark):
+        benchmark(np.matmul, self.A, self.A)
+
+    def test_row_reduce(self, benchmark):
+        benchmark(self.A.row_reduce)
+
+    def test_lu_decompose(self, benchmark):
+        benchmark(self.A.plu_decompose)
+
+    def test_matrix_rank(self, benchmark):
+        benchmark(np.linalg.matrix_rank, self.A)
+
+    def test_inv(self, benchmark):
+        benchmark(np.linalg.inv, self.A)
+
+    def test_det(self, benchmark):
+        benchmark(np.linalg.det, self.A)
+
+    def test_solve(self, benchmark):
+        benchmark(np.linalg.solve, self.A, self.b)
+
+    def test_lu_factor_solve(self, benchmark):
+        LU = self.GF.lu_factor(self.A)
+        benchmark(LU.solve, self.b)
+
+    def test_characteristic_poly(self, benchmark):
+        benchmark(self.A.characteristic_poly)
+
+
+@pytest.mark.benchmark(group="GF(2) Linear Algebra: n=1024")
+class Test_GF2(Base):
+    order = 2
+    ufunc_mode = "jit-calculate"
+    n = 1024
+
+
+@pytest.mark.benchmark(group="GF(2^8) Linear Algebra: n=512, ufunc_mode='jit-lookup'")
+class Test_GF2_8_lookup(Base):
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    n = 512
+
+
+@pytest.mark.benchmark(group="GF(2^8) Linear Algebra: n=128, ufunc_mode='jit-calculate'")
+class Test_GF2_8_calculate(Base):
+    order = 2**8
+    ufunc_mode = "jit-calculate"
+    n = 128
+
+
+@pytest.mark.benchmark(group="GF(31) Linear Algebra: n=512, ufunc_mode='jit-lookup'")
+class Test_GF31_lookup(Base):
+    order = 31
+    ufunc_mode = "jit-lookup"
+    n = 512
+
+
+@pytest.mark.benchmark(group="GF(2^31 - 1) Linear Algebra: n=256, ufunc_mode='jit-calculate'")
+class Test_GF2_31_1_calculate(Base):
+    order = 2**31 - 1
+    ufunc_mode = "jit-calculate"
+    n = 256
+
+
+@pytest.mark.benchmark(group="GF(3^5) Linear Algebra: n=256, ufunc_mode='jit-lookup'")
+class Test_GF3_5_lookup(Base):
+    order = 3**5
+    ufunc_mode = "jit-lookup"
+    n = 256
+
+
+@pytest.mark.benchmark(group="GF(2^8) Batched Linear Algebra: 10,000 x (8, 8), ufunc_mode='jit-lookup'")
+class Test_GF2_8_batched:
+    def setup_method(self):
+        self.GF = galois.GF(2**8, compile="jit-lookup")
+
+        np.random.seed(123456789)
+        self.A = self.GF.Random((10_000, 8, 8))
+        while np.any(np.linalg.matrix_rank(self.A) < 8):
+            idxs = np.linalg.matrix_rank(self.A) < 8
+            self.A[idxs] = self.GF.Random((np.count_nonzero(idxs), 8, 8))
+        self.b = self.GF.Random((10_000, 8))
+
+    def test_matrix_rank(self, benchmark):
+        benchmark(np.linalg.matrix_rank, self.A)
+
+    def test_inv(self, benchmark):
+        benchmark(np.linalg.inv, self.A)
+
+    def test_det(self, benchmark):
+        benchmark(np.linalg.det, self.A)
+
+    def test_solve(self, benchmark):
+        benchmark(np.linalg.solve, self.A, self.b)
+
+
+@pytest.mark.benchmark(group="GF(2^8) RLNC Decoding: n=64, payload_size=1024, ufunc_mode='jit-lookup'")
+class Test_GF2_8_incremental:
+    n = 64
+    payload_size = 1024
+
+    def setup_method(self):
+        self.GF = galois.GF(2**8, compile="jit-lookup")
+
+        np.random.seed(123456789)
+        symbols = self.GF.Random((self.n, self.payload_size))
+        self.coefficients = self.GF.Random((self.n + 4, self.n))
+        self.payloads = self.coefficients @ symbols
+
+    def decode_incremental(self):
+        decoder = galois.IncrementalEliminator(self.GF, self.n, payload_size=self.payload_size)
+        for c, y in zip(self.coefficients, self.payloads):
+            decoder.add(c, y)
+            if decoder.is_complete:
+                break
+        return decoder
+
+    def decode_row_reduce(self):
+        # Reduce the received packets again after each new packet arrives
+        A = np.concatenate((self.coefficients, self.payloads), axis=-1)
+        I = self.GF.Identity(self.n)
+        for i in range(1, A.shape[0] + 1):
+            A_rre = A[:i].row_reduce(ncols=self.n)
+            if i >= self.n and np.array_equal(A_rre[:self.n,:self.n], I):
+                break
+        return A_rre
+
+    def test_incremental(self, benchmark):
+        benchmark(self.decode_incremental)
+
+    def test_row_reduce(self, benchmark):
+        benchmark(self.decode_row_reduce)
@@ -0,0 +1,67 @@
+"""
+A pytest module to benchmark sparse matrices over Galois fields.
+"""
+import pytest
+import numpy as np
+
+import galois
+
+
+class Base:
+    # Placeholder variables
+    order = 2
+    ufunc_mode = "jit-calculate"
+    n = -1
+    n_core = -1
+    row_weight = 3
+
+    def setup_method(self):
+        self.GF = galois.GF(self.order, compile=self.ufunc_mode)
+        rng = np.random.default_rng(123456789)
+
+        # A large matrix with a few non-zeros per row
+        self.A = galois.SparseMatrix.Random(self.GF, (self.n, self.n), self.row_weight, seed=rng)
+        self.x = self.GF.Random(self.n, seed=rng)
+
+        # A permuted triangular matrix that structured elimination solves entirely
+        R = self.A
+        rows = np.repeat(np.arange(self.n), self.row_weight)
+        upper = R.indices > rows
+        rows = np.concatenate((rows[upper], np.arange(self.n)))
+        cols = np.concatenate((R.indices[upper], np.arange(self.n)))
+        data = np.concatenate((R.data[upper], self.GF.Random(self.n, low=1, seed=rng)))
+        self.A_peel = galois.SparseMatrix.COO(data, rng.permutation(self.n)[rows], rng.permutation(self.n)[cols], (self.n, self.n))
+        self.b_peel = self.A_peel @ self.x
+
+        # A smaller matrix without structure, which is solved with the Wiedemann algorithm
+        d = self.n_core
+        R = galois.SparseMatrix.Random(self.GF, (d, d), 2*(self.row_weight // 2), seed=rng)
+        rows = np.concatenate((np.repeat(np.arange(d), 2*(self.row_weight // 2)), np.arange(d)))
+        cols = np.concatenate((R.indices, np.arange(d)))
+        self.A_core = galois.SparseMatrix.COO(np.concatenate((R.data, self.GF.Random(d, low=1, seed=rng))), rows, cols, (d, d))
+        self.b_core = self.A_core @ self.x[:d]
+
+    def test_matvec(self, benchmark):
+        benchmark(self.A.__matmul__, self.x)
+
+    def test_solve_structured_elimination(self, benchmark):
+        benchmark(self.A_peel.solve, self.b_peel)
+
+    def test_solve_wiedemann(self, benchmark):
+        benchmark.pedantic(self.A_core.solve, args=(self.b_core,), kwargs={"seed": 1}, rounds=1)
+
+
+@pytest.mark.benchmark(group="GF(2^8) Sparse Matrices: n=1,000,000, row_weight=3, ufunc_mode='jit-lookup'")
+class Test_GF2_8_lookup(Base):
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    n = 1_000_000
+    n_core = 2_000
+
+
+@pytest.mark.benchmark(group="GF(2^31 - 1) Sparse Matrices: n=1,000,000, row_weight=3, ufunc_mode='jit-calculate'")
+class Test_GF2_31_1_calculate(Base):
+    order = 2**31 - 1
+    ufunc_mode = "jit-calculate"
+    n = 1_000_000
+    n_core = 2_000
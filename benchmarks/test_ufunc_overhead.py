@@ -0,0 +1,78 @@
+"""
+A pytest module to benchmark the per-call overhead of Galois field array ufuncs. Each operation is compared against calling
+the field's compiled ufunc directly on np.ndarray inputs, which is the cost of the arithmetic alone.
+"""
+import pytest
+import numpy as np
+
+import galois
+
+
+class Base:
+    # Placeholder variables
+    order = 2
+    ufunc_mode = "jit-calculate"
+    shape = ()
+
+    def setup_method(self):
+        self.GF = galois.GF(self.order, compile=self.ufunc_mode)
+
+        np.random.seed(123456789)
+        self.x = self.GF.Random(self.shape)
+        self.y = self.GF.Random(self.shape, low=1)
+        self.x_ndarray = self.x.view(np.ndarray)
+        self.y_ndarray = self.y.view(np.ndarray)
+
+    def test_add(self, benchmark):
+        benchmark(np.add, self.x, self.y)
+
+    def test_add_ufunc_only(self, benchmark):
+        benchmark(self.GF._ufunc("add"), self.x_ndarray, self.y_ndarray)
+
+    def test_multiply(self, benchmark):
+        benchmark(np.multiply, self.x, self.y)
+
+    def test_multiply_ufunc_only(self, benchmark):
+        benchmark(self.GF._ufunc("multiply"), self.x_ndarray, self.y_ndarray)
+
+
+@pytest.mark.benchmark(group="GF(2^8) Ufunc Overhead: shape=(), ufunc_mode='jit-lookup'")
+class Test_GF2_8_scalar(Base):
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    shape = ()
+
+
+@pytest.mark.benchmark(group="GF(2^8) Ufunc Overhead: shape=(16,), ufunc_mode='jit-lookup'")
+class Test_GF2_8_small(Base):
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    shape = (16,)
+
+
+@pytest.mark.benchmark(group="GF(2^8) Ufunc Overhead: shape=(100_000,), ufunc_mode='jit-lookup'")
+class Test_GF2_8_large(Base):
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    shape = (100_000,)
+
+
+@pytest.mark.benchmark(group="GF(31) Ufunc Overhead: shape=(), ufunc_mode='jit-lookup'")
+class Test_GF31_scalar(Base):
+    order = 31
+    ufunc_mode = "jit-lookup"
+    shape = ()
+
+
+@pytest.mark.benchmark(group="GF(31) Ufunc Overhead: shape=(16,), ufunc_mode='jit-lookup'")
+class Test_GF31_small(Base):
+    order = 31
+    ufunc_mode = "jit-lookup"
+    shape = (16,)
+
+
+@pytest.mark.benchmark(group="GF(31) Ufunc Overhead: shape=(100_000,), ufunc_mode='jit-lookup'")
+class Test_GF31_large(Base):
+    order = 31
+    ufunc_mode = "jit-lookup"
+    shape = (100_000,)
@@ -2,17 +2,52 @@
 A performant NumPy extension for Galois fields and their applications.
 """
 # pylint: disable=redefined-builtin
+import importlib
 
 from ._version import __version__
 
-# Subpackages
-from ._codes import *
-from ._fields import *
-
-# Modules
-from ._lfsr import *
+# Modules that only depend on NumPy are imported eagerly
 from ._math import *
 from ._modular import *
-from ._ntt import *
-from ._polymorphic import *
 from ._prime import *
+
+# The public names of the subpackages and modules that depend on Numba. They are imported on first access, using PEP 562, so
+# `import galois` doesn't import Numba or create the Galois field classes.
+_LAZY_SUBMODULES = {
+    "_codes": [
+        "BCH", "bch_valid_codes", "poly_to_generator_matrix", "roots_to_parity_check_matrix", "generator_to_parity_check_matrix",
+        "parity_check_to_generator_matrix", "ReedSolomon",
+    ],
+    "_fields": [
+        "GF", "Field", "irreducible_poly", "irreducible_polys", "is_irreducible", "primitive_poly", "primitive_polys", "is_primitive",
+        "matlab_primitive_poly", "conway_poly", "primitive_element", "primitive_elements", "is_primitive_element", "FieldClass",
+        "FieldArray", "GF2", "Poly", "GF2Packed", "LUFactorization", "IncrementalEliminator", "lagrange_poly",
+        "square_free_factorization", "distinct_degree_factorization", "equal_degree_factorization", "is_monic",
+    ],
+    "_lfsr": ["LFSR", "berlekamp_massey"],
+    "_ntt": ["ntt", "intt"],
+    "_sparse": ["SparseMatrix"],
+    "_polymorphic": ["gcd", "egcd", "lcm", "prod", "are_coprime", "pow", "crt", "factors", "is_square_free"],
+}
+_LAZY_NAMES = {name: module for module, names in _LAZY_SUBMODULES.items() for name in names}
+
+__all__ = [name for name in globals() if not name.startswith("_") and name != "importlib"] + list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(f".{_LAZY_NAMES[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    if name.startswith("_") and not name.startswith("__"):
+        # Private submodules, like `galois._fields`, that haven't been imported yet
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
@@ -7,7 +7,8 @@ from numba import int64
 import numpy as np
 
 from .. import _lfsr
-from .._fields import Field, FieldClass, FieldArray, GF2, Poly, matlab_primitive_poly
+from .._fields import Field, FieldClass, FieldArray, GF2, GF2Packed, Poly, matlab_primitive_poly
+from .._fields._packbits import pack, unpack, matmul_parity
 from .._overrides import set_module
 from .._prime import factors
 
@@ -238,6 +239,20 @@ class BCH:
         self._G = poly_to_generator_matrix(n, self.generator_poly, systematic)
         self._H = roots_to_parity_check_matrix(n, self.roots)
 
+        # The parity-check matrix over GF(2^m) expanded into its m bit planes, with shape (2t*m, n). Row `j*m + b` is bit `b`
+        # of row `j` of H. The GF(2^m) syndrome of a binary codeword is the XOR of the columns of H where the codeword is 1,
+        # so it is computed bit by bit with a GF(2) matrix multiplication on packed bits.
+        m = GF.degree
+        H = self.H.view(np.ndarray).astype(np.int64)
+        self._H_bits = ((H[:, np.newaxis, :] >> np.arange(m)[np.newaxis, :, np.newaxis]) & 1).reshape(-1, n).astype(np.uint8)
+
+        # The transposed generator matrix (only its parity columns for systematic codes) and the parity-check bits, packed for
+        # matmul_parity(). They're keyed by the message and codeword lengths, and the shortened codes are packed on first use.
+        self._G_words = {}
+        self._H_words = {}
+        self._generator_words(k)
+        self._parity_check_words(n)
+
         self._is_primitive = True
         self._is_narrow_sense = True
 
@@ -262,23 +277,23 @@ class BCH:
     def __repr__(self):
         return str(self)
 
-    def encode(self, message: Union[np.ndarray, GF2], parity_only: bool = False) -> Union[np.ndarray, GF2]:
+    def encode(self, message: Union[np.ndarray, GF2, GF2Packed], parity_only: bool = False) -> Union[np.ndarray, GF2, GF2Packed]:
         r"""
         Encodes the message :math:`\mathbf{m}` into the BCH codeword :math:`\mathbf{c}`.
 
         Parameters
         ----------
-        message : numpy.ndarray, galois.GF2
+        message : numpy.ndarray, galois.GF2, galois.GF2Packed
             The message as either a :math:`k`-length vector or :math:`(N, k)` matrix, where :math:`N` is the number
             of messages. For systematic codes, message lengths less than :math:`k` may be provided to produce
-            shortened codewords.
+            shortened codewords. Bit-packed messages are encoded without unpacking them.
         parity_only : bool, optional
             Optionally specify whether to return only the parity bits. This only applies to systematic codes.
             The default is `False`.
 
         Returns
         -------
-        numpy.ndarray, galois.GF2
+        numpy.ndarray, galois.GF2, galois.GF2Packed
             The codeword as either a :math:`n`-length vector or :math:`(N, n)` matrix. The return type matches the
             message type. If `parity_only=True`, the parity bits are returned as either a :math:`n - k`-length vector or
             :math:`(N, n-k)` matrix.
@@ -325,8 +340,8 @@ class BCH:
             c = bch.encode(m); c
             p = bch.encode(m, parity_only=True); p
         """
-        if not isinstance(message, (np.ndarray, GF2)):
-            raise TypeError(f"Argument `message` must be a subclass of np.ndarray (or a galois.GF2 array), not {type(message)}.")
+        if not isinstance(message, (np.ndarray, GF2Packed)):
+            raise TypeError(f"Argument `message` must be a subclass of np.ndarray (or a galois.GF2 or galois.GF2Packed array), not {type(message)}.")
         if parity_only and not self.systematic:
             raise ValueError("Argument `parity_only=True` only applies to systematic codes.")
         if self.systematic:
@@ -338,17 +353,25 @@ class BCH:
 
         ks = message.shape[-1]  # The number of input message bits (could be less than self.k for shortened codes)
 
-        if parity_only:
-            parity = message.view(GF2) @ self.G[-ks:, self.k:]
-            return parity.view(type(message))
-        elif self.systematic:
-            parity = message.view(GF2) @ self.G[-ks:, self.k:]
-            return np.hstack((message, parity)).view(type(message))
+        # Multiply the bit-packed messages by the generator matrix. For systematic codes only the parity bits are computed.
+        packed = isinstance(message, GF2Packed)
+        words = message.words if packed else pack(message.view(GF2).view(np.ndarray))
+        G_words = self._generator_words(ks)
+        bits = matmul_parity(words, G_words).reshape(message.shape[:-1] + (G_words.shape[0],))
+
+        if packed:
+            if not parity_only and self.systematic:
+                bits = np.concatenate((unpack(message.words, ks), bits), axis=-1)
+            return GF2Packed(GF2._view(bits))
+
+        bits = bits.astype(message.dtype)
+        bits = GF2._view(bits) if type(message) is GF2 else bits.view(type(message))
+        if parity_only or not self.systematic:
+            return bits
         else:
-            codeword = message.view(GF2) @ self.G
-            return codeword.view(type(message))
+            return np.concatenate((message, bits), axis=-1)
 
-    def detect(self, codeword: Union[np.ndarray, GF2]) -> Union[bool, np.ndarray]:
+    def detect(self, codeword: Union[np.ndarray, GF2, GF2Packed]) -> Union[bool, np.ndarray]:
         r"""
         Detects if errors are present in the BCH codeword :math:`\mathbf{c}`.
 
@@ -357,10 +380,10 @@ class BCH:
 
         Parameters
         ----------
-        codeword : numpy.ndarray, galois.GF2
+        codeword : numpy.ndarray, galois.GF2, galois.GF2Packed
             The codeword as either a :math:`n`-length vector or :math:`(N, n)` matrix, where :math:`N` is the
             number of codewords. For systematic codes, codeword lengths less than :math:`n` may be provided for
-            shortened codewords.
+            shortened codewords. Bit-packed codewords are checked without unpacking them.
 
         Returns
         -------
@@ -388,8 +411,8 @@ class BCH:
             c[0:bch.d - 1] ^= 1
             bch.detect(c)
         """
-        if not isinstance(codeword, np.ndarray):
-            raise TypeError(f"Argument `codeword` must be a subclass of np.ndarray (or a galois.GF2 array), not {type(codeword)}.")
+        if not isinstance(codeword, (np.ndarray, GF2Packed)):
+            raise TypeError(f"Argument `codeword` must be a subclass of np.ndarray (or a galois.GF2 or galois.GF2Packed array), not {type(codeword)}.")
         if self.systematic:
             if not codeword.shape[-1] <= self.n:
                 raise ValueError(f"For a systematic code, argument `codeword` must be a 1-D or 2-D array with last dimension less than or equal to {self.n}, not shape {codeword.shape}.")
@@ -398,15 +421,11 @@ class BCH:
                 raise ValueError(f"For a non-systematic code, argument `codeword` must be a 1-D or 2-D array with last dimension equal to {self.n}, not shape {codeword.shape}.")
 
         codeword_1d = codeword.ndim == 1
-        ns = codeword.shape[-1]  # The number of input codeword bits (could be less than self.n for shortened codes)
-
-        # Make codeword 2-D for array processing
-        codeword = np.atleast_2d(codeword)
 
-        # Compute the syndrome by matrix multiplying with the parity-check matrix
-        syndrome = codeword.view(self.field) @ self.H[:,-ns:].T
+        # Compute the bits of the syndrome by matrix multiplying with the parity-check matrix
+        syndrome_bits = self._syndrome_bits(codeword)
 
-        detected = ~np.all(syndrome == 0, axis=1)
+        detected = np.any(syndrome_bits, axis=1)
 
         if codeword_1d:
             detected = detected[0]
@@ -414,10 +433,10 @@ class BCH:
         return detected
 
     @overload
-    def decode(self, codeword: Union[np.ndarray, GF2], errors: Literal[False] = False) -> Union[np.ndarray, GF2]:
+    def decode(self, codeword: Union[np.ndarray, GF2, GF2Packed], errors: Literal[False] = False) -> Union[np.ndarray, GF2, GF2Packed]:
         ...
     @overload
-    def decode(self, codeword: Union[np.ndarray, GF2], errors: Literal[True] = True) -> Tuple[Union[np.ndarray, GF2], Union[np.integer, np.ndarray]]:
+    def decode(self, codeword: Union[np.ndarray, GF2, GF2Packed], errors: Literal[True] = True) -> Tuple[Union[np.ndarray, GF2, GF2Packed], Union[np.integer, np.ndarray]]:
         ...
     def decode(self, codeword, errors=False):
         r"""
@@ -425,7 +444,7 @@ class BCH:
 
         Parameters
         ----------
-        codeword : numpy.ndarray, galois.GF2
+        codeword : numpy.ndarray, galois.GF2, galois.GF2Packed
             The codeword as either a :math:`n`-length vector or :math:`(N, n)` matrix, where :math:`N` is the
             number of codewords. For systematic codes, codeword lengths less than :math:`n` may be provided for
             shortened codewords.
@@ -434,7 +453,7 @@ class BCH:
 
         Returns
         -------
-        numpy.ndarray, galois.GF2
+        numpy.ndarray, galois.GF2, galois.GF2Packed
             The decoded message as either a :math:`k`-length vector or :math:`(N, k)` matrix.
         numpy.integer, numpy.ndarray
             Optional return argument of the number of corrected bit errors as either a scalar or :math:`n`-length vector.
@@ -500,8 +519,8 @@ class BCH:
             dec_m, N = bch.decode(c, errors=True); dec_m, N
             np.array_equal(dec_m, m)
         """
-        if not isinstance(codeword, (np.ndarray, GF2)):
-            raise TypeError(f"Argument `codeword` must be a subclass of np.ndarray (or a galois.GF2 array), not {type(codeword)}.")
+        if not isinstance(codeword, (np.ndarray, GF2Packed)):
+            raise TypeError(f"Argument `codeword` must be a subclass of np.ndarray (or a galois.GF2 or galois.GF2Packed array), not {type(codeword)}.")
         if self.systematic:
             if not codeword.shape[-1] <= self.n:
                 raise ValueError(f"For a systematic code, argument `codeword` must be a 1-D or 2-D array with last dimension less than or equal to {self.n}, not shape {codeword.shape}.")
@@ -510,16 +529,21 @@ class BCH:
                 raise ValueError(f"For a non-systematic code, argument `codeword` must be a 1-D or 2-D array with last dimension equal to {self.n}, not shape {codeword.shape}.")
 
         codeword_1d = codeword.ndim == 1
-        dtype = codeword.dtype
         ns = codeword.shape[-1]  # The number of input codeword bits (could be less than self.n for shortened codes)
         ks = self.k - (self.n - ns)  # The equivalent number of input message bits (could be less than self.k for shortened codes)
 
+        # Compute the syndrome by matrix multiplying with the parity-check matrix
+        syndrome = self._syndrome(codeword)
+
+        # The decoder operates on unpacked bits
+        packed = isinstance(codeword, GF2Packed)
+        if packed:
+            codeword = codeword.unpack()
+        dtype = codeword.dtype
+
         # Make codeword 2-D for array processing
         codeword = np.atleast_2d(codeword)
 
-        # Compute the syndrome by matrix multiplying with the parity-check matrix
-        syndrome = codeword.view(self.field) @ self.H[:,-ns:].T
-
         if self.field.ufunc_mode != "python-calculate":
             dec_codeword =  self._decode_jit(codeword.astype(np.int64), syndrome.astype(np.int64), self.t, int(self.field.primitive_element), self._add_jit, self._subtract_jit, self._multiply_jit, self._reciprocal_jit, self._power_jit, self._berlekamp_massey_jit, self._poly_roots_jit, self.field.characteristic, self.field.degree, self.field._irreducible_poly_int)
             N_errors = dec_codeword[:, -1]
@@ -527,8 +551,12 @@ class BCH:
             if self.systematic:
                 message = dec_codeword[:, 0:ks]
             else:
-                message, _ = GF2._poly_divmod(dec_codeword[:, 0:self.n].view(GF2), self.generator_poly.coeffs)
-            message = message.astype(dtype).view(type(codeword))
+                message, _ = GF2._poly_divmod(GF2._view(dec_codeword[:, 0:self.n]), self.generator_poly.coeffs)
+            message = message.astype(dtype)
+            # The decoded message bits are field elements, so they don't need to be reverified when returned as GF(2) arrays
+            message = GF2._view(message) if type(codeword) is GF2 else message.view(type(codeword))
+            if packed:
+                message = GF2Packed(message)
 
         else:
             raise NotImplementedError("BCH codes haven't been implemented for extremely large Galois fields.")
@@ -541,6 +569,46 @@ class BCH:
         else:
             return message, N_errors
 
+    def _syndrome_bits(self, codeword):
+        """
+        Computes the bits of the GF(2^m) syndromes of the binary codewords, with shape (N, 2t*m). Unpacked codewords are packed
+        first, and the syndromes are computed from the packed bits.
+        """
+        ns = codeword.shape[-1]
+        if isinstance(codeword, GF2Packed):
+            words = codeword.words
+        else:
+            words = pack(np.atleast_2d(codeword.view(GF2)).view(np.ndarray))
+
+        return matmul_parity(words, self._parity_check_words(ns))
+
+    def _generator_words(self, ks):
+        """
+        Returns the packed transpose of the generator matrix for messages with `ks` bits. For systematic codes only the parity
+        columns are included.
+        """
+        if ks not in self._G_words:
+            G = self.G[-ks:, self.k:] if self.systematic else self.G
+            self._G_words[ks] = pack(G.T.view(np.ndarray))
+        return self._G_words[ks]
+
+    def _parity_check_words(self, ns):
+        """
+        Returns the packed parity-check bits for codewords with `ns` bits.
+        """
+        if ns not in self._H_words:
+            self._H_words[ns] = pack(self._H_bits[:, -ns:])
+        return self._H_words[ns]
+
+    def _syndrome(self, codeword):
+        """
+        Computes the GF(2^m) syndromes of the binary codewords, with shape (N, 2t).
+        """
+        m = self.field.degree
+        syndrome_bits = self._syndrome_bits(codeword)
+        syndrome = syndrome_bits.reshape(-1, 2*self.t, m).astype(np.int64) @ (1 << np.arange(m, dtype=np.int64))
+        return self.field._view(syndrome.astype(self.field.dtypes[-1]))
+
     @property
     def field(self) -> FieldClass:
         r"""
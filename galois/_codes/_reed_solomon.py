@@ -5,7 +5,6 @@ import numba
 from numba import int64
 import numpy as np
 
-from .. import _lfsr
 from .._fields import Field, FieldClass, FieldArray, Poly, matlab_primitive_poly
 from .._overrides import set_module
 from .._prime import factors
@@ -148,15 +147,11 @@ class ReedSolomon:
         self._reciprocal_jit = self.field._func_calculate("reciprocal")
         self._power_jit = self.field._func_calculate("power")
 
-        # Pre-compile the JIT functions
-        self._berlekamp_massey_jit = _lfsr.jit_calculate("berlekamp_massey")
-        self._poly_divmod_jit = self.field._function("poly_divmod")
-        self._poly_roots_jit = self.field._function("poly_roots")
-        self._poly_eval_jit = self.field._function("poly_evaluate")
-        self._convolve_jit = self.field._function("convolve")
-
         # Pre-compile the JIT decoder
-        self._decode_jit = numba.jit(DECODE_CALCULATE_SIG.signature, nopython=True, cache=True)(decode_calculate)
+        if self.field.ufunc_mode == "jit-lookup":
+            _decode_jit("lookup", "cpu", numba.typeof(self.field._EXP))
+        else:
+            _decode_jit("calculate", "cpu")
 
     def __str__(self):
         return f"<Reed-Solomon Code: [{self.n}, {self.k}, {self.d}] over {self.field.name}>"
@@ -427,14 +422,20 @@ class ReedSolomon:
         syndrome = codeword.view(self.field) @ self.H[:,-ns:].T
 
         if self.field.ufunc_mode != "python-calculate":
-            dec_codeword =  self._decode_jit(codeword.astype(np.int64), syndrome.astype(np.int64), self.c, self.t, int(self.field.primitive_element), self._add_jit, self._subtract_jit, self._multiply_jit, self._reciprocal_jit, self._power_jit, self._berlekamp_massey_jit, self._poly_roots_jit, self._poly_eval_jit, self._convolve_jit, self.field.characteristic, self.field.degree, self.field._irreducible_poly_int)
+            target = self.field._target(codeword.size * self.t)
+            if self.field.ufunc_mode == "jit-lookup":
+                dec_codeword = _decode_jit("lookup", target, numba.typeof(self.field._EXP))(codeword.astype(np.int64), syndrome.astype(np.int64), self.c, self.t, int(self.field.primitive_element), self.field._EXP, self.field._LOG, self.field._ZECH_LOG, self.field._ZECH_E, self.field.characteristic)
+            else:
+                dec_codeword = _decode_jit("calculate", target)(codeword.astype(np.int64), syndrome.astype(np.int64), self.c, self.t, int(self.field.primitive_element), self._add_jit, self._subtract_jit, self._multiply_jit, self._reciprocal_jit, self._power_jit, self.field.characteristic, self.field.degree, self.field._irreducible_poly_int)
             N_errors = dec_codeword[:, -1]
 
             if self.systematic:
                 message = dec_codeword[:, 0:ks]
             else:
-                message, _ = self.field._poly_divmod(dec_codeword[:, 0:self.n].view(self.field), self.generator_poly.coeffs)
-            message = message.astype(dtype).view(type(codeword))
+                message, _ = self.field._poly_divmod(self.field._view(dec_codeword[:, 0:self.n]), self.generator_poly.coeffs)
+            message = message.astype(dtype)
+            # The decoded message symbols are field elements, so they don't need to be reverified when returned as field arrays
+            message = self.field._view(message) if type(codeword) is self.field else message.view(type(codeword))
 
         else:
             raise NotImplementedError("Reed-Solomon codes haven't been implemented for extremely large Galois fields.")
@@ -630,81 +631,202 @@ class ReedSolomon:
 # JIT-compiled implementation of the specified functions
 ###############################################################################
 
-DECODE_CALCULATE_SIG = numba.types.FunctionType(int64[:,:](int64[:,:], int64[:,:], int64, int64, int64, FieldClass._BINARY_CALCULATE_SIG, FieldClass._BINARY_CALCULATE_SIG, FieldClass._BINARY_CALCULATE_SIG, FieldClass._UNARY_CALCULATE_SIG, FieldClass._BINARY_CALCULATE_SIG, _lfsr.BERLEKAMP_MASSEY_CALCULATE_SIG, FieldClass._POLY_ROOTS_CALCULATE_SIG, FieldClass._POLY_EVALUATE_CALCULATE_SIG, FieldClass._CONVOLVE_CALCULATE_SIG, int64, int64, int64))
+_DECODE_JIT_CACHE = {}
 
-def decode_calculate(codeword, syndrome, c, t, primitive_element, ADD, SUBTRACT, MULTIPLY, RECIPROCAL, POWER, BERLEKAMP_MASSEY, POLY_ROOTS, POLY_EVAL, CONVOLVE, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):  # pragma: no cover
+
+def _decode_jit(name, target, table=None):
     """
-    References
-    ----------
-    * S. Lin and D. Costello. Error Control Coding. Section 7.4.
+    Returns the JIT-compiled batch decoder `decode_calculate` or `decode_lookup` for the target, which is either "cpu" or "parallel".
+    The "parallel" decoder distributes the codewords across threads. The lookup decoder is compiled for the Numba array type `table`
+    of the field's lookup tables.
+    """
+    key = (name, target, table)
+    if key not in _DECODE_JIT_CACHE:
+        sig = DECODE_CALCULATE_SIG.signature if name == "calculate" else _decode_lookup_sig(table)
+        function = decode_calculate if name == "calculate" else decode_lookup
+        _DECODE_JIT_CACHE[key] = numba.jit(sig, nopython=True, parallel=target == "parallel", cache=True)(function)
+    return _DECODE_JIT_CACHE[key]
+
+
+DECODE_CALCULATE_SIG = numba.types.FunctionType(int64[:,:](int64[:,:], int64[:,:], int64, int64, int64, FieldClass._BINARY_CALCULATE_SIG, FieldClass._BINARY_CALCULATE_SIG, FieldClass._BINARY_CALCULATE_SIG, FieldClass._UNARY_CALCULATE_SIG, FieldClass._BINARY_CALCULATE_SIG, int64, int64, int64))
+
+def decode_calculate(codeword, syndrome, c, t, primitive_element, ADD, SUBTRACT, MULTIPLY, RECIPROCAL, POWER, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):  # pragma: no cover
+    """
+    Decodes the batch of codewords, one per row, using explicit calculation arithmetic. The codewords are decoded in parallel when
+    the function is compiled with `parallel=True`.
     """
     args = CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY
-    dtype = codeword.dtype
+    dec_codeword, C, B, T, error_locations, alpha_inv_powers = _decode_buffers(codeword, t, primitive_element, MULTIPLY, RECIPROCAL, args)
+
+    for i in numba.prange(codeword.shape[0]):
+        _decode_codeword(i, syndrome, c, t, CHARACTERISTIC, dec_codeword, C, B, T, error_locations, alpha_inv_powers, ADD, SUBTRACT, MULTIPLY, RECIPROCAL, POWER, args)
+
+    return dec_codeword
+
+
+def _decode_lookup_sig(table):
+    """
+    Returns the signature of `decode_lookup` for lookup tables of the Numba array type `table`, whose dtype depends on the field order.
+    """
+    return int64[:,:](int64[:,:], int64[:,:], int64, int64, int64, table, table, table, int64, int64)
+
+
+# The lookup table arithmetic functions are passed to the decoder as JIT-able functions, not function pointers, so Numba
+# inlines the table lookups into the decoder
+_ADD_LOOKUP = FieldClass._add_lookup
+_SUBTRACT_LOOKUP = FieldClass._subtract_lookup
+_MULTIPLY_LOOKUP = FieldClass._multiply_lookup
+_RECIPROCAL_LOOKUP = FieldClass._reciprocal_lookup
+_POWER_LOOKUP = FieldClass._power_lookup
 
+def decode_lookup(codeword, syndrome, c, t, primitive_element, EXP, LOG, ZECH_LOG, ZECH_E, CHARACTERISTIC):  # pragma: no cover
+    """
+    Decodes the batch of codewords, one per row, using lookup table arithmetic. The codewords are decoded in parallel when
+    the function is compiled with `parallel=True`.
+    """
+    args = EXP, LOG, ZECH_LOG, ZECH_E
+    dec_codeword, C, B, T, error_locations, alpha_inv_powers = _decode_buffers(codeword, t, primitive_element, _MULTIPLY_LOOKUP, _RECIPROCAL_LOOKUP, args)
+
+    for i in numba.prange(codeword.shape[0]):
+        _decode_codeword(i, syndrome, c, t, CHARACTERISTIC, dec_codeword, C, B, T, error_locations, alpha_inv_powers, _ADD_LOOKUP, _SUBTRACT_LOOKUP, _MULTIPLY_LOOKUP, _RECIPROCAL_LOOKUP, _POWER_LOOKUP, args)
+
+    return dec_codeword
+
+
+@numba.extending.register_jitable
+def _decode_buffers(codeword, t, primitive_element, MULTIPLY, RECIPROCAL, args):  # pragma: no cover
+    """
+    Allocates the decoded codewords and the work buffers for every codeword in the batch. The polynomials are stored with
+    lowest-degree coefficients first.
+    """
+    dtype = codeword.dtype
     N = codeword.shape[0]  # The number of codewords
     n = codeword.shape[1]  # The codeword size (could be less than the design n for shortened codes)
-    design_n = CHARACTERISTIC**DEGREE - 1  # The designed codeword size
 
     # The last column of the returned decoded codeword is the number of corrected errors
     dec_codeword = np.zeros((N, n + 1), dtype=dtype)
     dec_codeword[:, 0:n] = codeword[:,:]
 
-    for i in range(N):
-        if not np.all(syndrome[i,:] == 0):
-            # The syndrome vector is S = [S0, S1, ..., S2t-1]
-
-            # The error pattern is defined as the polynomial e(x) = e_j1*x^j1 + e_j2*x^j2 + ... for j1 to jv,
-            # implying there are v errors. And δi = e_ji is the i-th error value and βi = α^ji is the i-th error-locator
-            # value and ji is the error location.
-
-            # The error-locator polynomial σ(x) = (1 - β1*x)(1 - β2*x)...(1 - βv*x) where βi are the inverse of the roots
-            # of σ(x).
-
-            # Compute the error-locator polynomial σ(x)
-            sigma = BERLEKAMP_MASSEY(syndrome[i,:], ADD, SUBTRACT, MULTIPLY, RECIPROCAL, *args)
-            v = sigma.size - 1  # The number of errors, which is the degree of the error-locator polynomial
-
-            if v > t:
-                dec_codeword[i,-1] = -1
-                continue
-
-            # Compute βi^-1, the roots of σ(x)
-            degrees = np.arange(sigma.size - 1, -1, -1)
-            results = POLY_ROOTS(degrees, sigma, primitive_element, ADD, MULTIPLY, POWER, *args)
-            beta_inv = results[0,:]  # The roots βi^-1 of σ(x)
-            error_locations_inv = results[1,:]  # The roots βi^-1 as powers of the primitive element α
-            error_locations = -error_locations_inv % design_n  # The error locations as degrees of c(x)
-
-            if np.any(error_locations > n - 1):
-                # Indicates there are "errors" in the zero-ed portion of a shortened code, which indicates there are actually
-                # more errors than alleged. Return failure to decode.
-                dec_codeword[i,-1] = -1
-                continue
-
-            if beta_inv.size != v:
-                dec_codeword[i,-1] = -1
-                continue
-
-            # Compute σ'(x)
-            sigma_prime = np.zeros(v, dtype=dtype)
-            for j in range(v):
-                degree = v - j
-                sigma_prime[j] = MULTIPLY(degree % CHARACTERISTIC, sigma[j], *args)  # Scalar multiplication
-
-            # The error-value evaluator polynomial Z0(x) = S0*σ0 + (S1*σ0 + S0*σ1)*x + (S2*σ0 + S1*σ1 + S0*σ2)*x^2 + ...
-            # with degree v-1
-            Z0 = CONVOLVE(sigma[-v:], syndrome[i,0:v][::-1], ADD, MULTIPLY, *args)[-v:]
-
-            # The error value δi = -1 * βi^(1-c) * Z0(βi^-1) / σ'(βi^-1)
-            for j in range(v):
-                beta_i = POWER(beta_inv[j], c - 1, *args)
-                Z0_i = POLY_EVAL(Z0, np.array([beta_inv[j]], dtype=dtype), ADD, MULTIPLY, *args)[0]  # NOTE: poly_eval() expects a 1-D array of values
-                sigma_prime_i = POLY_EVAL(sigma_prime, np.array([beta_inv[j]], dtype=dtype), ADD, MULTIPLY, *args)[0]  # NOTE: poly_eval() expects a 1-D array of values
-                delta_i = MULTIPLY(beta_i, Z0_i, *args)
-                delta_i = MULTIPLY(delta_i, RECIPROCAL(sigma_prime_i, *args), *args)
-                delta_i = SUBTRACT(0, delta_i, *args)
-                dec_codeword[i, n - 1 - error_locations[j]] = SUBTRACT(dec_codeword[i, n - 1 - error_locations[j]], delta_i, *args)
-
-            dec_codeword[i,-1] = v  # The number of corrected errors
+    C = np.zeros((N, 2*t + 1), dtype=dtype)  # The error-locator polynomial σ(x)
+    B = np.zeros((N, 2*t + 1), dtype=dtype)  # The previous error-locator polynomial in Berlekamp-Massey
+    T = np.zeros((N, 2*t + 1), dtype=dtype)  # A temporary copy of σ(x)
+    error_locations = np.zeros((N, t), dtype=dtype)  # The error locations as degrees of c(x)
 
-    return dec_codeword
+    # The powers α^-j used to step the terms of σ(x) in the Chien search
+    alpha_inv = RECIPROCAL(primitive_element, *args)
+    alpha_inv_powers = np.ones(2*t + 1, dtype=dtype)
+    for j in range(1, 2*t + 1):
+        alpha_inv_powers[j] = MULTIPLY(alpha_inv_powers[j - 1], alpha_inv, *args)
+
+    return dec_codeword, C, B, T, error_locations, alpha_inv_powers
+
+
+@numba.extending.register_jitable
+def _decode_codeword(i, syndrome, c, t, characteristic, dec_codeword, C, B, T, error_locations, alpha_inv_powers, ADD, SUBTRACT, MULTIPLY, RECIPROCAL, POWER, args):  # pragma: no cover
+    """
+    Decodes the i-th codeword in place in `dec_codeword` using the Berlekamp-Massey algorithm, a Chien search, and the Forney
+    algorithm.
+
+    References
+    ----------
+    * S. Lin and D. Costello. Error Control Coding. Section 7.4.
+    """
+    n = dec_codeword.shape[1] - 1  # The codeword size (could be less than the design n for shortened codes)
+
+    zero_syndrome = True
+    for j in range(2*t):
+        if syndrome[i,j] != 0:
+            zero_syndrome = False
+            break
+    if zero_syndrome:
+        return
+
+    # The syndrome vector is S = [S0, S1, ..., S2t-1]
+
+    # The error pattern is defined as the polynomial e(x) = e_j1*x^j1 + e_j2*x^j2 + ... for j1 to jv,
+    # implying there are v errors. And δi = e_ji is the i-th error value and βi = α^ji is the i-th error-locator
+    # value and ji is the error location.
+
+    # The error-locator polynomial σ(x) = (1 - β1*x)(1 - β2*x)...(1 - βv*x) where βi are the inverse of the roots
+    # of σ(x).
+
+    # Compute the error-locator polynomial σ(x) with the Berlekamp-Massey algorithm
+    C[i,0] = 1
+    B[i,0] = 1
+    L = 0
+    m = 1
+    bb = 1
+    for k in range(2*t):
+        d = 0
+        for j in range(L + 1):
+            d = ADD(d, MULTIPLY(syndrome[i,k - j], C[i,j], *args), *args)
+
+        if d == 0:
+            m += 1
+        elif 2*L <= k:
+            T[i,:] = C[i,:]
+            d_bb = MULTIPLY(d, RECIPROCAL(bb, *args), *args)
+            for j in range(m, 2*t + 1):
+                C[i,j] = SUBTRACT(C[i,j], MULTIPLY(d_bb, B[i,j - m], *args), *args)
+            L = k + 1 - L
+            B[i,:] = T[i,:]
+            bb = d
+            m = 1
+        else:
+            d_bb = MULTIPLY(d, RECIPROCAL(bb, *args), *args)
+            for j in range(m, 2*t + 1):
+                C[i,j] = SUBTRACT(C[i,j], MULTIPLY(d_bb, B[i,j - m], *args), *args)
+            m += 1
+    v = L  # The number of errors, which is the degree of the error-locator polynomial
+
+    if v > t:
+        dec_codeword[i,-1] = -1
+        return
+
+    # Compute βi^-1, the roots of σ(x), with a Chien search over the error locations of the (possibly shortened)
+    # codeword. The j-th term of σ(α^-e) is stepped to the j-th term of σ(α^-(e+1)) by multiplying by α^-j. Roots
+    # outside the codeword indicate there are more errors than alleged, which is caught by the root count.
+    T[i,:] = C[i,:]
+    N_roots = 0
+    for e in range(n):
+        value = 0
+        for j in range(v + 1):
+            value = ADD(value, T[i,j], *args)
+            T[i,j] = MULTIPLY(T[i,j], alpha_inv_powers[j], *args)
+        if value == 0:
+            if N_roots == v:
+                N_roots += 1
+                break
+            error_locations[i,N_roots] = e
+            N_roots += 1
+
+    if N_roots != v:
+        dec_codeword[i,-1] = -1
+        return
+
+    # The error value δi = -1 * βi^(1-c) * Z0(βi^-1) / σ'(βi^-1), where σ'(x) is the formal derivative of σ(x) and
+    # Z0(x) = S0*σ0 + (S1*σ0 + S0*σ1)*x + (S2*σ0 + S1*σ1 + S0*σ2)*x^2 + ... is the error-value evaluator polynomial
+    # with degree v-1
+    for r in range(v):
+        x = POWER(alpha_inv_powers[1], error_locations[i,r], *args)  # βi^-1 = α^-e
+
+        Z0_i = 0
+        for k in range(v - 1, -1, -1):
+            Z0_k = 0
+            for j in range(k + 1):
+                Z0_k = ADD(Z0_k, MULTIPLY(C[i,j], syndrome[i,k - j], *args), *args)
+            Z0_i = ADD(MULTIPLY(Z0_i, x, *args), Z0_k, *args)
+
+        sigma_prime_i = 0
+        for j in range(v, 0, -1):
+            sigma_prime_j = MULTIPLY(j % characteristic, C[i,j], *args)  # Scalar multiplication
+            sigma_prime_i = ADD(MULTIPLY(sigma_prime_i, x, *args), sigma_prime_j, *args)
+
+        beta_i = POWER(x, c - 1, *args)
+        delta_i = MULTIPLY(beta_i, Z0_i, *args)
+        delta_i = MULTIPLY(delta_i, RECIPROCAL(sigma_prime_i, *args), *args)
+        delta_i = SUBTRACT(0, delta_i, *args)
+        idx = n - 1 - error_locations[i,r]
+        dec_codeword[i,idx] = SUBTRACT(dec_codeword[i,idx], delta_i, *args)
+
+    dec_codeword[i,-1] = v  # The number of corrected errors
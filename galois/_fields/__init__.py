@@ -3,4 +3,7 @@ A subpackage containing arrays over Galois fields.
 """
 from ._factory import *
 from ._main import *
+from ._gf2_packed import *
+from ._lu_factor import *
+from ._eliminator import *
 from ._poly_functions import *  # pylint: disable=redefined-builtin
@@ -77,12 +77,13 @@ class CalculateMeta(type):
 
         return cls._FUNC_CACHE_CALCULATE[key]
 
-    def _ufunc_calculate(cls, name):
+    def _ufunc_calculate(cls, name, target="cpu"):
         """
         Returns a JIT-compiled arithmetic ufunc using explicit calculation. These ufuncs are compiled for each Galois field since
-        the characteristic, degree, and irreducible polynomial are compiled into the ufuncs as constants.
+        the characteristic, degree, and irreducible polynomial are compiled into the ufuncs as constants. The compiled ufuncs are also
+        cached on disk by numba, keyed by those constants, so other processes load them instead of recompiling.
         """
-        key = (name, cls._characteristic, cls._degree, cls._irreducible_poly_int)
+        key = (name, cls._characteristic, cls._degree, cls._irreducible_poly_int, target)
 
         if key not in cls._UFUNC_CACHE_CALCULATE:
             cls._set_globals(name)
@@ -94,9 +95,9 @@ class CalculateMeta(type):
             irreducible_poly = cls._irreducible_poly_int
 
             if cls._UFUNC_TYPE[name] == "unary":
-                cls._UFUNC_CACHE_CALCULATE[key] = numba.vectorize(["int64(int64)"], nopython=True)(lambda a: function(a, characteristic, degree, irreducible_poly))
+                cls._UFUNC_CACHE_CALCULATE[key] = numba.vectorize(["int64(int64)"], nopython=True, target=target, cache=True)(lambda a: function(a, characteristic, degree, irreducible_poly))
             else:
-                cls._UFUNC_CACHE_CALCULATE[key] = numba.vectorize(["int64(int64, int64)"], nopython=True)(lambda a, b: function(a, b, characteristic, degree, irreducible_poly))
+                cls._UFUNC_CACHE_CALCULATE[key] = numba.vectorize(["int64(int64, int64)"], nopython=True, target=target, cache=True)(lambda a, b: function(a, b, characteristic, degree, irreducible_poly))
 
             cls._reset_globals()
 
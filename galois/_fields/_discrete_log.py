@@ -0,0 +1,145 @@
+"""
+A module that contains the discrete logarithm and multiplicative order of Galois field arrays for fields without lookup tables,
+using the prime factorization of the order p^m - 1 of the multiplicative group.
+"""
+import math
+
+import numpy as np
+
+from .._prime import factors
+
+# The maximum number of baby steps stored per prime factor of p^m - 1. Larger prime factors trade more giant steps for memory.
+BSGS_MAX_TABLE_SIZE = 2**20
+
+# The largest prime factor of p^m - 1 for which the discrete logarithm is computed, so each element takes at most
+# BSGS_MAX_TABLE_SIZE giant steps. Pollard's rho would need about sqrt(q) sequential steps for larger factors, which is no
+# more practical than the giant steps.
+DISCRETE_LOG_MAX_PRIME = BSGS_MAX_TABLE_SIZE**2
+
+
+class _SubgroupTable:
+    """
+    The precomputed baby-step giant-step table of the subgroup of order q^e of GF(p^m)^x, for the prime power q^e dividing p^m - 1.
+    """
+    __slots__ = ["q", "e", "cofactor", "alpha", "baby_values", "baby_exponents", "giant", "n_giant_steps"]
+
+    def __init__(self, field, q, e):
+        N = field.order - 1
+        self.q = q
+        self.e = e
+        self.cofactor = N // q**e  # Raising to this power maps GF(p^m)^x onto the subgroup of order q^e
+        self.alpha = field(field.primitive_element) ** self.cofactor  # Generates the subgroup of order q^e
+
+        # The baby steps gamma^j, sorted for lookup, where gamma generates the subgroup of order q
+        gamma = field(field.primitive_element) ** (N // q)
+        m = min(math.isqrt(q - 1) + 1, BSGS_MAX_TABLE_SIZE)
+        baby = gamma ** np.arange(m)
+        idxs = np.argsort(baby.view(np.ndarray), kind="stable")
+        self.baby_values = baby.view(np.ndarray)[idxs]
+        self.baby_exponents = idxs
+        self.giant = np.reciprocal(gamma ** m)
+        self.n_giant_steps = -(-q // m)
+
+    def log_prime_order(self, h):
+        """
+        Returns log_gamma(h) for elements h of the subgroup of order q by giant steps h gamma^(-m i) until a baby step matches.
+        """
+        m = self.baby_values.size
+        d = np.zeros(h.size, dtype=np.int64 if self.q < 2**62 else object)
+        active = np.arange(h.size)
+        y = h.copy()
+        for i in range(self.n_giant_steps):
+            idxs = np.searchsorted(self.baby_values, y.view(np.ndarray))
+            idxs[idxs == m] = 0
+            found = self.baby_values[idxs] == y.view(np.ndarray)
+            d[active[found]] = i * m + self.baby_exponents[idxs[found]]
+            active, y = active[~found], y[~found]
+            if active.size == 0:
+                break
+            y *= self.giant
+        return d
+
+    def log(self, beta):
+        """
+        Returns log_alpha(beta) mod q^e by solving for one base-q digit of the exponent at a time.
+        """
+        beta = beta ** self.cofactor
+        dtype = np.int64 if self.q**self.e < 2**62 else object
+        x = np.zeros(beta.size, dtype=dtype)
+        for k in range(self.e):
+            # Remove the digits found so far and project onto the subgroup of order q
+            h = beta / self.alpha ** x if k > 0 else beta
+            if k < self.e - 1:
+                h = h ** self.q ** (self.e - 1 - k)
+            x += self.log_prime_order(h) * self.q**k
+        return x
+
+
+def _tables(field):
+    """
+    Returns the subgroup tables of the field, building and caching them on the field class the first time.
+    """
+    if field._discrete_log_tables is None:
+        primes, exponents = factors(field.order - 1) if field.order > 2 else ([], [])
+        if len(primes) > 0 and primes[-1] > DISCRETE_LOG_MAX_PRIME:
+            raise NotImplementedError(f"The discrete logarithm in {field.name} is not supported because the multiplicative group order {field.order - 1} has the prime factor {primes[-1]}, which is larger than {DISCRETE_LOG_MAX_PRIME}.")
+        field._discrete_log_tables = [_SubgroupTable(field, q, e) for q, e in zip(primes, exponents)]
+    return field._discrete_log_tables
+
+
+def discrete_log(beta):
+    """
+    Returns the discrete logarithm of the non-zero elements of beta with base the primitive element of the field.
+
+    The exponent modulo each prime power q^e dividing N = p^m - 1 is solved in the subgroup of order q^e and the results are
+    combined with the Chinese remainder theorem. Each prime factor q costs O(e sqrt(q)) field operations, vectorized over
+    the elements of beta. Fields with a prime factor q larger than DISCRETE_LOG_MAX_PRIME raise a NotImplementedError.
+    """
+    field = type(beta)
+    N = field.order - 1
+    shape = beta.shape
+    beta = beta.reshape(-1)
+
+    # The Chinese remainder theorem in mixed radix form, x = x_1 + q_1^e_1 (t_2 + q_2^e_2 (t_3 + ...))
+    dtype = np.int64 if N < 2**31 else object
+    x = np.zeros(beta.size, dtype=dtype)
+    modulus = 1
+    for table in _tables(field):
+        n = table.q**table.e
+        x_i = table.log(beta).astype(dtype)
+        t = ((x_i - x) % n) * pow(modulus, -1, n) % n
+        x = x + modulus * t
+        modulus *= n
+
+    if field.dtypes[-1] != np.object_:
+        x = x.astype(np.int64)
+
+    return x.reshape(shape)
+
+
+def multiplicative_order(x):
+    """
+    Returns the multiplicative order of the non-zero elements of x.
+
+    For each prime power q^e dividing N = p^m - 1, y = x^(N / q^e) has order q^k, the q-part of ord(x). It is found by raising y to
+    the q-th power until it is 1, so the memory is proportional to the size of x and each prime factor costs at most e + 1
+    exponentiations.
+    """
+    field = type(x)
+    N = field.order - 1
+    shape = x.shape
+    x = x.reshape(-1)
+
+    order = np.ones(x.size, dtype=np.int64 if N < 2**63 else object)
+    primes, exponents = factors(N) if N > 1 else ([], [])
+    for q, e in zip(primes, exponents):
+        y = x ** (N // q**e)
+        active = np.flatnonzero(y != 1)
+        y = y[active]
+        while active.size > 0:
+            order[active] *= q
+            y = y ** q
+            idxs = y != 1
+            active, y = active[idxs], y[idxs]
+
+    return order.reshape(shape)
@@ -0,0 +1,236 @@
+"""
+A module that contains an incremental Gaussian eliminator, which reduces rows over a Galois field as they arrive.
+"""
+from typing import Tuple, Optional, Union
+
+import numpy as np
+
+from .._overrides import set_module
+
+__all__ = ["IncrementalEliminator"]
+
+
+@set_module("galois")
+class IncrementalEliminator:
+    r"""
+    An incremental Gaussian eliminator that keeps a reduced row echelon basis of the rows added to it.
+
+    Each row consists of :math:`n` coefficients and an optional payload of :math:`k` symbols. The payloads are eliminated
+    alongside the coefficients, so the payload of a row whose coefficients reduce to the unit vector :math:`\mathbf{e}_j` is the
+    :math:`j`-th decoded symbol. This is the decoder of random linear network coding (RLNC), where each coded packet is a random
+    linear combination of :math:`n` source symbols.
+
+    Adding a row costs :math:`O(n (n + k))` field operations, rather than reducing the whole matrix again with
+    :func:`galois.FieldArray.row_reduce`. A row that is a linear combination of the basis, which is not innovative, is discarded.
+
+    Parameters
+    ----------
+    field : galois.FieldClass
+        The Galois field of the rows.
+    n : int
+        The number of coefficients in each row.
+    payload_size : int, optional
+        The number of payload symbols in each row. The default is 0.
+    dtype : numpy.dtype, optional
+        The :obj:`numpy.dtype` of the stored rows. The default is `None` which represents the smallest valid dtype for the field.
+
+    Examples
+    --------
+    Decode 3 symbols of 4 bytes each from coded packets over :math:`\mathrm{GF}(2^8)`.
+
+    .. ipython:: python
+
+        GF = galois.GF(2**8)
+        symbols = GF.Random((3, 4)); symbols
+        decoder = galois.IncrementalEliminator(GF, 3, payload_size=4)
+        c = GF([5, 0, 0]); decoder.add(c, c @ symbols), decoder.rank
+        c = GF([1, 2, 3]); decoder.add(c, c @ symbols), decoder.rank
+        c = GF(7) * GF([1, 2, 3]); decoder.add(c, c @ symbols), decoder.rank
+        decoder.is_decoded
+        indices, payloads = decoder.decoded(); indices
+        payloads
+        c = GF([0, 1, 1]); decoder.add(c, c @ symbols), decoder.rank
+        decoder.is_complete
+        np.array_equal(decoder.decoded()[1], symbols)
+    """
+    __slots__ = ["_field", "_n", "_payload_size", "_rows", "_is_pivot"]
+
+    def __init__(self, field, n: int, payload_size: int = 0, dtype: Optional[Union[np.dtype, int, object]] = None):
+        if not isinstance(n, (int, np.integer)):
+            raise TypeError(f"Argument `n` must be an integer, not {type(n)}.")
+        if not isinstance(payload_size, (int, np.integer)):
+            raise TypeError(f"Argument `payload_size` must be an integer, not {type(payload_size)}.")
+        if not n >= 1:
+            raise ValueError(f"Argument `n` must be at least 1, not {n}.")
+        if not payload_size >= 0:
+            raise ValueError(f"Argument `payload_size` must be non-negative, not {payload_size}.")
+
+        self._field = field
+        self._n = int(n)
+        self._payload_size = int(payload_size)
+        # Row `j` holds the basis row whose pivot is in column `j`, if there is one
+        self._rows = field.Zeros((self._n, self._n + self._payload_size), dtype=dtype)
+        self._is_pivot = np.zeros(self._n, dtype=bool)
+
+    ###############################################################################
+    # Properties
+    ###############################################################################
+
+    @property
+    def field(self):
+        """
+        galois.FieldClass: The Galois field of the rows.
+        """
+        return self._field
+
+    @property
+    def n(self) -> int:
+        """
+        int: The number of coefficients in each row.
+        """
+        return self._n
+
+    @property
+    def payload_size(self) -> int:
+        """
+        int: The number of payload symbols in each row.
+        """
+        return self._payload_size
+
+    @property
+    def rank(self) -> int:
+        """
+        int: The rank of the rows added so far, which is the number of innovative rows.
+        """
+        return int(np.count_nonzero(self._is_pivot))
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        bool: Indicates whether the rank is :math:`n`, in which case every symbol is decoded.
+        """
+        return self.rank == self._n
+
+    @property
+    def pivots(self) -> np.ndarray:
+        """
+        numpy.ndarray: The increasing pivot columns of the basis.
+        """
+        return np.flatnonzero(self._is_pivot)
+
+    @property
+    def basis(self):
+        """
+        galois.FieldArray: The `(rank, n + payload_size)` basis in reduced row echelon form.
+        """
+        return self._rows[self._is_pivot]
+
+    @property
+    def is_decoded(self) -> np.ndarray:
+        r"""
+        numpy.ndarray: A boolean array of length :math:`n` that indicates which symbols are decoded. Symbol :math:`j` is decoded
+        once a basis row has coefficients equal to :math:`\mathbf{e}_j`.
+        """
+        return self._is_pivot & (np.count_nonzero(self._rows[:,:self._n].view(np.ndarray), axis=1) == 1)
+
+    ###############################################################################
+    # Methods
+    ###############################################################################
+
+    def add(self, coefficients, payload=None) -> Union[bool, np.ndarray]:
+        """
+        Adds a row, or a 2-D array of rows, to the eliminator.
+
+        Parameters
+        ----------
+        coefficients : galois.FieldArray
+            The length-:math:`n` coefficients of the row, or a `(N, n)` array of the coefficients of :math:`N` rows.
+        payload : galois.FieldArray, optional
+            The length-:obj:`payload_size` payload of the row, or a `(N, payload_size)` array of payloads. It is required when
+            :obj:`payload_size` is positive.
+
+        Returns
+        -------
+        bool, numpy.ndarray
+            Indicates whether the row was innovative and increased the rank. A boolean array is returned for a 2-D array of rows.
+        """
+        field = self._field
+        if not type(coefficients) is field:
+            raise TypeError(f"Argument `coefficients` must be a {field.name} array, not {type(coefficients)}.")
+        if not coefficients.ndim in [1, 2] or not coefficients.shape[-1] == self._n:
+            raise ValueError(f"Argument `coefficients` must have shape ({self._n},) or (N, {self._n}), not {coefficients.shape}.")
+        if self._payload_size > 0:
+            if not type(payload) is field:
+                raise TypeError(f"Argument `payload` must be a {field.name} array, not {type(payload)}.")
+            if not payload.shape == coefficients.shape[:-1] + (self._payload_size,):
+                raise ValueError(f"Argument `payload` must have shape {coefficients.shape[:-1] + (self._payload_size,)}, not {payload.shape}.")
+            rows = np.concatenate((coefficients, payload), axis=-1)
+        else:
+            if payload is not None and payload.shape[-1] != 0:
+                raise ValueError("Argument `payload` must not be provided because `payload_size` is 0.")
+            rows = coefficients
+
+        rows = rows.astype(self._rows.dtype)
+        if rows.ndim == 1:
+            return self._add_row(rows)
+
+        return np.array([self._add_row(row) for row in rows], dtype=bool)
+
+    def _add_row(self, row) -> bool:
+        if self.is_complete:
+            return False
+
+        # A row that reduces to zero coefficients is in the span of the basis
+        row = self._reduce(row)
+        if np.count_nonzero(row[:self._n].view(np.ndarray)) == 0:
+            return False
+
+        self._insert(row)
+
+        return True
+
+    def _reduce(self, row):
+        """
+        Subtracts the basis rows at the row's pivot columns. Every basis row is zero at the other pivot columns, so one
+        vector-matrix product eliminates them all.
+        """
+        pivots = np.flatnonzero(self._is_pivot)
+        if pivots.size > 0:
+            l = row[pivots]
+            if np.count_nonzero(l.view(np.ndarray)) > 0:
+                row = row - l @ self._rows[pivots]
+        return row
+
+    def _insert(self, row):
+        """
+        Inserts a reduced row with non-zero coefficients into the basis.
+        """
+        pivots = np.flatnonzero(self._is_pivot)
+        p = np.flatnonzero(row[:self._n].view(np.ndarray))[0]
+        if row[p] != 1:
+            row = row * np.reciprocal(row[p])
+
+        # Eliminate the new pivot column from the basis rows, keeping the basis in reduced row echelon form
+        idxs = pivots[self._rows[pivots, p] != 0]
+        if idxs.size > 0:
+            self._rows[idxs] -= self._rows[idxs, p][:, np.newaxis] * row
+
+        self._rows[p] = row
+        self._is_pivot[p] = True
+
+    def decoded(self) -> Tuple[np.ndarray, "FieldArray"]:
+        """
+        Returns the decoded symbols.
+
+        Returns
+        -------
+        numpy.ndarray
+            The increasing indices of the decoded symbols.
+        galois.FieldArray
+            The `(N, payload_size)` payloads of the :math:`N` decoded symbols.
+        """
+        indices = np.flatnonzero(self.is_decoded)
+        return indices, self._rows[indices, self._n:]
+
+    def __repr__(self):
+        return f"IncrementalEliminator(field={self._field.name}, n={self._n}, payload_size={self._payload_size}, rank={self.rank})"
@@ -7,9 +7,13 @@ from numba import int64
 import numpy as np
 
 from . import _linalg
-from ._dtypes import DTYPES
 from ._ufuncs import UfuncMeta
 
+# The lookup arithmetic functions, as module globals so they are inlined into the JIT-compiled "lookup" functions
+_ADD_LOOKUP = UfuncMeta._add_lookup
+_SUBTRACT_LOOKUP = UfuncMeta._subtract_lookup
+_RECIPROCAL_LOOKUP = UfuncMeta._reciprocal_lookup
+
 
 class FunctionMeta(UfuncMeta):
     """
@@ -55,13 +59,18 @@ class FunctionMeta(UfuncMeta):
         np.linalg.inv: _linalg.inv,
     }
 
-    _MATMUL_CALCULATE_SIG = numba.types.FunctionType(int64[:,:](int64[:,:], int64[:,:], UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, int64, int64, int64))
+    _MATMUL_CALCULATE_SIG = numba.types.FunctionType(int64[:,:,:](int64[:,:,:], int64[:,:,:], UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, int64, int64, int64))
     _CONVOLVE_CALCULATE_SIG = numba.types.FunctionType(int64[:](int64[:], int64[:], UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, int64, int64, int64))
     _POLY_EVALUATE_CALCULATE_SIG = numba.types.FunctionType(int64[:](int64[:], int64[:], UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, int64, int64, int64))
     _POLY_DIVMOD_CALCULATE_SIG = numba.types.FunctionType(int64[:,:](int64[:,:], int64[:], UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, int64, int64, int64))
     _POLY_ROOTS_CALCULATE_SIG = numba.types.FunctionType(int64[:,:](int64[:], int64[:], int64, UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, int64, int64, int64))
+    _NTT_CALCULATE_SIG = numba.types.FunctionType(int64[:,:](int64[:,:], int64[:], int64[:], UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, int64, int64, int64))
+    _GAUSSIAN_ELIMINATION_CALCULATE_SIG = numba.types.FunctionType(int64[:](int64[:,:,:], int64, int64, int64[:,:], UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._UNARY_CALCULATE_SIG, int64, int64, int64))
+    _SPARSE_MATMUL_CALCULATE_SIG = numba.types.FunctionType(int64[:,:](int64[:], int64[:], int64[:], int64[:,:], UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, int64, int64, int64))
+    _LU_SOLVE_CALCULATE_SIG = numba.types.FunctionType(int64[:,:](int64[:,:], int64[:,:], int64[:], UfuncMeta._BINARY_CALCULATE_SIG, UfuncMeta._BINARY_CALCULATE_SIG, int64, int64, int64))
 
     _FUNCTION_CACHE_CALCULATE = {}
+    _FUNCTION_CACHE_LOOKUP = {}
 
     def __init__(cls, name, bases, namespace, **kwargs):
         super().__init__(name, bases, namespace, **kwargs)
@@ -71,32 +80,47 @@ class FunctionMeta(UfuncMeta):
     # Individual functions, pre-compiled (cached)
     ###############################################################################
 
-    def _function(cls, name):
+    def _function(cls, name, target="cpu"):
         """
-        Returns the function for the specific routine. The function compilation is based on `ufunc_mode`.
+        Returns the function for the specific routine. The function compilation is based on `ufunc_mode`. The numba `target`
+        is either "cpu" or "parallel", in which case the function's `numba.prange` loops are multithreaded.
         """
-        if name not in cls._functions:
+        key = (name, target)
+        if key not in cls._functions:
             if cls.ufunc_mode != "python-calculate":
-                cls._functions[name] = cls._function_calculate(name)
+                cls._functions[key] = cls._function_calculate(name, target)
             else:
-                cls._functions[name] = cls._function_python(name)
-        return cls._functions[name]
+                cls._functions[key] = cls._function_python(name)
+        return cls._functions[key]
 
-    def _function_calculate(cls, name):
+    def _function_calculate(cls, name, target="cpu"):
         """
         Returns a JIT-compiled function using explicit calculation. These functions are once-compiled and shared for all
         Galois fields. The only difference between Galois fields are the arithmetic funcs, characteristic, degree, and
         irreducible polynomial that are passed in as inputs.
         """
-        key = (name,)
+        key = (name, target)
 
         if key not in cls._FUNCTION_CACHE_CALCULATE:
             function = getattr(cls, f"_{name}_calculate")
             sig = getattr(cls, f"_{name.upper()}_CALCULATE_SIG")
-            cls._FUNCTION_CACHE_CALCULATE[key] = numba.jit(sig.signature, nopython=True, cache=True)(function)
+            cls._FUNCTION_CACHE_CALCULATE[key] = numba.jit(sig.signature, nopython=True, parallel=target == "parallel", cache=True)(function)
 
         return cls._FUNCTION_CACHE_CALCULATE[key]
 
+    def _function_lookup(cls, name, target="cpu"):
+        """
+        Returns a JIT-compiled function that uses the lookup tables, which are passed in as inputs. The lookup arithmetic is
+        inlined, rather than called through function pointers, so these functions are compiled once for all Galois fields.
+        """
+        key = (name, target)
+
+        if key not in cls._FUNCTION_CACHE_LOOKUP:
+            function = getattr(cls, f"_{name}_lookup")
+            cls._FUNCTION_CACHE_LOOKUP[key] = numba.jit(nopython=True, parallel=target == "parallel", cache=True)(function)
+
+        return cls._FUNCTION_CACHE_LOOKUP[key]
+
     def _function_python(cls, name):
         """
         Returns a pure-Python function using explicit calculation.
@@ -112,8 +136,6 @@ class FunctionMeta(UfuncMeta):
             raise TypeError(f"Operation 'matmul' requires both arrays be in the same Galois field, not {type(A)} and {type(B)}.")
         if not (A.ndim >= 1 and B.ndim >= 1):
             raise ValueError(f"Operation 'matmul' requires both arrays have dimension at least 1, not {A.ndim}-D and {B.ndim}-D.")
-        if not (A.ndim <= 2 and B.ndim <= 2):
-            raise ValueError("Operation 'matmul' currently only supports matrix multiplication up to 2-D. If you would like matrix multiplication of N-D arrays, please submit a GitHub issue at https://github.com/mhostetter/galois/issues.")
         field = type(A)
         dtype = A.dtype
 
@@ -131,33 +153,25 @@ class FunctionMeta(UfuncMeta):
         if not A.shape[-1] == B.shape[-2]:
             raise ValueError(f"Operation 'matmul' requires the last dimension of A to match the second-to-last dimension of B, not {A.shape} and {B.shape}.")
 
-        # if A.ndim > 2 and B.ndim == 2:
-        #     new_shape = list(A.shape[:-2]) + list(B.shape)
-        #     B = np.broadcast_to(B, new_shape)
-        # if B.ndim > 2 and A.ndim == 2:
-        #     new_shape = list(B.shape[:-2]) + list(A.shape)
-        #     A = np.broadcast_to(A, new_shape)
+        # Broadcast the leading "stack" dimensions and flatten them into a single batch dimension
+        batch_shape = np.broadcast(np.empty(A.shape[:-2], dtype=bool), np.empty(B.shape[:-2], dtype=bool)).shape
+        M, K, N = A.shape[-2], A.shape[-1], B.shape[-1]
+        A = np.broadcast_to(A.view(np.ndarray), batch_shape + (M, K)).reshape((-1, M, K))
+        B = np.broadcast_to(B.view(np.ndarray), batch_shape + (K, N)).reshape((-1, K, N))
 
         if cls.ufunc_mode != "python-calculate":
-            A = A.astype(np.int64)
-            B = B.astype(np.int64)
-            add = cls._func_calculate("add")
-            multiply = cls._func_calculate("multiply")
-            C = cls._function("matmul")(A, B, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
-            C = C.astype(dtype)
+            C = cls._matmul_batched(A, B)
         else:
-            A = A.view(np.ndarray)
-            B = B.view(np.ndarray)
             add = cls._func_python("add")
             multiply = cls._func_python("multiply")
             C = cls._function("matmul")(A, B, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
-        C = C.view(field)
+        C = field._view(C)
 
-        shape = list(C.shape)
-        if prepend:
-            shape = shape[1:]
-        if append:
-            shape = shape[:-1]
+        shape = list(batch_shape)
+        if not prepend:
+            shape.append(M)
+        if not append:
+            shape.append(N)
         C = C.reshape(shape)
 
         # TODO: Determine a better way to do this
@@ -168,6 +182,20 @@ class FunctionMeta(UfuncMeta):
 
         return C
 
+    def _matmul_batched(cls, A, B):
+        """
+        Computes the stacked matrix multiplication C[b] = A[b] @ B[b] of the integer arrays A and B with shapes (batch, M, K) and
+        (batch, K, N). This may be supplemented in GF2mMeta with faster kernels for the specific field.
+        """
+        dtype = A.dtype
+        target = cls._target(A.size * B.shape[-1])
+        A = A.astype(np.int64)
+        B = B.astype(np.int64)
+        add = cls._func_calculate("add")
+        multiply = cls._func_calculate("multiply")
+        C = cls._function("matmul", target)(A, B, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+        return C.astype(dtype)
+
     def _convolve(cls, a, b, mode="full"):
         if not type(a) is type(b):
             raise TypeError(f"Arguments `a` and `b` must be of the same Galois field array class, not {type(a)} and {type(b)}.")
@@ -177,25 +205,15 @@ class FunctionMeta(UfuncMeta):
         dtype = a.dtype
 
         if field.is_prime_field:
-            # Determine the minimum dtype to hold the entire product and summation without overflowing
-            n_sum = min(a.size, b.size)
-            max_value = n_sum * (field.characteristic - 1)**2
-            dtypes = [dtype for dtype in DTYPES if np.iinfo(dtype).max >= max_value]
-            dtype = np.object_ if len(dtypes) == 0 else dtypes[0]
-            return_dtype = a.dtype
-            a = a.view(np.ndarray).astype(dtype)
-            b = b.view(np.ndarray).astype(dtype)
-            c = np.convolve(a, b)  # Compute result using native numpy LAPACK/BLAS implementation
-            c = c % field.characteristic  # Reduce the result mod p
-            c = c.astype(return_dtype).view(field) if not np.isscalar(c) else field(c, dtype=return_dtype)
-            return c
+            return _linalg._lapack_convolve(a, b)
         else:
             if cls.ufunc_mode != "python-calculate":
                 a = a.astype(np.int64)
                 b = b.astype(np.int64)
                 add = cls._func_calculate("add")
                 multiply = cls._func_calculate("multiply")
-                c = cls._function("convolve")(a, b, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+                target = cls._target(a.size * b.size)
+                c = cls._function("convolve", target)(a, b, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
                 c = c.astype(dtype)
             else:
                 a = a.view(np.ndarray)
@@ -203,7 +221,7 @@ class FunctionMeta(UfuncMeta):
                 add = cls._func_python("add")
                 multiply = cls._func_python("multiply")
                 c = cls._function("convolve")(a, b, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
-            c = c.view(field)
+            c = field._view(c)
 
             return c
 
@@ -218,7 +236,8 @@ class FunctionMeta(UfuncMeta):
             x = x.astype(np.int64)
             add = cls._func_calculate("add")
             multiply = cls._func_calculate("multiply")
-            results = cls._function("poly_evaluate")(coeffs, x, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+            target = cls._target(coeffs.size * x.size)
+            results = cls._function("poly_evaluate", target)(coeffs, x, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
             results = results.astype(dtype)
         else:
             coeffs = coeffs.view(np.ndarray)
@@ -226,7 +245,7 @@ class FunctionMeta(UfuncMeta):
             add = cls._func_python("add")
             multiply = cls._func_python("multiply")
             results = cls._function("poly_evaluate")(coeffs, x, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
-        results = results.view(field)
+        results = field._view(results)
         results = results.reshape(shape)
 
         return results
@@ -259,7 +278,8 @@ class FunctionMeta(UfuncMeta):
             subtract = cls._func_calculate("subtract")
             multiply = cls._func_calculate("multiply")
             divide = cls._func_calculate("divide")
-            qr = cls._function("poly_divmod")(a, b, subtract, multiply, divide, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+            target = cls._target(a.size * b.size)
+            qr = cls._function("poly_divmod", target)(a, b, subtract, multiply, divide, cls.characteristic, cls.degree, cls._irreducible_poly_int)
             qr = qr.astype(dtype)
         else:
             a = a.view(np.ndarray)
@@ -268,7 +288,7 @@ class FunctionMeta(UfuncMeta):
             multiply = cls._func_python("multiply")
             divide = cls._func_python("divide")
             qr = cls._function("poly_divmod")(a, b, subtract, multiply, divide, cls.characteristic, cls.degree, cls._irreducible_poly_int)
-        qr = qr.view(field)
+        qr = field._view(qr)
 
         q = qr[:, 0:q_degree + 1]
         r = qr[:, q_degree + 1:q_degree + 1 + r_degree + 1]
@@ -299,11 +319,135 @@ class FunctionMeta(UfuncMeta):
             multiply = cls._func_python("multiply")
             power = cls._func_python("power")
             roots = cls._function("poly_roots")(nonzero_degrees, nonzero_coeffs, int(cls.primitive_element), add, multiply, power, cls.characteristic, cls.degree, cls._irreducible_poly_int)[0,:]
-        roots = roots.view(field)
+        roots = field._view(roots)
 
         idxs = np.argsort(roots)
         return roots[idxs]
 
+    def _ntt(cls, x, twiddles, radices):
+        assert isinstance(x, cls) and x.ndim == 2
+        field = cls
+        dtype = x.dtype
+
+        if cls.ufunc_mode != "python-calculate":
+            x = x.astype(np.int64)
+            twiddles = twiddles.astype(np.int64)
+            radices = radices.astype(np.int64)
+            add = cls._func_calculate("add")
+            subtract = cls._func_calculate("subtract")
+            multiply = cls._func_calculate("multiply")
+            y = cls._function("ntt")(x, twiddles, radices, add, subtract, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+            y = y.astype(dtype)
+        else:
+            x = x.view(np.ndarray)
+            twiddles = twiddles.view(np.ndarray)
+            add = cls._func_python("add")
+            subtract = cls._func_python("subtract")
+            multiply = cls._func_python("multiply")
+            y = cls._function("ntt")(x, twiddles, radices, add, subtract, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+        y = field._view(y)
+
+        return y
+
+    def _gaussian_elimination(cls, A, ncols, mode):
+        """
+        Performs in-place Gaussian elimination on a copy of each matrix in the (..., m, n) array A over its first `ncols` columns.
+        The `mode` is 0 for reduced row echelon form, 1 for an LU factorization without row exchanges, or 2 for an LU
+        factorization with row exchanges. The LU factorizations are stored compactly with the multipliers of L below the diagonal
+        and U on and above it.
+
+        Returns the eliminated array, the (..., m) row permutations `perm` such that row `i` of a result came from row `perm[i]`
+        of its matrix, and the (...) array of the number of pivots (mode 0), the number of row exchanges (mode 2), or -1 if the LU
+        factorization needs a row exchange (mode 1).
+        """
+        assert isinstance(A, cls) and A.ndim >= 2
+        field = cls
+        dtype = A.dtype
+        shape = A.shape
+        B, m, n = int(np.prod(shape[:-2])), shape[-2], shape[-1]
+        perm = np.tile(np.arange(m, dtype=np.int64), (B, 1))
+
+        if cls.ufunc_mode == "jit-lookup":
+            A = A.astype(np.int64).reshape((B, m, n))
+            target = cls._target(A.size * ncols)
+            results = cls._function_lookup("gaussian_elimination", target)(A, ncols, mode, perm, cls._EXP, cls._LOG, cls._ZECH_LOG, cls._ZECH_E, cls.characteristic)
+            A = A.astype(dtype)
+        elif cls.ufunc_mode == "jit-calculate":
+            A = A.astype(np.int64).reshape((B, m, n))
+            subtract = cls._func_calculate("subtract")
+            multiply = cls._func_calculate("multiply")
+            reciprocal = cls._func_calculate("reciprocal")
+            target = cls._target(A.size * ncols)
+            results = cls._function("gaussian_elimination", target)(A, ncols, mode, perm, subtract, multiply, reciprocal, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+            A = A.astype(dtype)
+        else:
+            A = A.view(np.ndarray).copy().reshape((B, m, n))
+            subtract = cls._func_python("subtract")
+            multiply = cls._func_python("multiply")
+            reciprocal = cls._func_python("reciprocal")
+            results = cls._function("gaussian_elimination")(A, ncols, mode, perm, subtract, multiply, reciprocal, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+        A = field._view(A.reshape(shape))
+
+        return A, perm.reshape(shape[:-1]), results.reshape(shape[:-2])
+
+    def _sparse_matmul(cls, indptr, indices, data, X):
+        """
+        Computes A @ X for the CSR matrix A with row pointers `indptr`, column indices `indices`, and values `data`, and the
+        (n, K) array X.
+        """
+        assert isinstance(data, cls) and isinstance(X, cls)
+        field = cls
+        dtype = X.dtype
+
+        if cls.ufunc_mode == "jit-lookup":
+            data, X = data.astype(np.int64), X.astype(np.int64)
+            target = cls._target(indices.size * X.shape[1])
+            Y = cls._function_lookup("sparse_matmul", target)(indptr, indices, data, X, cls._EXP, cls._LOG, cls._ZECH_LOG, cls._ZECH_E, cls.characteristic)
+            Y = Y.astype(dtype)
+        elif cls.ufunc_mode == "jit-calculate":
+            data, X = data.astype(np.int64), X.astype(np.int64)
+            add = cls._func_calculate("add")
+            multiply = cls._func_calculate("multiply")
+            target = cls._target(indices.size * X.shape[1])
+            Y = cls._function("sparse_matmul", target)(indptr, indices, data, X, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+            Y = Y.astype(dtype)
+        else:
+            data, X = data.view(np.ndarray), X.view(np.ndarray)
+            add = cls._func_python("add")
+            multiply = cls._func_python("multiply")
+            Y = cls._function("sparse_matmul")(indptr, indices, data, X, add, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+
+        return field._view(Y)
+
+    def _lu_solve(cls, LU, diag_inv, X):
+        """
+        Solves L U X' = X for every column of the (n, K) array X, where the (n, n) array LU is a compact LU factorization and
+        `diag_inv` holds the reciprocals of the diagonal of U. Returns the solutions X'.
+        """
+        assert isinstance(LU, cls) and isinstance(X, cls)
+        field = cls
+        dtype = X.dtype
+
+        if cls.ufunc_mode == "jit-lookup":
+            LU, diag_inv, X = LU.astype(np.int64), diag_inv.astype(np.int64), X.astype(np.int64)
+            target = cls._target(X.size * LU.shape[0])
+            X = cls._function_lookup("lu_solve", target)(LU, X, diag_inv, cls._EXP, cls._LOG, cls._ZECH_LOG, cls._ZECH_E, cls.characteristic)
+            X = X.astype(dtype)
+        elif cls.ufunc_mode == "jit-calculate":
+            LU, diag_inv, X = LU.astype(np.int64), diag_inv.astype(np.int64), X.astype(np.int64)
+            subtract = cls._func_calculate("subtract")
+            multiply = cls._func_calculate("multiply")
+            target = cls._target(X.size * LU.shape[0])
+            X = cls._function("lu_solve", target)(LU, X, diag_inv, subtract, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+            X = X.astype(dtype)
+        else:
+            LU, diag_inv, X = LU.view(np.ndarray), diag_inv.view(np.ndarray), X.view(np.ndarray).copy()
+            subtract = cls._func_python("subtract")
+            multiply = cls._func_python("multiply")
+            X = cls._function("lu_solve")(LU, X, diag_inv, subtract, multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+
+        return field._view(X)
+
     ###############################################################################
     # Function implementations using explicit calculation
     ###############################################################################
@@ -314,16 +458,17 @@ class FunctionMeta(UfuncMeta):
         args = CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY
         dtype = A.dtype
 
-        assert A.ndim == 2 and B.ndim == 2
-        assert A.shape[-1] == B.shape[-2]
+        assert A.ndim == 3 and B.ndim == 3
+        assert A.shape[0] == B.shape[0] and A.shape[-1] == B.shape[-2]
 
-        M, K = A.shape
-        K, N = B.shape
-        C = np.zeros((M, N), dtype=dtype)
-        for i in range(M):
+        L, M, K = A.shape
+        N = B.shape[-1]
+        C = np.zeros((L, M, N), dtype=dtype)
+        for li in numba.prange(L*M):
+            l, i = li // M, li % M
             for j in range(N):
                 for k in range(K):
-                    C[i,j] = ADD(C[i,j], MULTIPLY(A[i,k], B[k,j], *args), *args)
+                    C[l,i,j] = ADD(C[l,i,j], MULTIPLY(A[l,i,k], B[l,k,j], *args), *args)
 
         return C
 
@@ -334,9 +479,9 @@ class FunctionMeta(UfuncMeta):
         dtype = a.dtype
 
         c = np.zeros(a.size + b.size - 1, dtype=dtype)
-        for i in range(a.size):
-            for j in range(b.size - 1, -1, -1):
-                c[i + j] = ADD(c[i + j], MULTIPLY(a[i], b[j], *args), *args)
+        for n in numba.prange(c.size):
+            for i in range(max(0, n - b.size + 1), min(n, a.size - 1) + 1):
+                c[n] = ADD(c[n], MULTIPLY(a[i], b[n - i], *args), *args)
 
         return c
 
@@ -347,7 +492,7 @@ class FunctionMeta(UfuncMeta):
         dtype = values.dtype
 
         results = np.zeros(values.size, dtype=dtype)
-        for i in range(values.size):
+        for i in numba.prange(values.size):
             results[i] = coeffs[0]
             for j in range(1, coeffs.size):
                 results[i] = ADD(coeffs[j], MULTIPLY(results[i], values[i], *args), *args)
@@ -365,7 +510,7 @@ class FunctionMeta(UfuncMeta):
         q_degree = a.shape[1] - b.shape[-1]
         qr = a.copy()
 
-        for k in range(a.shape[0]):
+        for k in numba.prange(a.shape[0]):
             for i in range(q_degree + 1):
                 if qr[k,i] > 0:
                     q = DIVIDE(qr[k,i], b[0], *args)
@@ -418,3 +563,345 @@ class FunctionMeta(UfuncMeta):
                 break
 
         return np.array([roots, powers], dtype=dtype)
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _ntt_calculate(x, twiddles, radices, ADD, SUBTRACT, MULTIPLY, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):
+        """
+        Mixed-radix Stockham (self-sorting) Cooley-Tukey NTT of each row of x.
+
+        twiddles[i] = ω^i for 0 <= i < N, where ω is a primitive N-th root of unity
+        N = r_0 * r_1 * ... * r_(L-1), where r_l = radices[l]
+
+        Each stage splits the length-n sub-transforms into r length-m = n/r sub-transforms, where
+        w_n = ω^(N/n) and w_r = ω^(N/r) are the n-th and r-th roots of unity:
+
+        y[q + s*(r*p + k)] = w_n^(p*k) * sum_{j=0}^{r-1} x[q + s*(p + j*m)] * w_r^(j*k)
+        """
+        args = CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY
+        dtype = x.dtype
+
+        B, N = x.shape
+        a = x.copy()
+        b = np.zeros((B, N), dtype=dtype)
+
+        n = N  # The size of the sub-transforms at this stage
+        s = 1  # The stride between elements of the same sub-transform
+        for l in range(radices.size):
+            r = radices[l]
+            m = n // r
+            n_stride = N // n  # Index stride into the twiddles for w_n
+            r_stride = N // r  # Index stride into the twiddles for w_r
+
+            for t in range(B):
+                for p in range(m):
+                    if r == 2:
+                        w = twiddles[p*n_stride]
+                        for q in range(s):
+                            a0 = a[t, q + s*p]
+                            a1 = a[t, q + s*(p + m)]
+                            b[t, q + s*2*p] = ADD(a0, a1, *args)
+                            b[t, q + s*(2*p + 1)] = MULTIPLY(SUBTRACT(a0, a1, *args), w, *args)
+                    else:
+                        for q in range(s):
+                            for k in range(r):
+                                acc = a[t, q + s*p]
+                                for j in range(1, r):
+                                    acc = ADD(acc, MULTIPLY(a[t, q + s*(p + j*m)], twiddles[(j*k*r_stride) % N], *args), *args)
+                                b[t, q + s*(r*p + k)] = MULTIPLY(acc, twiddles[p*k*n_stride], *args)
+
+            a, b = b, a
+            n = m
+            s *= r
+
+        return a
+
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _gaussian_elimination_calculate(A, ncols, mode, perm, SUBTRACT, MULTIPLY, RECIPROCAL, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):
+        """
+        In-place Gaussian elimination of each matrix A[b] over its first `ncols` columns, recording the row exchanges in perm[b].
+
+        mode = 0: Reduced row echelon form. Each pivot is scaled to 1 and eliminated from every other row. Returns the number of pivots.
+        mode = 1: LU factorization without row exchanges. Returns 0, or -1 if a zero pivot has a non-zero entry below it.
+        mode = 2: LU factorization with row exchanges. Returns the number of row exchanges.
+
+        The LU factorizations step down the diagonal, eliminating below each pivot and storing the multipliers in place of the
+        eliminated entries.
+        """
+        args = CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY
+
+        B, m, n = A.shape
+        results = np.zeros(B, dtype=np.int64)
+
+        for b in numba.prange(B):
+            a = A[b]
+            p = 0  # The pivot row
+            N_swaps = 0
+            exists = True
+
+            for j in range(ncols):
+                if p == m:
+                    break
+
+                # Find a pivot in column `j` at or below row `p`
+                i = p
+                while i < m and a[i,j] == 0:
+                    i += 1
+                if i == m:
+                    if mode != 0:
+                        p += 1
+                    continue
+
+                # Swap rows `p` and `i`. The pivot is now located at row `p`.
+                if i != p:
+                    if mode == 1:
+                        exists = False
+                        break
+                    for k in range(n):
+                        a[p,k], a[i,k] = a[i,k], a[p,k]
+                    perm[b,p], perm[b,i] = perm[b,i], perm[b,p]
+                    N_swaps += 1
+
+                pivot_inv = RECIPROCAL(a[p,j], *args)
+
+                if mode == 0:
+                    # Force the pivot value to be 1 and zeros above and below the pivot. The entries left of column `j` are
+                    # already zero in row `p`.
+                    for k in range(j, n):
+                        a[p,k] = MULTIPLY(a[p,k], pivot_inv, *args)
+                    for r in range(m):
+                        if r != p and a[r,j] != 0:
+                            l = a[r,j]
+                            for k in range(j, n):
+                                a[r,k] = SUBTRACT(a[r,k], MULTIPLY(l, a[p,k], *args), *args)
+                else:
+                    # Force zeros below the pivot and store the multipliers in their place
+                    for r in range(p + 1, m):
+                        if a[r,j] != 0:
+                            l = MULTIPLY(a[r,j], pivot_inv, *args)
+                            a[r,j] = l
+                            for k in range(j + 1, n):
+                                a[r,k] = SUBTRACT(a[r,k], MULTIPLY(l, a[p,k], *args), *args)
+
+                p += 1
+
+            if not exists:
+                results[b] = -1
+            else:
+                results[b] = p if mode == 0 else N_swaps
+
+        return results
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _sparse_matmul_calculate(INDPTR, INDICES, DATA, X, ADD, MULTIPLY, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):
+        args = CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY
+        dtype = X.dtype
+
+        m = INDPTR.size - 1
+        K = X.shape[1]
+        Y = np.zeros((m, K), dtype=dtype)
+        for i in numba.prange(m):
+            for t in range(INDPTR[i], INDPTR[i + 1]):
+                a, j = DATA[t], INDICES[t]
+                for k in range(K):
+                    Y[i,k] = ADD(Y[i,k], MULTIPLY(a, X[j,k], *args), *args)
+
+        return Y
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _lu_solve_calculate(LU, X, DIAG_INV, SUBTRACT, MULTIPLY, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):
+        """
+        In-place forward and back substitution on the columns of X. The columns are solved in independent blocks, so each block
+        of rows stays in cache while it is updated.
+        """
+        args = CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY
+
+        n, K = X.shape
+        BLOCK = 64
+
+        for c in numba.prange((K + BLOCK - 1) // BLOCK):
+            k0, k1 = c*BLOCK, min((c + 1)*BLOCK, K)
+
+            # Forward substitution with the unit lower triangular L, X[i] -= L[i,j] X[j] for j < i
+            for i in range(1, n):
+                for j in range(i):
+                    l = LU[i,j]
+                    if l != 0:
+                        for k in range(k0, k1):
+                            X[i,k] = SUBTRACT(X[i,k], MULTIPLY(l, X[j,k], *args), *args)
+
+            # Back substitution with U, X[i] = (X[i] - U[i,j] X[j] for j > i) / U[i,i]
+            for i in range(n - 1, -1, -1):
+                for j in range(i + 1, n):
+                    u = LU[i,j]
+                    if u != 0:
+                        for k in range(k0, k1):
+                            X[i,k] = SUBTRACT(X[i,k], MULTIPLY(u, X[j,k], *args), *args)
+                for k in range(k0, k1):
+                    X[i,k] = MULTIPLY(X[i,k], DIAG_INV[i], *args)
+
+        return X
+
+    ###############################################################################
+    # Function implementations using lookup tables
+    ###############################################################################
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _gaussian_elimination_lookup(A, ncols, mode, perm, EXP, LOG, ZECH_LOG, ZECH_E, CHARACTERISTIC):  # pragma: no cover
+        """
+        The same elimination as _gaussian_elimination_calculate(). Each row operation A[r] -= l*A[p] is computed in the log
+        domain with the logarithms of the pivot row computed once per pivot. In characteristic 2, subtraction is XOR, and in
+        prime fields it is integer subtraction modulo p.
+        """
+        ORDER = LOG.size
+        B, m, n = A.shape
+        results = np.zeros(B, dtype=np.int64)
+
+        for b in numba.prange(B):
+            a = A[b]
+            LOG_ROW = np.zeros(n, dtype=np.int64)
+            p = 0  # The pivot row
+            N_swaps = 0
+            exists = True
+
+            for j in range(ncols):
+                if p == m:
+                    break
+
+                # Find a pivot in column `j` at or below row `p`
+                i = p
+                while i < m and a[i,j] == 0:
+                    i += 1
+                if i == m:
+                    if mode != 0:
+                        p += 1
+                    continue
+
+                # Swap rows `p` and `i`. The pivot is now located at row `p`.
+                if i != p:
+                    if mode == 1:
+                        exists = False
+                        break
+                    for k in range(n):
+                        a[p,k], a[i,k] = a[i,k], a[p,k]
+                    perm[b,p], perm[b,i] = perm[b,i], perm[b,p]
+                    N_swaps += 1
+
+                log_pivot_inv = LOG[_RECIPROCAL_LOOKUP(a[p,j], EXP, LOG, ZECH_LOG, ZECH_E)]
+
+                if mode == 0:
+                    # Force the pivot value to be 1 and zeros above and below the pivot
+                    for k in range(j, n):
+                        if a[p,k] != 0:
+                            a[p,k] = EXP[LOG[a[p,k]] + log_pivot_inv]
+                        LOG_ROW[k] = LOG[a[p,k]] if a[p,k] != 0 else -1
+                    r_start, k_start = 0, j
+                else:
+                    # Force zeros below the pivot and store the multipliers in their place
+                    for k in range(j + 1, n):
+                        LOG_ROW[k] = LOG[a[p,k]] if a[p,k] != 0 else -1
+                    r_start, k_start = p + 1, j + 1
+
+                for r in range(r_start, m):
+                    if r == p or a[r,j] == 0:
+                        continue
+                    if mode == 0:
+                        log_l = LOG[a[r,j]]
+                    else:
+                        log_l = (LOG[a[r,j]] + log_pivot_inv) % (ORDER - 1)
+                        a[r,j] = EXP[log_l]
+                    for k in range(k_start, n):
+                        if LOG_ROW[k] >= 0:
+                            if CHARACTERISTIC == 2:
+                                a[r,k] ^= EXP[log_l + LOG_ROW[k]]
+                            elif ORDER == CHARACTERISTIC:
+                                d = a[r,k] - EXP[log_l + LOG_ROW[k]]
+                                a[r,k] = d + CHARACTERISTIC if d < 0 else d
+                            else:
+                                a[r,k] = _SUBTRACT_LOOKUP(a[r,k], EXP[log_l + LOG_ROW[k]], EXP, LOG, ZECH_LOG, ZECH_E)
+
+                p += 1
+
+            if not exists:
+                results[b] = -1
+            else:
+                results[b] = p if mode == 0 else N_swaps
+
+        return results
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _lu_solve_lookup(LU, X, DIAG_INV, EXP, LOG, ZECH_LOG, ZECH_E, CHARACTERISTIC):  # pragma: no cover
+        """
+        The same substitution as _lu_solve_calculate(), with each product computed in the log domain.
+        """
+        ORDER = LOG.size
+        n, K = X.shape
+        BLOCK = 64
+
+        for c in numba.prange((K + BLOCK - 1) // BLOCK):
+            k0, k1 = c*BLOCK, min((c + 1)*BLOCK, K)
+
+            for step in range(2*n):
+                # Forward substitution on rows 1, ..., n - 1, then back substitution on rows n - 1, ..., 0
+                if step < n:
+                    i, j0, j1 = step, 0, step
+                else:
+                    i = 2*n - 1 - step
+                    j0, j1 = i + 1, n
+
+                for j in range(j0, j1):
+                    if LU[i,j] == 0:
+                        continue
+                    log_l = LOG[LU[i,j]]
+                    for k in range(k0, k1):
+                        if X[j,k] != 0:
+                            y = EXP[log_l + LOG[X[j,k]]]
+                            if CHARACTERISTIC == 2:
+                                X[i,k] ^= y
+                            elif ORDER == CHARACTERISTIC:
+                                d = X[i,k] - y
+                                X[i,k] = d + CHARACTERISTIC if d < 0 else d
+                            else:
+                                X[i,k] = _SUBTRACT_LOOKUP(X[i,k], y, EXP, LOG, ZECH_LOG, ZECH_E)
+
+                if step >= n:
+                    log_d = LOG[DIAG_INV[i]]
+                    for k in range(k0, k1):
+                        if X[i,k] != 0:
+                            X[i,k] = EXP[LOG[X[i,k]] + log_d]
+
+        return X
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _sparse_matmul_lookup(INDPTR, INDICES, DATA, X, EXP, LOG, ZECH_LOG, ZECH_E, CHARACTERISTIC):  # pragma: no cover
+        """
+        The same product as _sparse_matmul_calculate(), with each product computed in the log domain.
+        """
+        ORDER = LOG.size
+        dtype = X.dtype
+
+        m = INDPTR.size - 1
+        K = X.shape[1]
+        Y = np.zeros((m, K), dtype=dtype)
+        for i in numba.prange(m):
+            for t in range(INDPTR[i], INDPTR[i + 1]):
+                log_a, j = LOG[DATA[t]], INDICES[t]
+                for k in range(K):
+                    if X[j,k] != 0:
+                        y = EXP[log_a + LOG[X[j,k]]]
+                        if CHARACTERISTIC == 2:
+                            Y[i,k] ^= y
+                        elif ORDER == CHARACTERISTIC:
+                            z = Y[i,k] + y
+                            Y[i,k] = z - CHARACTERISTIC if z >= CHARACTERISTIC else z
+                        else:
+                            Y[i,k] = _ADD_LOOKUP(Y[i,k], y, EXP, LOG, ZECH_LOG, ZECH_E)
+
+        return Y
@@ -0,0 +1,215 @@
+"""
+A module that contains a bit-packed array over GF(2), which stores 64 field elements in each uint64 word.
+"""
+from typing import Tuple, Union
+
+import numpy as np
+
+from .._overrides import set_module
+
+from ._main import GF2
+from ._packbits import pack, unpack, matmul_xor
+
+__all__ = ["GF2Packed"]
+
+
+@set_module("galois")
+class GF2Packed:
+    r"""
+    A bit-packed array over :math:`\mathrm{GF}(2)`.
+
+    The elements along the last axis are packed 64 per :obj:`numpy.uint64` word. Compared to a :obj:`galois.GF2` array, which
+    stores each element in at least one byte, this uses 8x less memory. Addition and multiplication are bitwise XOR and AND
+    on the words, and matrix multiplication XORs the packed rows of the second operand.
+
+    Parameters
+    ----------
+    array : tuple, list, numpy.ndarray, galois.GF2, galois.GF2Packed
+        The array of :math:`\mathrm{GF}(2)` elements to pack. It must have at least one dimension.
+
+    Examples
+    --------
+    Pack a :obj:`galois.GF2` array and unpack it again.
+
+    .. ipython:: python
+
+        x = galois.GF2.Random((2, 100)); x
+        p = galois.GF2Packed(x); p
+        p.words
+        np.array_equal(p.unpack(), x)
+
+    Perform arithmetic on the packed arrays.
+
+    .. ipython:: python
+
+        A = galois.GF2.Random((3, 4)); A
+        B = galois.GF2.Random((4, 5)); B
+        (galois.GF2Packed(A) @ galois.GF2Packed(B)).unpack()
+        A @ B
+    """
+    # pylint: disable=too-many-public-methods
+    __slots__ = ["_words", "_shape"]
+
+    def __init__(self, array: Union[Tuple, list, np.ndarray, GF2, "GF2Packed"]):
+        if isinstance(array, GF2Packed):
+            self._words = array.words.copy()
+            self._shape = array.shape
+            return
+
+        array = array if isinstance(array, GF2) else GF2(array)
+        if not array.ndim >= 1:
+            raise ValueError(f"Argument `array` must have at least one dimension, not {array.ndim}.")
+        self._words = pack(array.view(np.ndarray))
+        self._shape = array.shape
+
+    @classmethod
+    def _from_words(cls, words, shape):
+        """
+        Constructs a packed array from its words without copying or verifying them. The padding bits of the last word of each
+        row must be zero.
+        """
+        obj = object.__new__(cls)
+        obj._words = words
+        obj._shape = tuple(shape)
+        return obj
+
+    ###############################################################################
+    # Properties
+    ###############################################################################
+
+    @property
+    def words(self) -> np.ndarray:
+        """
+        numpy.ndarray: The :obj:`numpy.uint64` words with shape `(..., ceil(n / 64))`, where `n` is the length of the last axis.
+        Element `i` of a row is bit `i % 64` of word `i // 64`.
+        """
+        return self._words
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        tuple: The shape of the unpacked array.
+        """
+        return self._shape
+
+    @property
+    def ndim(self) -> int:
+        """
+        int: The number of dimensions of the unpacked array.
+        """
+        return len(self._shape)
+
+    @property
+    def size(self) -> int:
+        """
+        int: The number of elements in the unpacked array.
+        """
+        return int(np.prod(self._shape))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        int: The number of bytes used by the packed words.
+        """
+        return self._words.nbytes
+
+    ###############################################################################
+    # Conversion
+    ###############################################################################
+
+    def unpack(self) -> GF2:
+        r"""
+        Unpacks the bits into a :obj:`galois.GF2` array.
+
+        Returns
+        -------
+        galois.GF2
+            The unpacked :math:`\mathrm{GF}(2)` array with shape :obj:`shape`.
+
+        Examples
+        --------
+        .. ipython:: python
+
+            p = galois.GF2Packed([1, 0, 1, 1]); p
+            p.unpack()
+        """
+        return GF2._view(unpack(self._words, self._shape[-1]))
+
+    def copy(self) -> "GF2Packed":
+        """
+        Returns a copy of the packed array.
+        """
+        return GF2Packed._from_words(self._words.copy(), self._shape)
+
+    ###############################################################################
+    # Indexing
+    ###############################################################################
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        if len(key) < self.ndim and not any(k is Ellipsis or k is None for k in key):
+            # Only the leading axes are indexed, so the packed words are indexed directly
+            words = self._words[key]
+            return GF2Packed._from_words(words, words.shape[:-1] + self._shape[-1:])
+
+        item = self.unpack()[key]
+        return GF2Packed(item) if item.ndim >= 1 else item
+
+    ###############################################################################
+    # Arithmetic
+    ###############################################################################
+
+    def _verify_same_shape(self, other, operation):
+        if not isinstance(other, GF2Packed):
+            raise TypeError(f"Operation {operation!r} requires both operands to be galois.GF2Packed arrays, not {type(other)}.")
+        if not self._shape == other.shape:
+            raise ValueError(f"Operation {operation!r} requires both operands to have the same shape, not {self._shape} and {other.shape}.")
+
+    def __add__(self, other):
+        self._verify_same_shape(other, "add")
+        return GF2Packed._from_words(self._words ^ other.words, self._shape)
+
+    def __sub__(self, other):
+        self._verify_same_shape(other, "subtract")
+        return GF2Packed._from_words(self._words ^ other.words, self._shape)
+
+    def __xor__(self, other):
+        self._verify_same_shape(other, "bitwise_xor")
+        return GF2Packed._from_words(self._words ^ other.words, self._shape)
+
+    def __mul__(self, other):
+        self._verify_same_shape(other, "multiply")
+        return GF2Packed._from_words(self._words & other.words, self._shape)
+
+    def __and__(self, other):
+        self._verify_same_shape(other, "bitwise_and")
+        return GF2Packed._from_words(self._words & other.words, self._shape)
+
+    def __neg__(self):
+        return self.copy()
+
+    def __matmul__(self, other):
+        if not isinstance(other, GF2Packed):
+            raise TypeError(f"Operation 'matmul' requires both operands to be galois.GF2Packed arrays, not {type(other)}.")
+        if not (1 <= self.ndim <= 2 and other.ndim == 2):
+            raise ValueError(f"Operation 'matmul' requires the first operand to be 1-D or 2-D and the second operand to be 2-D, not {self.ndim}-D and {other.ndim}-D.")
+        if not self._shape[-1] == other.shape[0]:
+            raise ValueError(f"Operation 'matmul' requires the last dimension of A to match the first dimension of B, not {self._shape} and {other.shape}.")
+
+        A = self._words.reshape(-1, self._words.shape[-1])
+        C = matmul_xor(A, other.words)
+
+        return GF2Packed._from_words(C.reshape(self._shape[:-1] + other.words.shape[-1:]), self._shape[:-1] + other.shape[-1:])
+
+    def __eq__(self, other):
+        return isinstance(other, GF2Packed) and self._shape == other.shape and np.array_equal(self._words, other.words)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"GF2Packed(shape={self._shape}, nbytes={self.nbytes})"
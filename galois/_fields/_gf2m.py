@@ -9,6 +9,16 @@ from ._main import FieldClass, DirMeta
 MULTIPLY = lambda a, b, *args: a * b
 RECIPROCAL = lambda a, *args: 1 / a
 
+# Multiplying a scalar by an array with at least this many elements uses the scalar's product tables
+SCALAR_MULTIPLY_TABLE_MIN_SIZE = 1024
+
+# In "jit-lookup" mode, matrix multiplication with at least this many output columns uses product tables of the elements of A
+# instead of log/exp tables
+MATMUL_PRODUCT_TABLE_MIN_COLUMNS = 256
+
+# Number of columns of B and C processed at once by the log/exp table matrix multiplication
+MATMUL_BLOCK_COLUMNS = 512
+
 
 class GF2mMeta(FieldClass, DirMeta):
     """
@@ -19,6 +29,8 @@ class GF2mMeta(FieldClass, DirMeta):
     # Need to have a unique cache of "calculate" functions for GF(2^m)
     _FUNC_CACHE_CALCULATE = {}
 
+    _FUNCTION_CACHE_TABLE = {}
+
     def __init__(cls, name, bases, namespace, **kwargs):
         super().__init__(name, bases, namespace, **kwargs)
         cls._prime_subfield = kwargs["prime_subfield"]
@@ -38,14 +50,200 @@ class GF2mMeta(FieldClass, DirMeta):
         super()._compile_ufuncs()
 
         # Some explicit calculation functions are faster than using lookup tables. See https://github.com/mhostetter/galois/pull/92#issuecomment-835552639.
-        cls._ufuncs["add"] = np.bitwise_xor
-        cls._ufuncs["negative"] = np.positive
-        cls._ufuncs["subtract"] = np.bitwise_xor
+        for ufuncs in [cls._ufuncs, cls._ufuncs_parallel]:
+            ufuncs["add"] = np.bitwise_xor
+            ufuncs["negative"] = np.positive
+            ufuncs["subtract"] = np.bitwise_xor
+
+    def _ufunc_routine_multiply(cls, ufunc, method, inputs, kwargs, meta):
+        if cls.degree <= 16 and method == "__call__" and len(meta["non_field_operands"]) == 0 and kwargs.keys() <= {"casting", "out"}:
+            # Multiplying a large array by a single field element is done with that element's product tables
+            a, b = inputs
+            out = kwargs.get("out", (None,))[0]
+            if a.ndim == 0 and b.size >= SCALAR_MULTIPLY_TABLE_MIN_SIZE and cls._is_scalar_multiply_output(out, b.shape):
+                return cls._scalar_multiply(a, b, meta["dtype"], meta["target"], out=out)
+            if b.ndim == 0 and a.size >= SCALAR_MULTIPLY_TABLE_MIN_SIZE and cls._is_scalar_multiply_output(out, a.shape):
+                return cls._scalar_multiply(b, a, meta["dtype"], meta["target"], out=out)
+
+        return super()._ufunc_routine_multiply(ufunc, method, inputs, kwargs, meta)
+
+    def _matmul_batched(cls, A, B):
+        A = np.ascontiguousarray(A)
+        B = np.ascontiguousarray(B)
+        target = cls._target(A.size * B.shape[-1])
+        if cls.ufunc_mode == "jit-lookup" and (cls.degree > 16 or B.shape[-1] < MATMUL_PRODUCT_TABLE_MIN_COLUMNS):
+            return cls._function_table("matmul_log", target)(A, B, cls._EXP, cls._LOG)
+        if cls.degree <= 16:
+            return cls._function_table("matmul_product", target)(A, B, cls.degree, cls._irreducible_poly_int)
+        return super()._matmul_batched(A, B)
+
+    ###############################################################################
+    # Arithmetic using per-scalar product tables or log/exp tables
+    ###############################################################################
+
+    def _function_table(cls, name, target="cpu"):
+        """
+        Returns a JIT-compiled function that uses product tables or log/exp lookup tables. These functions are shared for all
+        GF(2^m) fields and are compiled for each array dtype on first use.
+        """
+        key = (name, target)
+
+        if key not in cls._FUNCTION_CACHE_TABLE:
+            function = getattr(cls, f"_{name}_table")
+            cls._FUNCTION_CACHE_TABLE[key] = numba.jit(nopython=True, parallel=target == "parallel", cache=True)(function)
+
+        return cls._FUNCTION_CACHE_TABLE[key]
+
+    def _scalar_multiply_tables(cls, c, dtype):
+        """
+        Returns the product tables LO and HI of the scalar c, such that c*x = LO[x & 0xFF] ^ HI[x >> 8] for x in GF(2^m) and m <= 16.
+
+        Multiplication by c is linear over GF(2), so c*x = c*(x & 0xFF) + c*((x >> 8) << 8). For m <= 8, HI = [0] and LO is the
+        full 256-entry product table of c.
+        """
+        assert cls.degree <= 16
+        multiply = cls._ufunc("multiply")
+        c = np.int64(c)
+        lo = np.arange(0, min(cls.order, 256), dtype=np.int64)
+        hi = np.arange(0, max(cls.order >> 8, 1), dtype=np.int64) << 8
+        LO = multiply(c, lo).astype(dtype)
+        HI = multiply(c, hi).astype(dtype)
+        return LO, HI
+
+    def _is_scalar_multiply_output(cls, out, shape):
+        """
+        Determines if the product tables can write the product directly into the output array `out` of the ufunc, if provided.
+        """
+        return out is None or (isinstance(out, cls) and out.shape == shape and out.flags.c_contiguous and out.flags.writeable)
+
+    def _scalar_multiply(cls, c, x, dtype=None, target="cpu", out=None):
+        """
+        Computes c*x for the scalar c and array x. The product is written to the C-contiguous field array `out`, if provided.
+        """
+        dtype = x.dtype if dtype is None else dtype
+        shape = x.shape
+
+        LO, HI = cls._scalar_multiply_tables(c, dtype if out is None else out.dtype)
+        x = np.ascontiguousarray(x.view(np.ndarray)).reshape(-1)
+        y = np.empty(x.size, dtype=dtype) if out is None else out.view(np.ndarray).reshape(-1)
+        cls._function_table("scalar_multiply", target)(x, LO, HI, y)
+
+        return cls._view(y.reshape(shape)) if out is None else out
+
+    def _scalar_multiply_accumulate(cls, y, c, x):
+        """
+        Computes y += c*x, in place, for the scalar c and arrays x and y with the same shape.
+        """
+        if not (cls.degree <= 16 and x.size >= SCALAR_MULTIPLY_TABLE_MIN_SIZE and y.flags.c_contiguous and y.flags.writeable):
+            return super()._scalar_multiply_accumulate(y, c, x)
+
+        LO, HI = cls._scalar_multiply_tables(c, y.dtype)
+        x = np.ascontiguousarray(x.view(np.ndarray)).reshape(-1)
+        cls._function_table("scalar_multiply_accumulate", cls._target(x.size))(y.view(np.ndarray).reshape(-1), x, LO, HI)
+
+        return y
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _scalar_multiply_table(x, LO, HI, y):  # pragma: no cover
+        for i in numba.prange(x.size):
+            y[i] = LO[x[i] & 0xFF] ^ HI[x[i] >> 8]
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _scalar_multiply_accumulate_table(y, x, LO, HI):  # pragma: no cover
+        for i in numba.prange(x.size):
+            y[i] ^= LO[x[i] & 0xFF] ^ HI[x[i] >> 8]
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _matmul_product_table(A, B, DEGREE, IRREDUCIBLE_POLY):  # pragma: no cover
+        """
+        Multiplication by a = A[l,i,k] is linear over GF(2). So the products a*x for every x < 2^8 (LO) and every x = y*2^8 (HI)
+        are formed with XORs from the products a*x^t, which are themselves repeated multiplications by x reduced by the
+        irreducible polynomial. Then row k of B is multiplied by a with one or two table lookups per element.
+        """
+        L, M, K = A.shape
+        N = B.shape[-1]
+        C = np.zeros((L, M, N), dtype=A.dtype)
+        lo_degree = min(DEGREE, 8)
+        hi_degree = DEGREE - lo_degree
+
+        for li in numba.prange(L*M):
+            l, i = li // M, li % M
+            c = C[l,i]
+            P = np.zeros(16, dtype=np.int64)
+            LO = np.zeros(256, dtype=A.dtype)
+            HI = np.zeros(256, dtype=A.dtype)
+            for k in range(K):
+                a = A[l,i,k]
+                if a == 0:
+                    continue
+                b = B[l,k]
+
+                # P[t] = a * x^t
+                p = np.int64(a)
+                for t in range(DEGREE):
+                    P[t] = p
+                    p <<= 1
+                    if p >> DEGREE:
+                        p ^= IRREDUCIBLE_POLY
+
+                for t in range(lo_degree):
+                    step = 1 << t
+                    for x in range(step):
+                        LO[step + x] = LO[x] ^ P[t]
+
+                if hi_degree == 0:
+                    for j in range(N):
+                        c[j] ^= LO[b[j]]
+                else:
+                    for t in range(hi_degree):
+                        step = 1 << t
+                        for x in range(step):
+                            HI[step + x] = HI[x] ^ P[8 + t]
+                    for j in range(N):
+                        c[j] ^= LO[b[j] & 0xFF] ^ HI[b[j] >> 8]
+
+        return C
+
+    @staticmethod
+    @numba.extending.register_jitable
+    def _matmul_log_table(A, B, EXP, LOG):  # pragma: no cover
+        """
+        Each product A[l,i,k]*B[l,k,j] is EXP[LOG[A[l,i,k]] + LOG[B[l,k,j]]], with the logarithms of B computed once. The columns
+        of B are processed in blocks so the block is reused, while in cache, by every row of A.
+        """
+        L, M, K = A.shape
+        N = B.shape[-1]
+        C = np.zeros((L, M, N), dtype=A.dtype)
+        LOG_B = np.zeros((K, N), dtype=np.int64)
+
+        for l in range(L):
+            for k in numba.prange(K):
+                for j in range(N):
+                    LOG_B[k,j] = LOG[B[l,k,j]] if B[l,k,j] != 0 else -1
+
+            for jj in range(0, N, MATMUL_BLOCK_COLUMNS):
+                jn = min(jj + MATMUL_BLOCK_COLUMNS, N)
+                for i in numba.prange(M):
+                    c = C[l,i]
+                    for k in range(K):
+                        a = A[l,i,k]
+                        if a == 0:
+                            continue
+                        log_a = LOG[a]
+                        log_b = LOG_B[k]
+                        for j in range(jj, jn):
+                            if log_b[j] >= 0:
+                                c[j] ^= EXP[log_a + log_b[j]]
+
+        return C
 
     def _set_globals(cls, name):
         global MULTIPLY, RECIPROCAL
 
-        if name in ["reciprocal", "divide", "power", "log"]:
+        if name in ["reciprocal", "divide", "power"]:
             MULTIPLY = cls._func_calculate("multiply")
         if name in ["divide", "power"]:
             RECIPROCAL = cls._func_calculate("reciprocal")
@@ -221,33 +419,6 @@ class GF2mMeta(FieldClass, DirMeta):
 
         return result
 
-    @staticmethod
-    @numba.extending.register_jitable
-    def _log_calculate(a, b, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):
-        """
-        TODO: Replace this with more efficient algorithm
-        a = α^m
-        b is a primitive element of the field
-
-        c = log(a, b)
-        a = b^c
-        """
-        if a == 0:
-            raise ArithmeticError("Cannot compute the discrete logarithm of 0 in a Galois field.")
-
-        ORDER = CHARACTERISTIC**DEGREE
-        a = int(a)
-        b = int(b)
-
-        # Naive algorithm
-        result = 1
-        for i in range(0, ORDER - 1):
-            if result == a:
-                break
-            result = MULTIPLY(result, b, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY)
-
-        return i
-
     ###############################################################################
     # Ufuncs written in NumPy operations (not JIT compiled)
     ###############################################################################
@@ -35,11 +35,84 @@ class GFpMeta(FieldClass, DirMeta):
             dtypes = [np.object_]
         return dtypes
 
-    def _ufunc(cls, name):
+    def _ufunc(cls, name, target="cpu"):
         # Some explicit calculation functions are faster than using lookup tables. See https://github.com/mhostetter/galois/pull/92#issuecomment-835548405.
-        if name not in cls._ufuncs and cls.ufunc_mode == "jit-lookup" and name in ["add", "negative", "subtract"]:
-            cls._ufuncs[name] = cls._ufunc_calculate(name)
-        return super()._ufunc(name)
+        ufuncs = cls._ufuncs_parallel if target == "parallel" else cls._ufuncs
+        if name not in ufuncs and cls.ufunc_mode == "jit-lookup" and name in ["add", "negative", "subtract"]:
+            ufuncs[name] = cls._ufunc_calculate(name, target)
+        return super()._ufunc(name, target)
+
+    ###############################################################################
+    # Arithmetic using native NumPy integer operations (not JIT compiled)
+    ###############################################################################
+
+    def _native_ufunc(cls, name, dtype):
+        """
+        Returns the native NumPy add, negative, subtract, or multiply function, if its intermediate results fit in the array's width.
+        """
+        if name in ["add", "negative", "subtract", "multiply"] and dtype.kind in "iu" and dtype.itemsize < 8:
+            bound = (cls.characteristic - 1)**2 if name == "multiply" else 2*cls.characteristic - 1
+            if bound <= np.iinfo(f"u{dtype.itemsize}").max:
+                return getattr(cls, f"_{name}_native")
+        return None
+
+    def _native_operands(cls, *inputs):
+        """
+        Returns p and the inputs as unsigned integers of the widest input's width. The field elements are non-negative, so inputs
+        of that width are viewed rather than copied.
+        """
+        dtype = np.dtype(f"u{max(x.dtype.itemsize for x in inputs)}")
+        return dtype.type(cls.characteristic), [x.view(dtype) if x.dtype.itemsize == dtype.itemsize else x.astype(dtype) for x in inputs]
+
+    @staticmethod
+    def _native_output(c, dtype, out):
+        """
+        Converts the unsigned result `c` to the output dtype, or writes it to the output array `out`.
+        """
+        if out is not None:
+            np.copyto(out, c, casting="unsafe")
+            return out
+        if c.dtype.itemsize == np.dtype(dtype).itemsize:
+            return c.view(dtype)
+        return c.astype(dtype)
+
+    def _add_native(cls, a, b, dtype, out=None):
+        """
+        c = a + b needs one subtraction of p if c >= p. In unsigned integers c - p wraps around to a value larger than c if c < p,
+        so the reduced sum is min(c, c - p).
+        """
+        P, (a, b) = cls._native_operands(a, b)
+        c = np.add(a, b)
+        np.minimum(c, c - P, out=c)
+        return cls._native_output(c, dtype, out)
+
+    def _negative_native(cls, a, dtype, out=None):
+        """
+        -a = p - a, which is reduced to 0 when a = 0 the same way as addition.
+        """
+        P, (a,) = cls._native_operands(a)
+        c = np.subtract(P, a)
+        np.minimum(c, c - P, out=c)
+        return cls._native_output(c, dtype, out)
+
+    def _subtract_native(cls, a, b, dtype, out=None):
+        """
+        c = a - b needs one addition of p if a < b. In unsigned integers c wraps around to a value larger than c + p if a < b,
+        so the reduced difference is min(c, c + p).
+        """
+        P, (a, b) = cls._native_operands(a, b)
+        c = np.subtract(a, b)
+        np.minimum(c, c + P, out=c)
+        return cls._native_output(c, dtype, out)
+
+    def _multiply_native(cls, a, b, dtype, out=None):
+        """
+        c = a * b mod p, for p small enough that (p - 1)^2 fits in the array's width.
+        """
+        P, (a, b) = cls._native_operands(a, b)
+        c = np.multiply(a, b)
+        np.remainder(c, P, out=c)
+        return cls._native_output(c, dtype, out)
 
     def _set_globals(cls, name):
         super()._set_globals(name)
@@ -197,33 +270,6 @@ class GFpMeta(FieldClass, DirMeta):
 
         return result
 
-    @staticmethod
-    @numba.extending.register_jitable
-    def _log_calculate(a, b, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):
-        """
-        TODO: Replace this with more efficient algorithm
-        a = α^m
-        b is a primitive element of the field
-
-        c = log(a, b)
-        a = b^c
-        """
-        if a == 0:
-            raise ArithmeticError("Cannot compute the discrete logarithm of 0 in a Galois field.")
-
-        ORDER = CHARACTERISTIC**DEGREE
-        a = int(a)
-        b = int(b)
-
-        # Naive algorithm
-        result = 1
-        for i in range(0, ORDER - 1):
-            if result == a:
-                break
-            result = (result * b) % CHARACTERISTIC
-
-        return i
-
     ###############################################################################
     # Ufuncs written in NumPy operations (not JIT compiled)
     ###############################################################################
@@ -57,7 +57,7 @@ class GFpmMeta(FieldClass, DirMeta):
         DTYPE = np.int64
         INT_TO_POLY = cls._func_calculate("int_to_poly", reset=False)
         POLY_TO_INT = cls._func_calculate("poly_to_int", reset=False)
-        if name in ["reciprocal", "divide", "power", "log"]:
+        if name in ["reciprocal", "divide", "power"]:
             MULTIPLY = cls._func_calculate("multiply", reset=False)
         if name in ["divide", "power"]:
             RECIPROCAL = cls._func_calculate("reciprocal", reset=False)
@@ -116,6 +116,12 @@ class GFpmMeta(FieldClass, DirMeta):
         else:
             return field.Vector(output, dtype=dtype)
 
+    def _write_output(cls, output, outputs):  # pylint: disable=no-self-use
+        if outputs is None:
+            return output
+        outputs[0][...] = output
+        return outputs[0]
+
     def _ufunc_routine_add(cls, ufunc, method, inputs, kwargs, meta):
         if cls.ufunc_mode == "jit-lookup" or method != "__call__":
             # Use the lookup ufunc on each array entry
@@ -123,10 +129,11 @@ class GFpmMeta(FieldClass, DirMeta):
         else:
             # Convert entire array to polynomial/vector representation, perform array operation in GF(p), and convert back to GF(p^m)
             cls._verify_operands_in_same_field(ufunc, inputs, meta)
+            outputs = kwargs.pop("out", None)
             inputs, kwargs = cls._convert_inputs_to_vector(inputs, kwargs)
             output = getattr(ufunc, method)(*inputs, **kwargs)
             output = cls._convert_output_from_vector(output, meta["field"], meta["dtype"])
-            return output
+            return cls._write_output(output, outputs)
 
     def _ufunc_routine_negative(cls, ufunc, method, inputs, kwargs, meta):
         if cls.ufunc_mode == "jit-lookup" or method != "__call__":
@@ -135,10 +142,11 @@ class GFpmMeta(FieldClass, DirMeta):
         else:
             # Convert entire array to polynomial/vector representation and perform array operation in GF(p)
             cls._verify_operands_in_same_field(ufunc, inputs, meta)
+            outputs = kwargs.pop("out", None)
             inputs, kwargs = cls._convert_inputs_to_vector(inputs, kwargs)
             output = getattr(ufunc, method)(*inputs, **kwargs)
             output = cls._convert_output_from_vector(output, meta["field"], meta["dtype"])
-            return output
+            return cls._write_output(output, outputs)
 
     def _ufunc_routine_subtract(cls, ufunc, method, inputs, kwargs, meta):
         if cls.ufunc_mode == "jit-lookup" or method != "__call__":
@@ -147,10 +155,11 @@ class GFpmMeta(FieldClass, DirMeta):
         else:
             # Convert entire array to polynomial/vector representation, perform array operation in GF(p), and convert back to GF(p^m)
             cls._verify_operands_in_same_field(ufunc, inputs, meta)
+            outputs = kwargs.pop("out", None)
             inputs, kwargs = cls._convert_inputs_to_vector(inputs, kwargs)
             output = getattr(ufunc, method)(*inputs, **kwargs)
             output = cls._convert_output_from_vector(output, meta["field"], meta["dtype"])
-            return output
+            return cls._write_output(output, outputs)
 
     ###############################################################################
     # Arithmetic functions using explicit calculation
@@ -353,33 +362,6 @@ class GFpmMeta(FieldClass, DirMeta):
 
         return result
 
-    @staticmethod
-    @numba.extending.register_jitable
-    def _log_calculate(a, b, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):
-        """
-        TODO: Replace this with more efficient algorithm
-        a = α^m
-        b is a primitive element of the field
-
-        c = log(a, b)
-        a = b^c
-        """
-        if a == 0:
-            raise ArithmeticError("Cannot compute the discrete logarithm of 0 in a Galois field.")
-
-        ORDER = CHARACTERISTIC**DEGREE
-        a = int(a)
-        b = int(b)
-
-        # Naive algorithm
-        result = 1
-        for i in range(0, ORDER - 1):
-            if result == a:
-                break
-            result = MULTIPLY(result, b, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY)
-
-        return i
-
     ###############################################################################
     # Ufuncs written in NumPy operations (not JIT compiled)
     ###############################################################################
@@ -3,10 +3,74 @@ A module that contains linear algebra routines over Galois fields.
 """
 import numpy as np
 
+from . import _packbits
 from ._dtypes import DTYPES
+from ._eliminator import IncrementalEliminator
 
 
-def _lapack_linalg(a, b, function, out=None, n_sum=None):
+# Every integer with magnitude at most 2^53 is exactly representable in float64
+FLOAT64_MANTISSA_BITS = 53
+
+# The bit width of the limbs that elements of large prime fields are split into for float64 products
+BLAS_LIMB_BITS = 16
+
+
+def _blas_bilinear(a, b, p, K, partial):
+    """
+    Computes a bilinear function of the integer arrays a and b, with elements in [0, p), exactly modulo p using float64
+    BLAS routines. Each output of the function is a sum of at most K products. `partial(a, b, k0, k1)` evaluates the
+    function on float64 arrays using only the terms k0 <= k < k1 of each sum.
+
+    The sums are split into blocks whose partial sums are below 2^53, so they are exact in float64, and the blocks are
+    reduced modulo p as integers. For large p, the elements are split into 16-bit limbs a = sum_i a_i 2^(16 i). The limb
+    products are computed the same way and recombined with Horner's method in 2^16.
+    """
+    bits = max(int(p - 1).bit_length(), 1)
+    if bits <= (FLOAT64_MANTISSA_BITS - 11) // 2:
+        # A single limb still leaves blocks of at least 2^11 terms
+        s, L = bits, 1
+    else:
+        s, L = BLAS_LIMB_BITS, -(-bits // BLAS_LIMB_BITS)
+    max_product = min(p - 1, 2**s - 1)**2
+    K_block = max(2**FLOAT64_MANTISSA_BITS // max(max_product, 1), 1)
+
+    # The integer dtype of the accumulators, which must hold p * 2^s without overflowing
+    dtype = np.int64 if p < 2**(62 - s) else np.object_
+
+    if dtype == np.object_ and K <= L**2:
+        # With fewer terms in each sum than limb products, exact Python integer arithmetic is cheaper
+        return np.asarray(partial(a.astype(np.object_), b.astype(np.object_), 0, K) % p)
+
+    def limbs(x):
+        if L == 1:
+            return [x.astype(np.float64)]
+        return [np.asarray((x >> (s*i)) & (2**s - 1)).astype(np.float64) for i in range(L)]
+
+    def product(x, y):
+        # The exact sum of the products of x and y modulo p
+        z = 0
+        for k0 in range(0, max(K, 1), K_block):
+            block = np.asarray(partial(x, y, k0, min(k0 + K_block, K))).astype(np.int64).astype(dtype)
+            z = (z + block) % p
+        return z
+
+    a_limbs = limbs(a)
+    b_limbs = limbs(b)
+
+    # D[t] = sum_{i + j = t} a_i b_j
+    D = [0]*(2*L - 1)
+    for i in range(L):
+        for j in range(L):
+            D[i + j] = (D[i + j] + product(a_limbs[i], b_limbs[j])) % p
+
+    c = D[-1]
+    for t in range(2*L - 3, -1, -1):
+        c = (c * 2**s + D[t]) % p
+
+    return np.asarray(c)
+
+
+def _lapack_linalg(a, b, function, out=None):
     """
     In prime fields GF(p), it's much more efficient to use LAPACK/BLAS implementations of linear algebra
     and then reduce modulo p rather than compute manually.
@@ -24,32 +88,71 @@ def _lapack_linalg(a, b, function, out=None, n_sum=None):
     a = a.view(np.ndarray)
     b = b.view(np.ndarray)
 
-    # Determine the minimum dtype to hold the entire product and summation without overflowing
-    if n_sum is None:
-        n_sum = 1 if len(a.shape) == 0 else max(a.shape)
-    max_value = n_sum * (characteristic - 1)**2
-    dtypes = [dtype for dtype in DTYPES if np.iinfo(dtype).max >= max_value]
-    dtype = np.object_ if len(dtypes) == 0 else dtypes[0]
-    a = a.astype(dtype)
-    b = b.astype(dtype)
-
-    # Compute result using native numpy LAPACK/BLAS implementation
-    if function in [np.inner, np.vdot]:
-        # These functions don't have and `out` keyword argument
-        c = function(a, b)
+    if function is np.outer:
+        # The outer product has no summation, so the products are computed in the minimum integer dtype that holds them
+        max_value = (characteristic - 1)**2
+        dtypes = [dtype for dtype in DTYPES if np.iinfo(dtype).max >= max_value]
+        dtype = np.object_ if len(dtypes) == 0 else dtypes[0]
+        c = function(a.astype(dtype), b.astype(dtype)) % characteristic
     else:
-        c = function(a, b, out=out)
-    c = c % characteristic  # Reduce the result mod p
-
-    if np.isscalar(c):
-        # TODO: Sometimes the scalar c is a float?
+        if function is np.vdot:
+            a, b, function = a.flatten(), b.flatten(), np.dot
+
+        # The summation is over the last axis of `a` and the last (np.inner), second-to-last (np.dot, np.matmul), or only
+        # axis of `b`
+        if a.ndim == 0 or b.ndim == 0:
+            K = 1
+            axis = None
+        else:
+            K = a.shape[-1]
+            axis = b.ndim - 1 if (function is np.inner or b.ndim == 1) else b.ndim - 2
+            if not b.shape[axis] == K:
+                axis = None  # The single block is computed on the full arrays so NumPy raises the appropriate error
+
+        def partial(x, y, k0, k1):
+            if axis is None or (k0 == 0 and k1 == K):
+                return function(x, y)
+            idxs = [slice(None)]*y.ndim
+            idxs[axis] = slice(k0, k1)
+            return function(x[...,k0:k1], y[tuple(idxs)])
+
+        c = _blas_bilinear(a, b, characteristic, K, partial)
+
+    if c.ndim == 0:
         c = field(int(c), dtype=return_dtype)
     else:
-        c = c.astype(return_dtype).view(field)
+        c = field._view(c.astype(return_dtype))
+
+    if out is not None:
+        out = out[0] if isinstance(out, tuple) else out
+        out[...] = c
+        return out
 
     return c
 
 
+def _lapack_convolve(a, b):
+    """
+    Computes the convolution of the 1-D GF(p) arrays a and b with float64 arithmetic, in blocks of `a` whose partial
+    sums are exact, and then reduces modulo p.
+    """
+    assert type(a).is_prime_field
+    field = type(a)
+    return_dtype = a.dtype
+    a = a.view(np.ndarray)
+    b = b.view(np.ndarray)
+    N = a.size + b.size - 1
+
+    def partial(x, y, k0, k1):
+        c = np.zeros(N, dtype=x.dtype)
+        c[k0:k1 + y.size - 1] = np.convolve(x[k0:k1], y)
+        return c
+
+    c = _blas_bilinear(a, b, field.characteristic, a.size, partial)
+
+    return field._view(c.astype(return_dtype))
+
+
 ###############################################################################
 # Matrix/vector products
 ###############################################################################
@@ -119,7 +222,7 @@ def outer(a, b, out=None):  # pylint: disable=unused-argument
         raise TypeError(f"Operation 'outer' requires both arrays be in the same Galois field, not {type(a)} and {type(b)}.")
 
     if type(a).is_prime_field:
-        return _lapack_linalg(a, b, np.outer, out=out, n_sum=1)
+        return _lapack_linalg(a, b, np.outer, out=out)
     else:
         return np.multiply.outer(a.ravel(), b.ravel(), out=out)
 
@@ -133,57 +236,61 @@ def row_reduce(A, ncols=None):
         raise ValueError(f"Only 2-D matrices can be converted to reduced row echelon form, not {A.ndim}-D.")
 
     ncols = A.shape[1] if ncols is None else ncols
-    A_rre = A.copy()
-    p = 0  # The pivot
 
-    for j in range(ncols):
-        # Find a pivot in column `j` at or below row `p`
-        idxs = np.nonzero(A_rre[p:,j])[0]
-        if idxs.size == 0:
-            continue
-        i = p + idxs[0]  # Row with a pivot
+    if type(A).order == 2:
+        # Over GF(2), eliminate on bits packed 64 per word using the Method of Four Russians
+        A_rre, p = _packbits.row_reduce(A.view(np.ndarray), ncols)
+        return type(A)._view(A_rre.astype(A.dtype)), p
 
-        # Swap row `p` and `i`. The pivot is now located at row `p`.
-        A_rre[[p,i],:] = A_rre[[i,p],:]
+    A_rre, _, p = type(A)._gaussian_elimination(A, ncols, 0)
 
-        # Force pivot value to be 1
-        A_rre[p,:] /= A_rre[p,j]
+    return A_rre, int(p)
 
-        # Force zeros above and below the pivot
-        idxs = np.nonzero(A_rre[:,j])[0].tolist()
-        idxs.remove(p)
-        A_rre[idxs,:] -= np.multiply.outer(A_rre[idxs,j], A_rre[p,:])
 
-        p += 1
-        if p == A_rre.shape[0]:
-            break
+def _row_reduce_stacked(A, ncols):
+    """
+    Row reduces each matrix of the (..., m, n) array A over its first `ncols` columns. Returns the reduced matrices and
+    their ranks.
+    """
+    if A.ndim == 2:
+        return row_reduce(A, ncols=ncols)
+
+    A_rre, _, rank = type(A)._gaussian_elimination(A, ncols, 0)
+
+    return A_rre, rank
+
+
+def _verify_full_rank(rank, n):
+    if not np.all(rank == n):
+        raise np.linalg.LinAlgError(f"Argument `A` is singular and not invertible because it does not have full rank of {n}, but rank of {np.min(rank)}.")
 
-    return A_rre, p
+
+def _lu_split(LU):
+    """
+    Splits the compact LU factorization into the unit lower triangular L and the upper triangular U.
+    """
+    field = type(LU)
+    m, n = LU.shape
+    idxs = np.tril_indices(m, -1, min(m, n))
+
+    L = field.Identity(m, dtype=LU.dtype)
+    L[idxs] = LU[idxs]
+    U = LU
+    U[idxs] = 0
+
+    return L, U
 
 
 def lu_decompose(A):
     if not A.ndim == 2:
         raise ValueError(f"Argument `A` must be a 2-D matrix, not have shape {A.shape}.")
 
-    field = type(A)
-    n = A.shape[0]
-    Ai = A.copy()
-    L = field.Identity(n)
-
-    for i in range(0, n-1):
-        if Ai[i,i] == 0:
-            idxs = np.nonzero(Ai[i:,i])[0]  # The first non-zero entry in column `i` below row `i`
-            if idxs.size == 0:  # pylint: disable=no-else-continue
-                L[i,i] = 1
-                continue
-            else:
-                raise ValueError("The LU decomposition of `A` does not exist. Use the LUP decomposition instead.")
-
-        l = Ai[i+1:,i] / Ai[i,i]
-        Ai[i+1:,:] -= np.multiply.outer(l, Ai[i,:])
-        L[i+1:,i] = l
+    m, n = A.shape
+    LU, _, status = type(A)._gaussian_elimination(A, min(m - 1, n), 1)
+    if int(status) == -1:
+        raise ValueError("The LU decomposition of `A` does not exist. Use the LUP decomposition instead.")
 
-    U = Ai
+    L, U = _lu_split(LU)
 
     return L, U
 
@@ -193,36 +300,14 @@ def plu_decompose(A):
         raise ValueError(f"Argument `A` must be a 2-D matrix, not have shape {A.shape}.")
 
     field = type(A)
-    n = A.shape[0]
-    Ai = A.copy()
-    L = field.Zeros((n,n))
-    P = field.Identity(n)  # Row permutation matrix
-    N_permutations = 0  # Number of permutations
-
-    for i in range(0, n-1):
-        if Ai[i,i] == 0:
-            idxs = np.nonzero(Ai[i:,i])[0]  # The first non-zero entry in column `i` below row `i`
-            if idxs.size == 0:
-                L[i,i] = 1
-                continue
-            j = i + idxs[0]
-
-            # Swap rows `i` and `j`
-            P[[i,j],:] = P[[j,i],:]
-            Ai[[i,j],:] = Ai[[j,i],:]
-            L[[i,j],:] = L[[j,i],:]
-            N_permutations += 1
-
-        l = Ai[i+1:,i] / Ai[i,i]
-        Ai[i+1:,:] -= np.multiply.outer(l, Ai[i,:])  # Zero out rows below row `i`
-        L[i,i] = 1  # Set 1 on the diagonal
-        L[i+1:,i] = l
-
-    L[-1,-1] = 1  # Set the final diagonal to 1
-    U = Ai
+    m, n = A.shape
+    LU, perm, N_permutations = field._gaussian_elimination(A, min(m - 1, n), 2)
+
+    L, U = _lu_split(LU)
+    P = field.Identity(m, dtype=A.dtype)[perm,:]  # Row permutation matrix
 
     # NOTE: Return column permutation matrix
-    return P.T, L, U, N_permutations
+    return P.T, L, U, int(N_permutations)
 
 
 ###############################################################################
@@ -230,74 +315,84 @@ def plu_decompose(A):
 ###############################################################################
 
 def matrix_rank(A):
-    A_rre, _ = row_reduce(A)
-    rank = np.sum(~np.all(A_rre == 0, axis=1))
+    if A.ndim > 2:
+        _, _, rank = type(A)._gaussian_elimination(A, A.shape[-1], 0)
+        return rank
+
+    _, rank = row_reduce(A)
 
     return rank
 
 
 def inv(A):
-    if not (A.ndim == 2 and A.shape[0] == A.shape[1]):
+    if not (A.ndim >= 2 and A.shape[-2] == A.shape[-1]):
         raise np.linalg.LinAlgError(f"Argument `A` must be square, not {A.shape}.")
     field = type(A)
-    n = A.shape[0]
-    I = field.Identity(n, dtype=A.dtype)
+    n = A.shape[-1]
+    I = np.broadcast_to(field.Identity(n, dtype=A.dtype), A.shape)
 
-    # Concatenate A and I to get the matrix AI = [A | I]
+    # Concatenate A and I to get the matrices AI = [A | I]
     AI = np.concatenate((A, I), axis=-1)
 
-    # Perform Gaussian elimination to get the reduced row echelon form AI_rre = [I | A^-1]
-    AI_rre, _ = row_reduce(AI, ncols=n)
-
-    # The rank is the number of non-zero rows of the row reduced echelon form
-    rank = np.sum(~np.all(AI_rre[:,0:n] == 0, axis=1))
-    if not rank == n:
-        raise np.linalg.LinAlgError(f"Argument `A` is singular and not invertible because it does not have full rank of {n}, but rank of {rank}.")
+    # Perform Gaussian elimination to get the reduced row echelon forms AI_rre = [I | A^-1]
+    # The rank is the number of pivots in the first n columns
+    AI_rre, rank = _row_reduce_stacked(AI, n)
+    _verify_full_rank(rank, n)
 
-    A_inv = AI_rre[:,-n:]
+    A_inv = AI_rre[...,-n:]
 
     return A_inv
 
 
-def triangular_det(A):
-    if not (A.ndim == 2 and A.shape[0] == A.shape[1]):
-        raise np.linalg.LinAlgError(f"Argument `A` must be square, not {A.shape}.")
-    idxs = np.arange(0, A.shape[0])
-    return np.multiply.reduce(A[idxs,idxs])
-
-
 def det(A):
-    if not (A.ndim == 2 and A.shape[0] == A.shape[1]):
+    if not (A.ndim >= 2 and A.shape[-2] == A.shape[-1]):
         raise np.linalg.LinAlgError(f"Argument `A` must be square, not {A.shape}.")
 
     field = type(A)
-    n = A.shape[0]
+    n = A.shape[-1]
 
     if n == 2:
-        return A[0,0]*A[1,1] - A[0,1]*A[1,0]
+        return A[...,0,0]*A[...,1,1] - A[...,0,1]*A[...,1,0]
     elif n == 3:
-        return A[0,0]*(A[1,1]*A[2,2] - A[1,2]*A[2,1]) - A[0,1]*(A[1,0]*A[2,2] - A[1,2]*A[2,0]) + A[0,2]*(A[1,0]*A[2,1] - A[1,1]*A[2,0])
+        return A[...,0,0]*(A[...,1,1]*A[...,2,2] - A[...,1,2]*A[...,2,1]) - A[...,0,1]*(A[...,1,0]*A[...,2,2] - A[...,1,2]*A[...,2,0]) + A[...,0,2]*(A[...,1,0]*A[...,2,1] - A[...,1,1]*A[...,2,0])
     else:
-        P, L, U, N_permutations = plu_decompose(A)
-        P = P.T  # Convert row permutation matrix into column permutation matrix
+        # The compact PLU factorization has U on its diagonal, and det(L) = 1
+        LU, _, N_permutations = field._gaussian_elimination(A, n - 1, 2)
         det_P = (-field(1)) ** N_permutations
-        det_L = triangular_det(L)
-        det_U = triangular_det(U)
-        return det_P * det_L * det_U
+        det_U = np.multiply.reduce(np.diagonal(LU, axis1=-2, axis2=-1), axis=-1)
+        return det_P * det_U
 
 
 def solve(A, b):
     if not type(A) is type(b):
         raise TypeError(f"Arguments `A` and `b` must be of the same Galois field array class, not {type(A)} and {type(b)}.")
-    if not (A.ndim == 2 and A.shape[0] == A.shape[1]):
+    if not (A.ndim >= 2 and A.shape[-2] == A.shape[-1]):
         raise np.linalg.LinAlgError(f"Argument `A` must be square, not {A.shape}.")
-    if not b.ndim in [1, 2]:
+    if not b.ndim in [A.ndim - 1, A.ndim]:
         raise np.linalg.LinAlgError(f"Argument `b` must have dimension equal to A or one less, not {b.ndim}.")
-    if not A.shape[-1] == b.shape[0]:
+
+    # Like np.linalg.solve() in NumPy 1.x, `b` is a stack of vectors if it has one less dimension than A, otherwise a stack of
+    # matrices. So a single vector `b` with stacked `A` must be broadcast by the caller, e.g. with `np.broadcast_to(b, A.shape[:-1])`.
+    vector = b.ndim == A.ndim - 1
+    B = b[...,np.newaxis] if vector else b
+    if not A.shape[-1] == B.shape[-2]:
         raise np.linalg.LinAlgError(f"The last dimension of `A` must equal the first dimension of `b`, not {A.shape} and {b.shape}.")
 
-    A_inv = inv(A)
-    x = A_inv @ b
+    n = A.shape[-1]
+    batch_shape = np.broadcast(np.empty(A.shape[:-2], dtype=bool), np.empty(B.shape[:-2], dtype=bool)).shape
+    A = np.broadcast_to(A, batch_shape + A.shape[-2:])
+    B = np.broadcast_to(B, batch_shape + B.shape[-2:])
+
+    # Concatenate A and B to get the matrices AB = [A | B]
+    AB = np.concatenate((A, B), axis=-1)
+
+    # Perform Gaussian elimination to get the reduced row echelon forms AB_rre = [I | A^-1 B]
+    AB_rre, rank = _row_reduce_stacked(AB, n)
+    _verify_full_rank(rank, n)
+
+    x = AB_rre[...,n:]
+    if vector:
+        x = x[...,0]
 
     return x
 
@@ -309,8 +404,7 @@ def row_space(A):
     if not A.ndim == 2:
         raise ValueError(f"Only 2-D matrices have a row space, not {A.ndim}-D.")
 
-    A_rre, _ = row_reduce(A)
-    rank = np.sum(~np.all(A_rre == 0, axis=1))
+    A_rre, rank = row_reduce(A)
     R = A_rre[0:rank,:]
 
     return R
@@ -360,3 +454,106 @@ def null_space(A):
         raise ValueError(f"Only 2-D matrices have a null space, not {A.ndim}-D.")
 
     return left_null_space(A.T)
+
+
+###############################################################################
+# Characteristic and minimal polynomials
+###############################################################################
+
+def _hessenberg(A):
+    """
+    Reduces the square matrix A to an upper Hessenberg matrix H = L^-1 P^T A P L by Gaussian similarity transformations,
+    using O(n^3) field operations. The characteristic polynomial is invariant under similarity.
+    """
+    H = A.copy()
+    n = H.shape[0]
+
+    for k in range(0, n - 2):
+        # Find a non-zero pivot below the subdiagonal of column k
+        idxs = np.flatnonzero(H[k+1:,k].view(np.ndarray))
+        if idxs.size == 0:
+            continue
+        r = k + 1 + idxs[0]
+        if r != k + 1:
+            H[[k+1, r],:] = H[[r, k+1],:]
+            H[:,[k+1, r]] = H[:,[r, k+1]]
+
+        u = H[k+2:,k] / H[k+1,k]
+        if np.count_nonzero(u.view(np.ndarray)) == 0:
+            continue
+
+        # Subtract multiples of row k + 1 to zero column k below the subdiagonal, then apply the inverse column operations
+        H[k+2:,k:] -= u[:,np.newaxis] * H[k+1,k:]
+        H[:,k+1] += H[:,k+2:] @ u
+
+    return H
+
+
+def characteristic_poly(A):
+    """
+    Returns the descending coefficients of det(xI - A).
+
+    The recurrence over the leading principal submatrices of the upper Hessenberg matrix H is
+
+        p_m(x) = (x - H[m-1,m-1]) p_{m-1}(x) - sum_{i < m-1} H[i,m-1] H[i+1,i] ... H[m-1,m-2] p_i(x)
+
+    which uses O(n^3) field operations in total.
+    """
+    field = type(A)
+    n = A.shape[0]
+    H = _hessenberg(A)
+
+    # Row m holds the ascending coefficients of p_m(x)
+    P = field.Zeros((n + 1, n + 1), dtype=A.dtype)
+    P[0,0] = 1
+    for m in range(1, n + 1):
+        k = m - 1
+        P[m,1:] = P[k,:-1]
+        P[m] -= H[k,k] * P[k]
+        if k > 0:
+            # The products of the subdiagonal entries H[i+1,i] ... H[k,k-1] for i = 0, ..., k - 1
+            sub = np.diagonal(H, -1)[:k]
+            c = H[:k,k] * np.multiply.accumulate(sub[::-1])[::-1]
+            P[m] -= c @ P[:k]
+
+    return P[n][::-1]
+
+
+def local_minimal_polys(A):
+    """
+    Returns the descending coefficients of the minimal polynomials of vectors whose Krylov subspaces span the whole space.
+    Their least common multiple is the minimal polynomial of A.
+
+    The minimal polynomial of v is found by reducing the Krylov vectors v, Av, A^2v, ... as they are generated, tracking
+    each one's combination of powers of A. The first vector that reduces to zero gives the monic relation. A unit vector
+    already in the span of the previous Krylov subspaces, which is A-invariant, is annihilated by their lcm and is skipped.
+    """
+    field = type(A)
+    n = A.shape[0]
+    I = field.Identity(n + 1, dtype=A.dtype)
+    span = IncrementalEliminator(field, n, dtype=A.dtype)
+
+    polys = []
+    for i in range(n):
+        if not span.add(field.Identity(n, dtype=A.dtype)[i]):
+            continue
+
+        # The rows are [A^k v | x^k], with the ascending coefficients of the powers of A as the payload
+        krylov = IncrementalEliminator(field, n, payload_size=n + 1, dtype=A.dtype)
+        vectors = []
+        w = field.Identity(n, dtype=A.dtype)[i]
+        for k in range(n + 1):
+            row = krylov._reduce(np.concatenate((w, I[k])))
+            if np.count_nonzero(row[:n].view(np.ndarray)) == 0:
+                break
+            krylov._insert(row)
+            vectors.append(w)
+            w = A @ w
+
+        polys.append(row[n:n+k+1][::-1])
+        span.add(np.stack(vectors))
+
+        if span.is_complete:
+            break
+
+    return polys
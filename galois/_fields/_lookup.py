@@ -1,12 +1,22 @@
 """
 A module that contains a metaclass mixin that provides generic Galois field arithmetic using lookup tables.
 """
+import os
+
 import numba
 from numba import int64
 import numpy as np
 
 from ._calculate import CalculateMeta
 
+# An optional directory that persists the EXP, LOG, and ZECH_LOG lookup tables across processes
+LOOKUP_TABLE_CACHE_ENV = "GALOIS_LOOKUP_TABLE_CACHE"
+
+# An optional flag that memory-maps the cached lookup tables read-only, rather than reading them into private memory, so all
+# processes share one copy of the tables in the page cache. Placing the cache directory in shared memory, e.g. /dev/shm, keeps
+# the tables in RAM.
+LOOKUP_TABLE_MMAP_ENV = "GALOIS_LOOKUP_TABLE_MMAP"
+
 
 class LookupMeta(CalculateMeta):
     """
@@ -14,10 +24,6 @@ class LookupMeta(CalculateMeta):
     """
     # pylint: disable=no-value-for-parameter,abstract-method,unused-argument
 
-    # Function signatures for JIT-compiled "lookup" arithmetic functions
-    _UNARY_LOOKUP_SIG = numba.types.FunctionType(int64(int64, int64[:], int64[:], int64[:], int64))
-    _BINARY_LOOKUP_SIG = numba.types.FunctionType(int64(int64, int64, int64[:], int64[:], int64[:], int64))
-
     _FUNC_CACHE_LOOKUP = {}
     _UFUNC_CACHE_LOOKUP = {}
 
@@ -36,69 +42,137 @@ class LookupMeta(CalculateMeta):
         if cls._EXP.size > 0:
             return
 
-        order = cls.order
-        primitive_element = int(cls.primitive_element)
-        add = cls._ufunc_python("add")
-        multiply = cls._ufunc_python("multiply")
+        if cls._load_lookup_tables():
+            return
 
-        cls._EXP = np.zeros(2*order, dtype=np.int64)
-        cls._LOG = np.zeros(order, dtype=np.int64)
-        cls._ZECH_LOG = np.zeros(order, dtype=np.int64)
+        order = cls.order
+        dtype = cls._lookup_table_dtype()
+        cls._EXP = np.zeros(2*order, dtype=dtype)
+        cls._LOG = np.zeros(order, dtype=dtype)
+        cls._ZECH_LOG = np.zeros(order, dtype=dtype)
         if cls.characteristic == 2:
             cls._ZECH_E = 0
         else:
             cls._ZECH_E = (cls.order - 1) // 2
 
-        element = 1
-        cls._EXP[0] = element
-        cls._LOG[0] = 0  # Technically -Inf
-        for i in range(1, order):
-            # Increment by multiplying by the primitive element, which is a multiplicative generator of the field
-            element = multiply(element, primitive_element)
-            cls._EXP[i] = element
-
-            # Assign to the log lookup table but skip indices greater than or equal to `order - 1`
-            # because `EXP[0] == EXP[order - 1]`
-            if i < order - 1:
-                cls._LOG[cls._EXP[i]] = i
-
-        # Compute Zech log lookup table
-        for i in range(0, order):
-            one_plus_element = add(1, cls._EXP[i])
-            cls._ZECH_LOG[i] = cls._LOG[one_plus_element]
+        # Generate the powers of the primitive element, and their logarithms, with the JIT-compiled arithmetic functions
+        multiply = cls._func_calculate("multiply")
+        is_unique = cls._func_lookup("build_lookup_tables")(cls._EXP, cls._LOG, cls._ZECH_LOG, int(cls.primitive_element), multiply, cls.characteristic, cls.degree, cls._irreducible_poly_int)
 
+        if not is_unique:
+            raise RuntimeError(f"The anti-log lookup table for {cls.name} is not unique, which means the primitive element {cls.primitive_element} has order less than {order - 1} and is not a multiplicative generator of {cls.name}.")
         if not cls._EXP[order - 1] == 1:
             raise RuntimeError(f"The anti-log lookup table for {cls.name} is not cyclic with size {order - 1}, which means the primitive element {cls.primitive_element} does not have multiplicative order {order - 1} and therefore isn't a multiplicative generator for {cls.name}.")
-        if not len(set(cls._EXP[0:order - 1])) == order - 1:
-            raise RuntimeError(f"The anti-log lookup table for {cls.name} is not unique, which means the primitive element {cls.primitive_element} has order less than {order - 1} and is not a multiplicative generator of {cls.name}.")
-        if not len(set(cls._LOG[1:order])) == order - 1:
-            raise RuntimeError(f"The log lookup table for {cls.name} is not unique.")
 
         # Double the EXP table to prevent computing a `% (order - 1)` on every multiplication lookup
         cls._EXP[order:2*order] = cls._EXP[1:1 + order]
 
-    def _func_lookup(cls, name):  # pylint: disable=no-self-use
+        cls._save_lookup_tables()
+
+        # Replace the private tables with the shared memory-mapped ones, if requested
+        if os.environ.get(LOOKUP_TABLE_MMAP_ENV, None):
+            cls._load_lookup_tables()
+
+    def _lookup_table_dtype(cls):
+        """
+        Returns the narrowest signed integer dtype of the lookup tables, which store field elements and their logarithms. Signed
+        integers are used so that differences of logarithms are computed without wrapping.
+        """
+        for dtype in [np.int8, np.int16, np.int32]:
+            if cls.order - 1 <= np.iinfo(dtype).max:
+                return dtype
+        return np.int64
+
+    def _lookup_tables_path(cls):
+        """
+        Returns the cache file path of the lookup tables for this field, or `None` if the lookup table cache is disabled.
+        """
+        directory = os.environ.get(LOOKUP_TABLE_CACHE_ENV, None)
+        if not directory:
+            return None
+
+        # The tables are uniquely determined by the field's irreducible polynomial and primitive element
+        filename = f"{cls.characteristic}_{cls.degree}_{cls._irreducible_poly_int}_{int(cls.primitive_element)}.npy"
+        return os.path.join(directory, filename)
+
+    def _load_lookup_tables(cls):
+        """
+        Loads the EXP, LOG, and ZECH_LOG lookup tables from the cache directory. Returns `True` if the tables were loaded.
+
+        The tables are memory-mapped read-only if the `GALOIS_LOOKUP_TABLE_MMAP` environment variable is set. Then the JIT-compiled
+        functions of every process read the same physical pages. The ufuncs do too for tables larger than 1 MB, which Numba
+        references by address rather than copying into the compiled code.
+        """
+        path = cls._lookup_tables_path()
+        if path is None or not os.path.exists(path):
+            return False
+
+        mmap_mode = "r" if os.environ.get(LOOKUP_TABLE_MMAP_ENV, None) else None
+        try:
+            tables = np.load(path, mmap_mode=mmap_mode)
+        except (OSError, ValueError):
+            return False
+
+        # The tables are stored concatenated as [EXP | LOG | ZECH_LOG]
+        order = cls.order
+        if not (tables.dtype == cls._lookup_table_dtype() and tables.shape == (4*order,)):
+            return False
+        tables = tables.view(np.ndarray)
+
+        cls._EXP = tables[0:2*order]
+        cls._LOG = tables[2*order:3*order]
+        cls._ZECH_LOG = tables[3*order:4*order]
+        cls._ZECH_E = 0 if cls.characteristic == 2 else (cls.order - 1) // 2
+
+        return True
+
+    def _save_lookup_tables(cls):
+        """
+        Saves the EXP, LOG, and ZECH_LOG lookup tables to the cache directory, if one is specified.
+        """
+        path = cls._lookup_tables_path()
+        if path is None:
+            return
+
+        # Write to a temporary file and then atomically replace the cache so concurrent processes never read a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.concatenate((cls._EXP, cls._LOG, cls._ZECH_LOG)))
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _func_lookup(cls, name):
         """
-        Returns an arithmetic function using lookup tables. These functions are once-compiled and shared for all Galois fields. The only difference
-        between Galois fields are the lookup tables that are passed in as inputs.
+        Returns an arithmetic function using lookup tables. These functions are compiled once for each lookup table dtype and shared for
+        all Galois fields. The only difference between Galois fields are the lookup tables that are passed in as inputs.
         """
-        key = (name,)
+        dtype = cls._lookup_table_dtype()
+        key = (name, dtype)
 
         if key not in cls._FUNC_CACHE_LOOKUP:
             function = getattr(cls, f"_{name}_lookup")
-            if cls._UFUNC_TYPE[name] == "unary":
-                cls._FUNC_CACHE_LOOKUP[key] = numba.jit("int64(int64, int64[:], int64[:], int64[:], int64)", nopython=True, cache=True)(function)
+            table = numba.from_dtype(dtype)[:]
+            if name == "build_lookup_tables":
+                sig = numba.types.boolean(table, table, table, int64, cls._BINARY_CALCULATE_SIG, int64, int64, int64)
+            elif cls._UFUNC_TYPE[name] == "unary":
+                sig = int64(int64, table, table, table, int64)
             else:
-                cls._FUNC_CACHE_LOOKUP[key] = numba.jit("int64(int64, int64, int64[:], int64[:], int64[:], int64)", nopython=True, cache=True)(function)
+                sig = int64(int64, int64, table, table, table, int64)
+            cls._FUNC_CACHE_LOOKUP[key] = numba.jit(sig, nopython=True, cache=True)(function)
 
         return cls._FUNC_CACHE_LOOKUP[key]
 
-    def _ufunc_lookup(cls, name):
+    def _ufunc_lookup(cls, name, target="cpu"):
         """
         Returns an arithmetic ufunc using lookup tables. These ufuncs are compiled for each Galois field since the lookup tables are compiled
-        into the ufuncs as constants.
+        into the ufuncs as constants. The compiled ufuncs for small fields are also cached on disk by numba, keyed by the lookup tables, so
+        other processes load them instead of recompiling.
         """
-        key = (name, cls.characteristic, cls.degree, cls._irreducible_poly_int)
+        key = (name, cls.characteristic, cls.degree, cls._irreducible_poly_int, target)
 
         if key not in cls._UFUNC_CACHE_LOOKUP:
             # These variables must be locals for Numba to compile them as literals
@@ -107,14 +181,78 @@ class LookupMeta(CalculateMeta):
             ZECH_LOG = cls._ZECH_LOG
             ZECH_E = cls._ZECH_E
 
+            # Numba can only cache compiled code whose constant arrays are embedded in it, which it only does for arrays up to 1 MB
+            cache = EXP.nbytes <= 10**6
+
             function = getattr(cls, f"_{name}_lookup")
             if cls._UFUNC_TYPE[name] == "unary":
-                cls._UFUNC_CACHE_LOOKUP[key] = numba.vectorize(["int64(int64)"], nopython=True)(lambda a: function(a, EXP, LOG, ZECH_LOG, ZECH_E))
+                cls._UFUNC_CACHE_LOOKUP[key] = numba.vectorize(["int64(int64)"], nopython=True, target=target, cache=cache)(lambda a: function(a, EXP, LOG, ZECH_LOG, ZECH_E))
             else:
-                cls._UFUNC_CACHE_LOOKUP[key] = numba.vectorize(["int64(int64, int64)"], nopython=True)(lambda a, b: function(a, b, EXP, LOG, ZECH_LOG, ZECH_E))
+                cls._UFUNC_CACHE_LOOKUP[key] = numba.vectorize(["int64(int64, int64)"], nopython=True, target=target, cache=cache)(lambda a, b: function(a, b, EXP, LOG, ZECH_LOG, ZECH_E))
 
         return cls._UFUNC_CACHE_LOOKUP[key]
 
+    ###############################################################################
+    # Lookup table construction
+    ###############################################################################
+
+    @staticmethod
+    def _build_lookup_tables_lookup(EXP, LOG, ZECH_LOG, ALPHA, MULTIPLY, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY):  # pragma: no cover
+        """
+        Fills EXP[i] = α^i for 0 <= i < ORDER, LOG[α^i] = i for 0 <= i < ORDER - 1, and ZECH_LOG[i] = log(1 + α^i). Returns `False`
+        if a power repeats before α^(ORDER - 1), in which case α is not a multiplicative generator.
+
+        The common multiplications by α are computed inline rather than through the MULTIPLY function. In prime fields it is
+        an integer product. When α = x in extension fields, it is a shift of the coefficients followed by subtracting the carried
+        leading coefficient times the irreducible polynomial f(x), one coefficient at a time.
+        """
+        ORDER = CHARACTERISTIC**DEGREE
+        p = CHARACTERISTIC
+        top = ORDER // p  # The place value of the leading coefficient
+
+        element = 1
+        EXP[0] = element
+        LOG[0] = 0  # Technically -Inf
+        for i in range(1, ORDER):
+            # Increment by multiplying by the primitive element, which is a multiplicative generator of the field
+            if DEGREE == 1:
+                element = (element * ALPHA) % p
+            elif ALPHA == p and p == 2:
+                element <<= 1
+                if element >= ORDER:
+                    element ^= IRREDUCIBLE_POLY
+            elif ALPHA == p:
+                t = element // top
+                element = (element - t*top) * p
+                if t > 0:
+                    a = element
+                    g = IRREDUCIBLE_POLY - ORDER
+                    element = 0
+                    place = 1
+                    for _ in range(DEGREE):
+                        element += ((a % p - t * (g % p)) % p) * place
+                        a //= p
+                        g //= p
+                        place *= p
+            else:
+                element = MULTIPLY(element, ALPHA, CHARACTERISTIC, DEGREE, IRREDUCIBLE_POLY)
+            EXP[i] = element
+
+            # Assign to the log lookup table but skip indices greater than or equal to `order - 1`
+            # because `EXP[0] == EXP[order - 1]`
+            if i < ORDER - 1:
+                if element == 1 or LOG[element] != 0:
+                    return False
+                LOG[element] = i
+
+        # Compute Zech log lookup table, where adding 1 only increments the constant coefficient
+        for i in range(0, ORDER):
+            c = EXP[i] % p
+            one_plus_element = EXP[i] + 1 if c < p - 1 else EXP[i] - c
+            ZECH_LOG[i] = LOG[one_plus_element]
+
+        return True
+
     ###############################################################################
     # Arithmetic functions using lookup tables
     ###############################################################################
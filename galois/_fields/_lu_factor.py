@@ -0,0 +1,195 @@
+"""
+A module that contains a reusable LU factorization of a square matrix over a Galois field.
+"""
+import collections
+
+import numpy as np
+
+from .._overrides import set_module
+
+from ._linalg import _lu_split
+
+__all__ = ["LUFactorization"]
+
+# The maximum number of factorizations kept by `lu_factor(A, cache=True)`, evicting the least recently used
+LU_FACTOR_CACHE_SIZE = 64
+
+_LU_FACTOR_CACHE = collections.OrderedDict()
+
+
+@set_module("galois")
+class LUFactorization:
+    r"""
+    A reusable LU factorization with partial pivoting of a square, invertible matrix :math:`\mathbf{A}` over a Galois field.
+
+    The factorization :math:`\mathbf{P}^T \mathbf{A} = \mathbf{L} \mathbf{U}` is stored compactly as one matrix, with the multipliers
+    of the unit lower triangular :math:`\mathbf{L}` below the diagonal and :math:`\mathbf{U}` on and above it, plus the row permutation.
+    Once factored, the linear systems :math:`\mathbf{A} \mathbf{x} = \mathbf{b}` are solved by forward and back substitution, which is
+    much cheaper than the full Gaussian elimination performed by :func:`numpy.linalg.solve`.
+
+    Instances are created with :func:`galois.FieldArray.lu_factor`.
+
+    Examples
+    --------
+    .. ipython:: python
+
+        GF = galois.GF(2**8)
+        A = GF([[1, 2, 3], [4, 5, 6], [7, 8, 10]]); A
+        LU = GF.lu_factor(A); LU
+        b = GF([1, 2, 3])
+        x = LU.solve(b); x
+        np.array_equal(A @ x, b)
+
+    Solve many right-hand sides at once by passing the vectors as the columns of a matrix.
+
+    .. ipython:: python
+
+        B = GF.Random((3, 5)); B
+        X = LU.solve(B); X
+        np.array_equal(A @ X, B)
+    """
+    __slots__ = ["_lu", "_perm", "_n_permutations", "_diag_inv"]
+
+    def __init__(self, A):
+        field = type(A)
+        if not (A.ndim == 2 and A.shape[0] == A.shape[1]):
+            raise np.linalg.LinAlgError(f"Argument `A` must be a square matrix, not {A.shape}.")
+        n = A.shape[0]
+
+        lu, perm, N_permutations = field._gaussian_elimination(A, max(n - 1, 0), 2)
+        diag = np.diagonal(lu)
+        rank = np.count_nonzero(diag)
+        if rank < n:
+            raise np.linalg.LinAlgError(f"Argument `A` is singular and not invertible because it does not have full rank of {n}, but rank of {rank}.")
+
+        lu.flags.writeable = False
+        perm.flags.writeable = False
+        self._lu = lu
+        self._perm = perm
+        self._n_permutations = int(N_permutations)
+        self._diag_inv = np.reciprocal(diag)
+
+    ###############################################################################
+    # Properties
+    ###############################################################################
+
+    @property
+    def field(self):
+        """
+        galois.FieldClass: The Galois field of the factored matrix.
+        """
+        return type(self._lu)
+
+    @property
+    def lu(self):
+        r"""
+        galois.FieldArray: The compact factorization, with the multipliers of :math:`\mathbf{L}` below the diagonal and
+        :math:`\mathbf{U}` on and above it. The array is read-only.
+        """
+        return self._lu
+
+    @property
+    def perm(self) -> np.ndarray:
+        r"""
+        numpy.ndarray: The row permutation, such that row `i` of :math:`\mathbf{L} \mathbf{U}` is row `perm[i]` of :math:`\mathbf{A}`.
+        The array is read-only.
+        """
+        return self._perm
+
+    @property
+    def P(self):
+        r"""
+        galois.FieldArray: The column permutation matrix :math:`\mathbf{P}`, with :math:`\mathbf{A} = \mathbf{P} \mathbf{L} \mathbf{U}`.
+        """
+        n = self._lu.shape[0]
+        return self.field.Identity(n, dtype=self._lu.dtype)[self._perm,:].T
+
+    @property
+    def L(self):
+        r"""
+        galois.FieldArray: The unit lower triangular matrix :math:`\mathbf{L}`.
+        """
+        L, _ = _lu_split(self._lu.copy())
+        return L
+
+    @property
+    def U(self):
+        r"""
+        galois.FieldArray: The upper triangular matrix :math:`\mathbf{U}`.
+        """
+        _, U = _lu_split(self._lu.copy())
+        return U
+
+    ###############################################################################
+    # Methods
+    ###############################################################################
+
+    def solve(self, b):
+        r"""
+        Solves the linear system :math:`\mathbf{A} \mathbf{x} = \mathbf{b}` using the factorization.
+
+        Parameters
+        ----------
+        b : galois.FieldArray
+            The right-hand side, either a vector with shape `(n,)` or a stack of matrices with shape `(..., n, k)` whose columns are
+            the right-hand sides.
+
+        Returns
+        -------
+        galois.FieldArray
+            The solution :math:`\mathbf{x}` with the same shape as :math:`\mathbf{b}`.
+        """
+        field = self.field
+        if not type(b) is field:
+            raise TypeError(f"Argument `b` must be a {field.name} array, not {type(b)}.")
+        n = self._lu.shape[0]
+        axis = 0 if b.ndim == 1 else -2
+        if not (b.ndim >= 1 and b.shape[axis] == n):
+            raise np.linalg.LinAlgError(f"The dimension of `b` to solve along must equal the size of `A`, {n}, not have shape {b.shape}.")
+
+        # Solve for every right-hand side at once by placing them in the columns of one (n, K) matrix
+        X = np.moveaxis(b.view(np.ndarray), axis, 0)
+        shape = X.shape
+        X = field._view(X.reshape(n, -1)[self._perm,:])
+
+        # Forward substitution L Y = P^T B, then back substitution U X = Y
+        X = field._lu_solve(self._lu, self._diag_inv, X)
+
+        return field._view(np.moveaxis(X.view(np.ndarray).reshape(shape), 0, axis))
+
+    def det(self):
+        r"""
+        Computes the determinant of :math:`\mathbf{A}` from the factorization.
+
+        Returns
+        -------
+        galois.FieldArray
+            The determinant :math:`\det(\mathbf{A}) = \det(\mathbf{P}) \prod_i U_{i,i}`.
+        """
+        return (-self.field(1)) ** self._n_permutations * np.multiply.reduce(np.diagonal(self._lu))
+
+    def __repr__(self):
+        return f"LUFactorization(field={self.field.name}, shape={self._lu.shape})"
+
+
+def lu_factor(A, cache=False):
+    """
+    Returns the LU factorization of A, reusing a cached factorization of a matrix with the same field and contents if `cache`
+    is True.
+    """
+    if not cache:
+        return LUFactorization(A)
+
+    # The raw bytes of an object array are pointers, so its contents are keyed on the Python integers instead
+    contents = tuple(A.ravel().tolist()) if A.dtype == np.object_ else np.ascontiguousarray(A.view(np.ndarray)).tobytes()
+    key = (type(A), A.dtype, A.shape, contents)
+    if key in _LU_FACTOR_CACHE:
+        _LU_FACTOR_CACHE.move_to_end(key)
+        return _LU_FACTOR_CACHE[key]
+
+    factorization = LUFactorization(A)
+    _LU_FACTOR_CACHE[key] = factorization
+    if len(_LU_FACTOR_CACHE) > LU_FACTOR_CACHE_SIZE:
+        _LU_FACTOR_CACHE.popitem(last=False)
+
+    return factorization
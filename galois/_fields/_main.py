@@ -4,7 +4,6 @@ and Poly. They're all in one file because they have circular dependencies. The s
 FieldClass is also included.
 """
 import inspect
-import math
 import random
 from typing import Tuple, List, Sequence, Iterable, Optional, Union, overload
 from typing_extensions import Literal
@@ -14,11 +13,13 @@ import numpy as np
 
 from .._overrides import set_module
 from .._poly_conversion import integer_to_poly, poly_to_integer, str_to_integer, poly_to_str, sparse_poly_to_integer, sparse_poly_to_str, str_to_sparse_poly
-from .._prime import divisors
+from .._modular import totatives
 
+from ._discrete_log import multiplicative_order
 from ._dtypes import DTYPES
-from ._linalg import dot, row_reduce, lu_decompose, plu_decompose, row_space, column_space, left_null_space, null_space
+from ._linalg import dot, row_reduce, lu_decompose, plu_decompose, row_space, column_space, left_null_space, null_space, characteristic_poly, local_minimal_polys
 from ._functions import FunctionMeta
+from ._lu_factor import LUFactorization, lu_factor
 from ._ufuncs import UfuncMeta
 
 __all__ = ["FieldClass", "FieldArray", "GF2", "Poly"]
@@ -105,11 +106,11 @@ class FieldClass(FunctionMeta, UfuncMeta):
     # Class methods
     ###############################################################################
 
-    def compile(cls, mode: str):
+    def compile(cls, mode: str, parallel: bool = False):
         """
         Recompile the just-in-time compiled numba ufuncs for a new calculation mode.
 
-        This function updates :obj:`ufunc_mode`.
+        This function updates :obj:`ufunc_mode` and :obj:`ufunc_target`.
 
         Parameters
         ----------
@@ -124,20 +125,43 @@ class FieldClass(FunctionMeta, UfuncMeta):
               fields that cannot or should not store lookup tables in RAM. Generally, the "jit-calculate" mode is slower than "jit-lookup".
             * `"python-calculate"`: Uses pure-Python ufuncs with explicit calculation. This is reserved for fields whose elements cannot be
               represented with :obj:`numpy.int64` and instead use :obj:`numpy.object_` with Python :obj:`int` (which has arbitrary precision).
+
+        parallel : bool, optional
+            Indicates whether to additionally compile multithreaded ufuncs and JIT functions (numba's `"parallel"` target). The default is `False`.
+            If `True`, arithmetic on arrays with at least :math:`2^{16}` elements, and matrix multiplication, convolution, and polynomial evaluation
+            and division of similar size, run on all of numba's threads. Smaller inputs still use the single-threaded ufuncs and functions. The number
+            of threads is set with :func:`numba.set_num_threads`. Only the `"jit-lookup"` and `"jit-calculate"` modes support `parallel=True`.
+
+        Examples
+        --------
+        .. ipython:: python
+
+            GF = galois.GF(2**16)
+            GF.compile("jit-lookup", parallel=True)
+            GF.ufunc_target
+            @suppress
+            GF.compile("auto")
         """
         if not isinstance(mode, (type(None), str)):
             raise TypeError(f"Argument `mode` must be a string, not {type(mode)}.")
+        if not isinstance(parallel, bool):
+            raise TypeError(f"Argument `parallel` must be a bool, not {type(parallel)}.")
         # if not mode in ["auto", "jit-lookup", "jit-calculate", "python-calculate"]:
         #     raise ValueError(f"Argument `mode` must be in ['auto', 'jit-lookup', 'jit-calculate', 'python-calculate'], not {mode!r}.")
         mode = cls.default_ufunc_mode if mode == "auto" else mode
         if mode not in cls.ufunc_modes:
             raise ValueError(f"Argument `mode` must be in {cls.ufunc_modes} for {cls.name}, not {mode!r}.")
+        if parallel and mode == "python-calculate":
+            raise ValueError(f"Argument `parallel` can only be True for the 'jit-lookup' and 'jit-calculate' modes, not {mode!r}.")
+        target = "parallel" if parallel else "cpu"
 
         if mode == cls.ufunc_mode:
-            # Don't need to rebuild these ufuncs
+            # Don't need to rebuild these ufuncs, the multithreaded ones are compiled as needed
+            cls._ufunc_target = target
             return
 
         cls._ufunc_mode = mode
+        cls._ufunc_target = target
         cls._compile_ufuncs()
 
     def display(
@@ -497,7 +521,7 @@ class FieldClass(FunctionMeta, UfuncMeta):
         elif element == cls.primitive_element:
             s = "α"
         else:
-            power = cls._ufunc("log")(element, cls.primitive_element)
+            power = np.log(cls(element))
             s = f"α^{power}"
 
         if cls._element_fixed_width:
@@ -681,8 +705,7 @@ class FieldClass(FunctionMeta, UfuncMeta):
             galois.GF(7**5).primitive_elements
         """
         n = cls.order - 1
-        totatives = [t for t in range(1, n + 1) if math.gcd(n, t) == 1]
-        powers = np.array(totatives)
+        powers = np.array(totatives(n)) if n > 1 else np.array([1])
         return np.sort(cls.primitive_element ** powers)
 
     @property
@@ -891,6 +914,20 @@ class FieldClass(FunctionMeta, UfuncMeta):
         """
         return cls._ufunc_mode
 
+    @property
+    def ufunc_target(cls) -> str:
+        """
+        str: The numba target for large ufunc calls and JIT functions, either `"cpu"` (single-threaded) or `"parallel"` (multithreaded). The
+        `"parallel"` target is selected with `parallel=True` in :func:`compile`.
+
+        Examples
+        --------
+        .. ipython:: python
+
+            galois.GF(2**8).ufunc_target
+        """
+        return cls._ufunc_target
+
     @property
     def ufunc_modes(cls) -> List[str]:
         """
@@ -1174,6 +1211,33 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
         array = np.array(array_like, dtype=dtype, copy=copy, order=order, ndmin=ndmin)
         return array.view(cls)
 
+    @classmethod
+    def _view(cls, array):
+        """
+        Views the integer array as an array over this field *without* verifying that its values are field elements. This is the
+        trusted construction path for arrays that are already known to be valid, e.g. the outputs of field arithmetic. Instead of
+        `x.view(field)` use `field._view(x)`.
+
+        C- or Fortran-contiguous integer arrays are viewed, so the result shares memory with `array`. Non-contiguous and object
+        arrays are *copied*, so writes to the result don't reach `array`. Callers that need to write through to `array` must not
+        rely on this method.
+
+        Warning
+        -------
+        No bounds checking is performed on the array elements. Viewing an array with values outside `0 <= x < order` produces
+        an invalid Galois field array and undefined results from subsequent arithmetic.
+        """
+        # The array is constructed directly, rather than view cast, which avoids __array_finalize__() and its O(N) value scan
+        if array.dtype == np.object_:
+            # Object arrays can't be constructed from a data buffer, so the elements are copied into a new array
+            output = np.ndarray.__new__(cls, array.shape, array.dtype)
+            np.ndarray.__setitem__(output, Ellipsis, array)
+            return output
+
+        if not (array.flags.c_contiguous or array.flags.f_contiguous):
+            array = np.ascontiguousarray(array)
+        return np.ndarray.__new__(cls, array.shape, array.dtype, buffer=array, strides=array.strides)
+
     @classmethod
     def _check_array_like_object(cls, array_like):
         if isinstance(array_like, cls):
@@ -1743,10 +1807,8 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
             k = np.log(x)  # x as an exponent of α
             order = (field.order - 1) // np.gcd(field.order - 1, k)
         else:
-            d = np.array(divisors(field.order - 1))  # Divisors d such that d | p^m - 1
-            y = np.power.outer(x, d)  # x^d -- the first divisor d for which x^d == 1 is the order of x
-            idxs = np.argmin(y, axis=-1)  # First index of divisors, which is the order of x
-            order = d[idxs]  # The order of each element of x
+            # Strip the prime factors of p^m - 1 from the order of each element
+            order = multiplicative_order(x)[()]
 
         return order
 
@@ -1971,6 +2033,91 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
         P, L, U, _ = plu_decompose(self)
         return P, L, U
 
+    @classmethod
+    def lu_factor(cls, A: "FieldArray", cache: bool = False) -> LUFactorization:
+        r"""
+        Computes a reusable LU factorization with partial pivoting of the square, invertible matrix :math:`\mathbf{A}`.
+
+        Parameters
+        ----------
+        A : galois.FieldArray
+            The square matrix to factor.
+        cache : bool, optional
+            Indicates whether to reuse the factorization of a previously factored matrix with the same contents. The default is `False`.
+            The most recently used factorizations are kept.
+
+        Returns
+        -------
+        galois.LUFactorization
+            The LU factorization of :math:`\mathbf{A}`, which solves linear systems with :func:`galois.LUFactorization.solve`.
+
+        Notes
+        -----
+        :func:`numpy.linalg.solve` performs Gaussian elimination on :math:`\mathbf{A}` every time it is called. When the same
+        :math:`\mathbf{A}` is used with many right-hand sides, factor it once and solve each system by forward and back substitution.
+
+        Examples
+        --------
+        .. ipython:: python
+
+            GF = galois.GF(31)
+            A = GF([[14, 4, 22], [21, 6, 29], [5, 17, 13]]); A
+            LU = GF.lu_factor(A)
+            b1 = GF([3, 5, 7]); b2 = GF([1, 0, 0])
+            x1 = LU.solve(b1); x1
+            x2 = LU.solve(b2); x2
+            np.array_equal(A @ x1, b1), np.array_equal(A @ x2, b2)
+            LU.det() == np.linalg.det(A)
+        """
+        if not isinstance(A, cls):
+            raise TypeError(f"Argument `A` must be a {cls.name} array, not {type(A)}.")
+        return lu_factor(A, cache=cache)
+
+    @classmethod
+    def multiply_accumulate(cls, y: "FieldArray", c: Union[int, "FieldArray"], x: "FieldArray") -> "FieldArray":
+        r"""
+        Computes :math:`\mathbf{y} = \mathbf{y} + c\mathbf{x}` in place, for the scalar :math:`c` and arrays :math:`\mathbf{x}`
+        and :math:`\mathbf{y}` with the same shape.
+
+        Parameters
+        ----------
+        y : galois.FieldArray
+            The accumulator array, which is modified in place.
+        c : int, galois.FieldArray
+            The scalar field element.
+        x : galois.FieldArray
+            The array that is multiplied by :math:`c`.
+
+        Returns
+        -------
+        galois.FieldArray
+            The accumulator array :math:`\mathbf{y}`.
+
+        Notes
+        -----
+        This is the inner operation of erasure coding, where a parity block accumulates data blocks scaled by the coefficients of
+        the code. In :math:`\mathrm{GF}(2^m)` fields with :math:`m \le 16`, it uses the product tables of :math:`c` and doesn't
+        allocate the intermediate product :math:`c\mathbf{x}`.
+
+        Examples
+        --------
+        .. ipython:: python
+
+            GF = galois.GF(2**8)
+            x = GF.Random(8); x
+            y = GF.Random(8); y
+            y + GF(3)*x
+            GF.multiply_accumulate(y, 3, x); y
+        """
+        if not (isinstance(y, cls) and isinstance(x, cls)):
+            raise TypeError(f"Arguments `y` and `x` must be {cls.name} arrays, not {type(y)} and {type(x)}.")
+        if not y.shape == x.shape:
+            raise ValueError(f"Arguments `y` and `x` must have the same shape, not {y.shape} and {x.shape}.")
+        c = cls(c)
+        if not c.ndim == 0:
+            raise ValueError(f"Argument `c` must be a scalar, not {c.ndim}-D.")
+        return cls._scalar_multiply_accumulate(y, c, x)
+
     def row_space(self) -> "FieldArray":
         r"""
         Computes the row space of the matrix :math:`\mathbf{A}`.
@@ -2240,9 +2387,14 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
         polynomial is :math:`-\textrm{Tr}(\mathbf{A})`. The characteristic polynomial annihilates :math:`\mathbf{A}`, i.e.
         :math:`p_A(\mathbf{A}) = \mathbf{0}`.
 
+        The characteristic polynomial of a matrix is computed by reducing :math:`\mathbf{A}` to an upper Hessenberg matrix with
+        Gaussian similarity transformations, then expanding the determinants of its leading principal submatrices with a recurrence.
+        Both steps use :math:`O(n^3)` field operations.
+
         References
         ----------
         * https://en.wikipedia.org/wiki/Characteristic_polynomial
+        * https://en.wikipedia.org/wiki/Hessenberg_matrix
 
         Examples
         --------
@@ -2294,48 +2446,21 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
         if not self.shape[0] == self.shape[1]:
             raise ValueError(f"The 2-D array must be square to compute its characteristic polynomial, not have shape {self.shape}.")
 
-        field = type(self)
-        A = self
-
-        # Compute P = xI - A
-        P = np.zeros(self.shape, dtype=object)
-        for i in range(self.shape[0]):
-            for j in range(self.shape[0]):
-                if i == j:
-                    P[i,j] = Poly([1, -A[i,j]], field=field)
-                else:
-                    P[i,j] = Poly([-A[i,j]], field=field)
-
-        # Compute det(P)
-        return self._compute_poly_det(P)
-
-    def _compute_poly_det(self, A):
-        if A.shape == (2,2):
-            return A[0,0]*A[1,1] - A[0,1]*A[1,0]
-
-        field = type(self)
-        n = A.shape[0]  # Size of the nxn matrix
-
-        det = Poly.Zero(field)
-        for i in range(n):
-            idxs = np.delete(np.arange(0, n), i)
-            if i % 2 == 0:
-                det += A[0,i] * self._compute_poly_det(A[1:,idxs])
-            else:
-                det -= A[0,i] * self._compute_poly_det(A[1:,idxs])
-
-        return det
+        return Poly(characteristic_poly(self), field=type(self))
 
     def minimal_poly(self) -> "Poly":
         r"""
-        Computes the minimal polynomial of a finite field element :math:`a`.
+        Computes the minimal polynomial of a finite field element :math:`a` or a square matrix :math:`\mathbf{A}`.
 
-        This function can be invoked only on single finite field elements (scalar 0-D arrays).
+        This function can be invoked on single finite field elements (scalar 0-D arrays) or square :math:`n \times n`
+        matrices (2-D arrays).
 
         Returns
         -------
         galois.Poly
             For scalar inputs, the minimal polynomial :math:`p_a(x)` of :math:`a` over :math:`\mathrm{GF}(p)`.
+            For square :math:`n \times n` matrix inputs, the minimal polynomial :math:`p_A(x)` of :math:`\mathbf{A}` over
+            :math:`\mathrm{GF}(p^m)`.
 
         Notes
         -----
@@ -2344,6 +2469,12 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
         The minimal polynomial always divides the characteristic polynomial. In prime fields :math:`\mathrm{GF}(p)`, the
         minimal polynomial of :math:`a` is simply :math:`p_a(x) = x - a`.
 
+        An :math:`n \times n` matrix :math:`\mathbf{A}` has minimal polynomial :math:`p_A(x)`, the monic polynomial of least
+        degree with :math:`p_A(\mathbf{A}) = \mathbf{0}`. It is the least common multiple of the minimal polynomials of vectors
+        whose Krylov subspaces :math:`\{\mathbf{v}, \mathbf{A}\mathbf{v}, \mathbf{A}^2\mathbf{v}, \dots\}` span
+        :math:`\mathrm{GF}(p^m)^n`, which are found by incremental Gaussian elimination in :math:`O(n^3)` field operations for
+        most matrices.
+
         References
         ----------
         * https://en.wikipedia.org/wiki/Minimal_polynomial_(field_theory)
@@ -2351,7 +2482,7 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
 
         Examples
         --------
-        The characteristic polynomial of the element :math:`a`.
+        The minimal polynomial of the element :math:`a`.
 
         .. ipython:: python
 
@@ -2362,11 +2493,23 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
             poly(a, field=GF)
             # The minimal polynomial always divides the characteristic polynomial
             a.characteristic_poly() / poly
+
+        The minimal polynomial of the square matrix :math:`\mathbf{A}`.
+
+        .. ipython:: python
+
+            GF = galois.GF(3**5)
+            A = GF([[2, 1, 0], [0, 2, 0], [0, 0, 2]]); A
+            poly = A.minimal_poly(); poly
+            # The minimal polynomial annihilates the matrix A
+            poly(A, elementwise=False)
+            # The minimal polynomial always divides the characteristic polynomial
+            A.characteristic_poly() / poly
         """
         if self.ndim == 0:
             return self._minimal_poly_element()
-        # elif self.ndim == 2:
-        #     return self._minimal_poly_matrix()
+        elif self.ndim == 2:
+            return self._minimal_poly_matrix()
         else:
             raise ValueError(f"The array must be either 0-D to return the minimal polynomial of a single element or 2-D to return the minimal polynomial of a square matrix, not have shape {self.shape}.")
 
@@ -2383,6 +2526,18 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
             poly = Poly(poly.coeffs, field=field.prime_subfield)
             return poly
 
+    def _minimal_poly_matrix(self):
+        if not self.shape[0] == self.shape[1]:
+            raise ValueError(f"The 2-D array must be square to compute its minimal polynomial, not have shape {self.shape}.")
+
+        from ._poly_functions import lcm  # pylint: disable=import-outside-toplevel  # Imported here to avoid a circular import
+
+        # The minimal polynomial is the least common multiple of the monic local minimal polynomials
+        field = type(self)
+        polys = [Poly(coeffs, field=field) for coeffs in local_minimal_polys(self)]
+
+        return lcm(*polys)
+
     ###############################################################################
     # Special methods (redefined to add docstrings)
     ###############################################################################
@@ -2663,8 +2818,11 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
         item = super().__getitem__(key)
         if np.isscalar(item):
             # Return scalar array elements as 0-dimensional Galois field arrays. This enables Galois field arithmetic
-            # on scalars, which would otherwise be implemented using standard integer arithmetic.
-            item = self.__class__(item, dtype=self.dtype)
+            # on scalars, which would otherwise be implemented using standard integer arithmetic. The element is already
+            # in the field, so the 0-D array is allocated and filled directly rather than verified by the constructor.
+            scalar = item
+            item = np.ndarray.__new__(type(self), (), dtype=self.dtype)
+            np.ndarray.__setitem__(item, (), scalar)
         return item
 
     def __setitem__(self, key, value):
@@ -2696,6 +2854,20 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
         return output
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        field = type(self)
+        if method == "__call__" and len(inputs) == 2 and not kwargs and ufunc in field._fast_path_ufuncs and field._ufunc_target == "cpu":
+            # Fast path for the common case of arithmetic on two arrays of the same field and dtype, which doesn't need the
+            # operand verification and conversion of the ufunc routines
+            a, b = inputs
+            if type(a) is field and type(b) is field and a.dtype == b.dtype and a.dtype != np.object_:
+                name = field._fast_path_ufuncs[ufunc]
+                native = field._native_ufunc(name, a.dtype)
+                if native is not None and a.ndim > 0:
+                    return field._view(native(a.view(np.ndarray), b.view(np.ndarray), a.dtype))
+                ufunc = field._ufuncs.get(name) or field._ufunc(name)
+                output = np.asarray(ufunc(a.view(np.ndarray), b.view(np.ndarray)), dtype=a.dtype)
+                return field._view(output)
+
         meta = {}
         meta["types"] = [type(inputs[i]) for i in range(len(inputs))]
         meta["operands"] = list(range(len(inputs)))
@@ -2706,6 +2878,9 @@ class FieldArray(np.ndarray, metaclass=FieldClass):
         meta["non_field_operands"] = [i for i in meta["operands"] if not isinstance(inputs[i], self.__class__)]
         meta["field"] = self.__class__
         meta["dtype"] = self.dtype
+        meta["target"] = "cpu"
+        if self._ufunc_target == "parallel" and method == "__call__":
+            meta["target"] = type(self)._target(max(np.size(inputs[i]) for i in meta["operands"]))
         # meta["ufuncs"] = self._ufuncs
 
         if ufunc in type(self)._OVERRIDDEN_UFUNCS:
@@ -2821,12 +2996,13 @@ class GF2Meta(FieldClass, DirMeta):
         super()._compile_ufuncs()
         assert cls.ufunc_mode == "jit-calculate"
 
-        cls._ufuncs["add"] = np.bitwise_xor
-        cls._ufuncs["negative"] = np.positive
-        cls._ufuncs["subtract"] = np.bitwise_xor
-        cls._ufuncs["multiply"] = np.bitwise_and
-        cls._ufuncs["reciprocal"] = np.positive
-        cls._ufuncs["divide"] = np.bitwise_and
+        for ufuncs in [cls._ufuncs, cls._ufuncs_parallel]:
+            ufuncs["add"] = np.bitwise_xor
+            ufuncs["negative"] = np.positive
+            ufuncs["subtract"] = np.bitwise_xor
+            ufuncs["multiply"] = np.bitwise_and
+            ufuncs["reciprocal"] = np.positive
+            ufuncs["divide"] = np.bitwise_and
 
     ###############################################################################
     # Override ufunc routines to use native numpy bitwise ufuncs for GF(2)
@@ -2842,7 +3018,7 @@ class GF2Meta(FieldClass, DirMeta):
         cls._verify_unary_method_not_reduction(ufunc, method)
         if np.count_nonzero(inputs[0]) != inputs[0].size:
             raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
-        output = getattr(cls._ufunc("reciprocal"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("reciprocal", meta["target"]), method)(*inputs, **kwargs)
         return output
 
     def _ufunc_routine_divide(cls, ufunc, method, inputs, kwargs, meta):
@@ -2852,7 +3028,7 @@ class GF2Meta(FieldClass, DirMeta):
         cls._verify_operands_in_same_field(ufunc, inputs, meta)
         if np.count_nonzero(inputs[meta["operands"][-1]]) != inputs[meta["operands"][-1]].size:
             raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
-        output = getattr(cls._ufunc("divide"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("divide", meta["target"]), method)(*inputs, **kwargs)
         output = cls._view_output_as_field(output, meta["field"], meta["dtype"])
         return output
 
@@ -0,0 +1,203 @@
+"""
+A module that contains routines on GF(2) bits packed 64 per uint64 word. Bit `i` of a row is bit `i % 64` of word `i // 64`.
+"""
+import numba
+import numpy as np
+
+# The packed words are little-endian so that the bit order is the same on every platform
+WORD_DTYPE = np.dtype("<u8")
+WORD_SIZE = 64
+
+# The number of columns eliminated per Method of Four Russians table. Each table has 2^M4RI_K packed rows.
+M4RI_K = 8
+
+
+###############################################################################
+# Packing and unpacking
+###############################################################################
+
+def pack(bits):
+    """
+    Packs the integer array of bits along its last axis into little-endian uint64 words.
+    """
+    n = bits.shape[-1]
+    N_words = -(-n // WORD_SIZE)
+    padded = np.zeros(bits.shape[:-1] + (N_words*WORD_SIZE,), dtype=np.uint8)
+    padded[..., 0:n] = bits
+    return np.ascontiguousarray(np.packbits(padded, axis=-1, bitorder="little")).view(WORD_DTYPE)
+
+
+def unpack(words, n):
+    """
+    Unpacks the little-endian uint64 words along the last axis into `n` bits, returned as a uint8 array.
+    """
+    words = np.ascontiguousarray(words, dtype=WORD_DTYPE)
+    return np.unpackbits(words.view(np.uint8), axis=-1, count=n, bitorder="little")
+
+
+def matmul_xor(A, B):
+    """
+    Computes the GF(2) matrix product of the packed (M, K) array `A` and the packed (K, N) array `B`. The (M, N) product
+    is returned packed.
+    """
+    C = np.zeros((A.shape[0], B.shape[-1]), dtype=WORD_DTYPE)
+    _jit("matmul_xor")(A, B, C)
+    return C
+
+
+def matmul_parity(A, BT):
+    """
+    Computes the GF(2) matrix product of the packed (M, K) array `A` and the transpose of the packed (N, K) array `BT`. The
+    (M, N) product is returned unpacked as uint8 bits. Each output bit is the parity of the popcount of `A[i] & BT[j]`.
+    """
+    A = np.ascontiguousarray(A, dtype=WORD_DTYPE).reshape(-1, A.shape[-1])
+    BT = np.ascontiguousarray(BT, dtype=WORD_DTYPE)
+    C = np.zeros((A.shape[0], BT.shape[0]), dtype=np.uint8)
+    _jit("matmul_parity")(A, BT, C)
+    return C
+
+
+def row_reduce(bits, ncols):
+    """
+    Row reduces the 2-D integer array of bits to reduced row echelon form in its first `ncols` columns using the Method
+    of Four Russians. Returns the reduced uint8 bits and the number of pivots.
+    """
+    words = pack(bits)
+    rank = _jit("row_reduce")(words, ncols, M4RI_K)
+    return unpack(words, bits.shape[-1]), rank
+
+
+###############################################################################
+# JIT-compiled kernels
+###############################################################################
+
+_JIT_CACHE = {}
+
+
+def _jit(name):
+    """
+    Returns the lazily JIT-compiled kernel with the given name.
+    """
+    if name not in _JIT_CACHE:
+        _JIT_CACHE[name] = numba.jit(nopython=True, cache=True)(globals()[f"_{name}_kernel"])
+    return _JIT_CACHE[name]
+
+
+def _matmul_xor_kernel(A, B, C):  # pragma: no cover
+    """
+    Accumulates C[i] ^= B[k] for every set bit k of the packed row A[i].
+    """
+    M, KW = A.shape
+    K = B.shape[0]
+    one = np.uint64(1)
+
+    for i in range(M):
+        for kw in range(KW):
+            word = A[i,kw]
+            b = 0
+            while word != 0:
+                if word & one:
+                    k = kw*WORD_SIZE + b
+                    if k < K:
+                        C[i,:] ^= B[k,:]
+                word >>= one
+                b += 1
+
+
+def _matmul_parity_kernel(A, BT, C):  # pragma: no cover
+    """
+    Computes C[i,j] = parity(popcount(A[i] & BT[j])). The AND-ed words are XOR-ed together first, which preserves the parity,
+    so only one parity reduction is needed per output bit.
+    """
+    M, W = A.shape
+    N = BT.shape[0]
+
+    for i in range(M):
+        for j in range(N):
+            x = np.uint64(0)
+            for w in range(W):
+                x ^= A[i,w] & BT[j,w]
+            x ^= x >> np.uint64(32)
+            x ^= x >> np.uint64(16)
+            x ^= x >> np.uint64(8)
+            x ^= x >> np.uint64(4)
+            x ^= x >> np.uint64(2)
+            x ^= x >> np.uint64(1)
+            C[i,j] = x & np.uint64(1)
+
+
+def _row_reduce_kernel(A, ncols, k):  # pragma: no cover
+    """
+    Row reduces the packed matrix A in place and returns its rank. The columns are processed in blocks of `k`. The pivots
+    of a block are found with ordinary elimination on the remaining rows, a Gray-code table of all 2^k sums of the pivot
+    rows is built, and then every other row is cleared in the block's pivot columns with a single table lookup and row XOR.
+    """
+    m, W = A.shape
+    one = np.uint64(1)
+    pivots = np.zeros(k, dtype=np.int64)
+    T = np.zeros((1 << k, W), dtype=A.dtype)
+
+    r = 0  # The next pivot row
+    c = 0  # The first column of the block
+    while c < ncols and r < m:
+        c_stop = min(c + k, ncols)
+        w0 = c // WORD_SIZE  # Every row at or below `r` is zero before word `w0`
+        kk = 0  # The number of pivots found in this block
+
+        for j in range(c, c_stop):
+            if r + kk == m:
+                break
+
+            # Find a row at or below `r + kk` with a 1 in column `j`, after eliminating this block's previous pivots from it
+            p = -1
+            for i in range(r + kk, m):
+                for t in range(kk):
+                    if (A[i,pivots[t] // WORD_SIZE] >> np.uint64(pivots[t] % WORD_SIZE)) & one:
+                        A[i,w0:] ^= A[r + t,w0:]
+                if (A[i,j // WORD_SIZE] >> np.uint64(j % WORD_SIZE)) & one:
+                    p = i
+                    break
+            if p == -1:
+                continue
+
+            # Move the pivot row to row `r + kk`
+            if p != r + kk:
+                for w in range(w0, W):
+                    A[p,w], A[r + kk,w] = A[r + kk,w], A[p,w]
+
+            # Eliminate column `j` from this block's previous pivot rows so the pivot rows are reduced amongst themselves
+            for t in range(kk):
+                if (A[r + t,j // WORD_SIZE] >> np.uint64(j % WORD_SIZE)) & one:
+                    A[r + t,w0:] ^= A[r + kk,w0:]
+
+            pivots[kk] = j
+            kk += 1
+
+        if kk > 0:
+            # Build the table T[g] = sum of pivot rows `t` for the set bits `t` of `g`, in Gray-code order so each entry is
+            # one row XOR from the previous entry
+            T[0,w0:] = 0
+            g_prev = 0
+            for s in range(1, 1 << kk):
+                g = s ^ (s >> 1)
+                t = 0
+                while not (g ^ g_prev) >> t & 1:
+                    t += 1
+                T[g,w0:] = T[g_prev,w0:] ^ A[r + t,w0:]
+                g_prev = g
+
+            # Clear this block's pivot columns from every other row
+            for i in range(m):
+                if r <= i < r + kk:
+                    continue
+                g = 0
+                for t in range(kk):
+                    g |= int((A[i,pivots[t] // WORD_SIZE] >> np.uint64(pivots[t] % WORD_SIZE)) & one) << t
+                if g != 0:
+                    for w in range(w0, W):
+                        A[i,w] ^= T[g,w]
+
+        r += kk
+        c = c_stop
+
+    return r
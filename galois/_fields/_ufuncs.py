@@ -4,8 +4,12 @@ A module that contains a metaclass mixin that provides NumPy ufunc overriding fo
 import numpy as np
 
 from ._calculate import CalculateMeta
+from ._discrete_log import discrete_log
 from ._lookup import LookupMeta
 
+# With the "parallel" target, ufunc calls and JIT functions on at least this many elements (or inner-product terms) are multithreaded
+PARALLEL_MIN_SIZE = 2**16
+
 
 class UfuncMeta(LookupMeta, CalculateMeta):
     """
@@ -58,31 +62,57 @@ class UfuncMeta(LookupMeta, CalculateMeta):
         np.matmul: "_ufunc_routine_matmul",
     }
 
+    # Binary ufuncs that FieldArray.__array_ufunc__ dispatches directly, skipping the ufunc routines, when both operands are arrays
+    # of this field with the same dtype. Ufuncs whose routines are overridden by a subclass, like multiply in GF2mMeta, always use
+    # their routines.
+    _FAST_PATH_UFUNCS = {
+        np.add: "add",
+        np.subtract: "subtract",
+        np.multiply: "multiply",
+    }
+
     def __init__(cls, name, bases, namespace, **kwargs):
         super().__init__(name, bases, namespace, **kwargs)
         cls._ufuncs = {}
+        cls._ufuncs_parallel = {}
+        cls._discrete_log_tables = None  # The Pohlig-Hellman tables, built on the first np.log() without lookup tables
+        cls._fast_path_ufuncs = {
+            ufunc: name for ufunc, name in cls._FAST_PATH_UFUNCS.items()
+            if getattr(type(cls), f"_ufunc_routine_{name}") is getattr(UfuncMeta, f"_ufunc_routine_{name}")
+        }
 
     def _compile_ufuncs(cls):
         """
         Compile/re-compile the ufuncs based on the `ufunc_mode`. This may be supplemented in GF2Meta, GF2mMeta, GFpMeta, and GFpmMeta.
         """
         cls._ufuncs = {}  # Reset the dictionary so each ufunc will get recompiled
+        cls._ufuncs_parallel = {}
 
         if cls.ufunc_mode == "jit-lookup":
             cls._build_lookup_tables()
 
-    def _ufunc(cls, name):
+    def _ufunc(cls, name, target="cpu"):
         """
-        Returns the ufunc for the specific type of arithmetic. The ufunc compilation is based on `ufunc_mode`.
+        Returns the ufunc for the specific type of arithmetic. The ufunc compilation is based on `ufunc_mode`. The numba `target`
+        is either "cpu" or "parallel".
         """
-        if name not in cls._ufuncs:
+        ufuncs = cls._ufuncs_parallel if target == "parallel" else cls._ufuncs
+        if name not in ufuncs:
             if cls.ufunc_mode == "jit-lookup":
-                cls._ufuncs[name] = cls._ufunc_lookup(name)
+                ufuncs[name] = cls._ufunc_lookup(name, target)
             elif cls.ufunc_mode == "jit-calculate":
-                cls._ufuncs[name] = cls._ufunc_calculate(name)
+                ufuncs[name] = cls._ufunc_calculate(name, target)
             else:
-                cls._ufuncs[name] = cls._ufunc_python(name)
-        return cls._ufuncs[name]
+                ufuncs[name] = cls._ufunc_python(name)
+        return ufuncs[name]
+
+    def _target(cls, size):
+        """
+        Returns the numba target, "cpu" or "parallel", for a ufunc call or JIT function on `size` elements.
+        """
+        if cls._ufunc_target == "parallel" and size >= PARALLEL_MIN_SIZE:
+            return "parallel"
+        return "cpu"
 
     ###############################################################################
     # Ufuncs written in NumPy operations (not JIT compiled)
@@ -92,6 +122,20 @@ class UfuncMeta(LookupMeta, CalculateMeta):
     def _sqrt(a):
         raise NotImplementedError
 
+    def _native_ufunc(cls, name, dtype):  # pylint: disable=no-self-use,unused-argument
+        """
+        Returns a function that computes the ufunc with native NumPy integer operations on arrays with the given dtype, or `None`
+        if the JIT-compiled ufunc is used. The function has signature `f(*inputs, dtype, out=None)`. This may be supplemented in GFpMeta.
+        """
+        return None
+
+    def _scalar_multiply_accumulate(cls, y, c, x):
+        """
+        Computes y += c*x, in place, for the scalar c and arrays x and y with the same shape. This may be supplemented in GF2mMeta.
+        """
+        np.add(y, c * x, out=y)
+        return y
+
     ###############################################################################
     # Input/output conversion functions
     ###############################################################################
@@ -176,7 +220,7 @@ class UfuncMeta(LookupMeta, CalculateMeta):
         if isinstance(type(output), field):
             return output
         elif isinstance(output, np.ndarray):
-            return output.astype(dtype).view(field)
+            return field._view(output.astype(dtype))
         elif output is None:
             return None
         else:
@@ -186,24 +230,51 @@ class UfuncMeta(LookupMeta, CalculateMeta):
     # Ufunc routines
     ###############################################################################
 
+    def _ufunc_routine_native(cls, name, method, inputs, kwargs, meta):
+        """
+        Returns the output of the ufunc computed with native NumPy operations, or `None` if the JIT-compiled ufunc is needed.
+        """
+        if not (method == "__call__" and meta["target"] == "cpu" and kwargs.keys() <= {"casting", "out"}):
+            return None
+        outputs = kwargs.get("out", ())
+        if not all(isinstance(x, np.ndarray) and cls._native_ufunc(name, x.dtype) for x in list(inputs) + list(outputs)):
+            return None
+        if all(x.ndim == 0 for x in inputs):
+            # NumPy operations on 0-D arrays return scalars
+            return None
+
+        inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
+        out = kwargs["out"][0] if "out" in kwargs else None
+        output = cls._native_ufunc(name, meta["dtype"])(*inputs, meta["dtype"], out=out)
+        return outputs[0] if out is not None else meta["field"]._view(output)
+
     def _ufunc_routine_add(cls, ufunc, method, inputs, kwargs, meta):
         cls._verify_operands_in_same_field(ufunc, inputs, meta)
+        output = cls._ufunc_routine_native("add", method, inputs, kwargs, meta)
+        if output is not None:
+            return output
         inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(cls._ufunc("add"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("add", meta["target"]), method)(*inputs, **kwargs)
         output = cls._view_output_as_field(output, meta["field"], meta["dtype"])
         return output
 
     def _ufunc_routine_negative(cls, ufunc, method, inputs, kwargs, meta):  # pylint: disable=unused-argument
         cls._verify_unary_method_not_reduction(ufunc, method)
+        output = cls._ufunc_routine_native("negative", method, inputs, kwargs, meta)
+        if output is not None:
+            return output
         inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(cls._ufunc("negative"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("negative", meta["target"]), method)(*inputs, **kwargs)
         output = cls._view_output_as_field(output, meta["field"], meta["dtype"])
         return output
 
     def _ufunc_routine_subtract(cls, ufunc, method, inputs, kwargs, meta):
         cls._verify_operands_in_same_field(ufunc, inputs, meta)
+        output = cls._ufunc_routine_native("subtract", method, inputs, kwargs, meta)
+        if output is not None:
+            return output
         inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(cls._ufunc("subtract"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("subtract", meta["target"]), method)(*inputs, **kwargs)
         output = cls._view_output_as_field(output, meta["field"], meta["dtype"])
         return output
 
@@ -213,22 +284,26 @@ class UfuncMeta(LookupMeta, CalculateMeta):
             cls._verify_operands_in_field_or_int(ufunc, inputs, meta)
             inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
             inputs[meta["non_field_operands"][0]] = np.mod(inputs[meta["non_field_operands"][0]], cls.characteristic)
+        else:
+            output = cls._ufunc_routine_native("multiply", method, inputs, kwargs, meta)
+            if output is not None:
+                return output
         inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(cls._ufunc("multiply"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("multiply", meta["target"]), method)(*inputs, **kwargs)
         output = cls._view_output_as_field(output, meta["field"], meta["dtype"])
         return output
 
     def _ufunc_routine_reciprocal(cls, ufunc, method, inputs, kwargs, meta):  # pylint: disable=unused-argument
         cls._verify_unary_method_not_reduction(ufunc, method)
         inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(cls._ufunc("reciprocal"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("reciprocal", meta["target"]), method)(*inputs, **kwargs)
         output = cls._view_output_as_field(output, meta["field"], meta["dtype"])
         return output
 
     def _ufunc_routine_divide(cls, ufunc, method, inputs, kwargs, meta):
         cls._verify_operands_in_same_field(ufunc, inputs, meta)
         inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(cls._ufunc("divide"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("divide", meta["target"]), method)(*inputs, **kwargs)
         output = cls._view_output_as_field(output, meta["field"], meta["dtype"])
         return output
 
@@ -248,7 +323,7 @@ class UfuncMeta(LookupMeta, CalculateMeta):
         cls._verify_binary_method_not_reduction(ufunc, method)
         cls._verify_operands_first_field_second_int(ufunc, inputs, meta)
         inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(cls._ufunc("power"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("power", meta["target"]), method)(*inputs, **kwargs)
         output = cls._view_output_as_field(output, meta["field"], meta["dtype"])
         return output
 
@@ -256,15 +331,24 @@ class UfuncMeta(LookupMeta, CalculateMeta):
         cls._verify_unary_method_not_reduction(ufunc, method)
         inputs = list(inputs) + [2]
         inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(cls._ufunc("power"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("power", meta["target"]), method)(*inputs, **kwargs)
         output = cls._view_output_as_field(output, meta["field"], meta["dtype"])
         return output
 
     def _ufunc_routine_log(cls, ufunc, method, inputs, kwargs, meta):  # pylint: disable=unused-argument
         cls._verify_method_only_call(ufunc, method)
+        if cls.ufunc_mode != "jit-lookup":
+            # Without a LOG lookup table, solve the discrete logarithm with the Pohlig-Hellman algorithm
+            if np.count_nonzero(inputs[0]) < inputs[0].size:
+                raise ArithmeticError("Cannot compute the discrete logarithm of 0 in a Galois field.")
+            output = discrete_log(inputs[0])
+            if "out" in kwargs:
+                kwargs["out"][0][...] = output
+                return kwargs["out"][0]
+            return output[()]
         inputs = list(inputs) + [int(cls.primitive_element)]
         inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(cls._ufunc("log"), method)(*inputs, **kwargs)
+        output = getattr(cls._ufunc("log", meta["target"]), method)(*inputs, **kwargs)
         return output
 
     def _ufunc_routine_sqrt(cls, ufunc, method, inputs, kwargs, meta):  # pylint: disable=unused-argument
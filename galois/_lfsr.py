@@ -364,11 +364,11 @@ def berlekamp_massey(sequence, config="fibonacci", state=False):
         coeffs = coeffs.astype(dtype)
     else:
         sequence = sequence.view(np.ndarray)
+        add = field._func_python("add")
         subtract = field._func_python("subtract")
         multiply = field._func_python("multiply")
-        divide = field._func_python("divide")
         reciprocal = field._func_python("reciprocal")
-        coeffs = python_func("berlekamp_massey")(sequence, subtract, multiply, divide, reciprocal, field.characteristic, field.degree, field._irreducible_poly_int)
+        coeffs = python_func("berlekamp_massey")(sequence, add, subtract, multiply, reciprocal, field.characteristic, field.degree, field._irreducible_poly_int)
 
     if config == "fibonacci":
         poly = Poly(coeffs, field=field)
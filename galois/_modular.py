@@ -1,4 +1,3 @@
-import math
 from typing import List, Optional
 
 import numpy as np
@@ -52,7 +51,13 @@ def totatives(n: int) -> List[int]:
     if n == 1:
         return [0]
     else:
-        return [t for t in range(1, n) if math.gcd(n, t) == 1]
+        # Sieve out the multiples of the prime factors of n
+        primes, _ = factors(n)
+        is_totative = np.ones(n, dtype=bool)
+        is_totative[0] = False
+        for p in primes:
+            is_totative[::p] = False
+        return np.flatnonzero(is_totative).tolist()
 
 
 @set_module("galois")
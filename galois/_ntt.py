@@ -1,6 +1,7 @@
 """
 A module that contains functions to perform the forward and reverse Number-Theoretic Transform (NTT).
 """
+import functools
 from typing import Tuple, List, Optional, Union
 
 import numpy as np
@@ -8,7 +9,7 @@ import numpy as np
 from ._fields import Field, FieldArray
 from ._modular import primitive_root
 from ._overrides import set_module
-from ._prime import is_prime
+from ._prime import is_prime, factors
 
 __all__ = ["ntt", "intt"]
 
@@ -17,7 +18,8 @@ __all__ = ["ntt", "intt"]
 def ntt(
     x: Union[Tuple[int], List[int], np.ndarray, FieldArray],
     size: Optional[int] = None,
-    modulus: Optional[int] = None
+    modulus: Optional[int] = None,
+    axis: int = -1
 ) -> FieldArray:
     r"""
     Computes the Number-Theoretic Transform (NTT) of :math:`x`.
@@ -25,15 +27,17 @@ def ntt(
     Parameters
     ----------
     x : tuple, list, numpy.ndarray, galois.FieldArray
-        The input sequence of integers :math:`x`.
+        The input sequence of integers :math:`x`. Multi-dimensional inputs are transformed along `axis`.
     size : int, optional
-        The size :math:`N` of the NTT transform, must be at least the length of :math:`x`. The default is `None` which corresponds to `len(x)`.
-        If `size` is larger than the length of :math:`x`, :math:`x` is zero-padded.
+        The size :math:`N` of the NTT transform, must be at least the length of :math:`x` along `axis`. The default is `None` which corresponds
+        to `x.shape[axis]`. If `size` is larger than the length of :math:`x`, :math:`x` is zero-padded.
     modulus : int, optional
         The prime modulus :math:`p` that defines the field :math:`\mathrm{GF}(p)`. The prime modulus must satisfy :math:`p > \textrm{max}(x)`
         and :math:`p = mN + 1` (i.e., the size of the transform :math:`N` must divide :math:`p - 1`). The default is `None` which corresponds
         to the smallest :math:`p` that satisfies the criteria. However, if :math:`x` is a :math:`\mathrm{GF}(p)` array, then `None` corresponds
         to :math:`p` from the specified field.
+    axis : int, optional
+        The axis over which to compute the NTT. Each 1-D sequence along this axis is transformed independently. The default is `-1`.
 
     Returns
     -------
@@ -61,8 +65,10 @@ def ntt(
 
     with all arithmetic performed in :math:`\mathrm{GF}(p)`.
 
-    Currently, the algorithm implemented is :math:`O(N^2)`. A future improvement will be to add a radix-2 Cooley-Tukey implementation,
-    which will have :math:`O(N \mathrm{log}(N))`.
+    The transform is computed with a mixed-radix Cooley-Tukey algorithm (in the self-sorting Stockham form) using precomputed twiddle
+    factors :math:`\omega_N^i`. The size :math:`N` is factored into primes and each prime factor :math:`r` contributes one radix-:math:`r` stage.
+    When :math:`N` is a power of two, the complexity is :math:`O(N \mathrm{log}(N))`. In general, the complexity is :math:`O(N \sum_i r_i)`
+    where :math:`r_i` are the prime factors of :math:`N`.
 
     References
     ----------
@@ -101,6 +107,13 @@ def ntt(
 
         galois.ntt([1, 2, 3, 4, 5, 6], size=8)
         galois.ntt([1, 2, 3, 4, 5, 6, 0, 0])
+
+    Multi-dimensional inputs are transformed along `axis`, one sequence at a time.
+
+    .. ipython:: python
+
+        galois.ntt([[1, 2, 3, 4], [5, 6, 7, 8]], modulus=13)
+        galois.ntt([[1, 2], [3, 4], [5, 6], [7, 8]], modulus=13, axis=0)
     """
     if not isinstance(x, (tuple, list, np.ndarray, FieldArray)):
         raise TypeError(f"Argument `x` must be array-like, not {type(x)}.")
@@ -110,7 +123,7 @@ def ntt(
     if modulus is None and isinstance(x, FieldArray):
         modulus = type(x).characteristic
 
-    return _ntt(x, size=size, modulus=modulus, forward=True)
+    return _ntt(x, size=size, modulus=modulus, forward=True, axis=axis)
 
 
 @set_module("galois")
@@ -118,7 +131,8 @@ def intt(
     X: Union[Tuple[int], List[int], np.ndarray, FieldArray],
     size: Optional[int] = None,
     modulus: Optional[int] = None,
-    scaled: bool = True
+    scaled: bool = True,
+    axis: int = -1
 ) -> FieldArray:
     r"""
     Computes the Inverse Number-Theoretic Transform (INTT) of :math:`X`.
@@ -126,10 +140,10 @@ def intt(
     Parameters
     ----------
     X : tuple, list, numpy.ndarray, galois.FieldArray
-        The input sequence of integers :math:`X`.
+        The input sequence of integers :math:`X`. Multi-dimensional inputs are transformed along `axis`.
     size : int, optional
-        The size :math:`N` of the INTT transform, must be at least the length of :math:`X`. The default is `None` which corresponds to `len(X)`.
-        If `size` is larger than the length of :math:`X`, :math:`X` is zero-padded.
+        The size :math:`N` of the INTT transform, must be at least the length of :math:`X` along `axis`. The default is `None` which corresponds
+        to `X.shape[axis]`. If `size` is larger than the length of :math:`X`, :math:`X` is zero-padded.
     modulus : int, optional
         The prime modulus :math:`p` that defines the field :math:`\mathrm{GF}(p)`. The prime modulus must satisfy :math:`p > \textrm{max}(X)`
         and :math:`p = mN + 1` (i.e., the size of the transform :math:`N` must divide :math:`p - 1`).The default is `None` which corresponds
@@ -138,6 +152,8 @@ def intt(
     scaled : bool, optional
         Indicates to scale the INTT output by :math:`N`. The default is `True`. If true, :math:`x = \mathrm{INTT}(\mathrm{NTT}(x))`. If false,
         :math:`Nx = \mathrm{INTT}(\mathrm{NTT}(x))`.
+    axis : int, optional
+        The axis over which to compute the INTT. Each 1-D sequence along this axis is transformed independently. The default is `-1`.
 
     Returns
     -------
@@ -165,8 +181,10 @@ def intt(
 
     with all arithmetic performed in :math:`\mathrm{GF}(p)`. The scaled INTT has the property that :math:`x = \mathrm{INTT}(\mathrm{NTT}(x))`.
 
-    Currently, the algorithm implemented is :math:`O(N^2)`. A future improvement will be to add a radix-2 Cooley-Tukey implementation,
-    which will have :math:`O(N \mathrm{log}(N))`.
+    The transform is computed with a mixed-radix Cooley-Tukey algorithm (in the self-sorting Stockham form) using precomputed twiddle
+    factors :math:`\omega_N^i`. The size :math:`N` is factored into primes and each prime factor :math:`r` contributes one radix-:math:`r` stage.
+    When :math:`N` is a power of two, the complexity is :math:`O(N \mathrm{log}(N))`. In general, the complexity is :math:`O(N \sum_i r_i)`
+    where :math:`r_i` are the prime factors of :math:`N`.
 
     References
     ----------
@@ -223,10 +241,10 @@ def intt(
     if modulus is None and isinstance(X, FieldArray):
         modulus = type(X).characteristic
 
-    return _ntt(X, size=size, modulus=modulus, forward=False, scaled=scaled)
+    return _ntt(X, size=size, modulus=modulus, forward=False, scaled=scaled, axis=axis)
 
 
-def _ntt(x, size=None, modulus=None, forward=True, scaled=True):
+def _ntt(x, size=None, modulus=None, forward=True, scaled=True, axis=-1):
     if not isinstance(size, (type(None), int, np.integer)):
         raise TypeError(f"Argument `size` must be an integer, not {type(size)}.")
     if not isinstance(modulus, (type(None), int, np.integer)):
@@ -235,10 +253,20 @@ def _ntt(x, size=None, modulus=None, forward=True, scaled=True):
         raise TypeError(f"Argument `forward` must be a bool, not {type(forward)}.")
     if not isinstance(scaled, bool):
         raise TypeError(f"Argument `scaled` must be a bool, not {type(scaled)}.")
+    if not isinstance(axis, (int, np.integer)):
+        raise TypeError(f"Argument `axis` must be an integer, not {type(axis)}.")
+
+    if not isinstance(x, np.ndarray):
+        x = np.array(x)
+    if not x.ndim >= 1:
+        raise ValueError(f"Argument `x` must be at least 1-D, not {x.ndim}-D.")
+    if not -x.ndim <= axis < x.ndim:
+        raise ValueError(f"Argument `axis` must be in [{-x.ndim}, {x.ndim}) for a {x.ndim}-D input, not {axis}.")
+    length = x.shape[axis]
 
     # The size N of the input/output sequence
     if size is None:
-        size = len(x)
+        size = length
 
     # The prime modulus `p = m*N + 1` that defines the prime field GF(p)
     if modulus is None:
@@ -248,8 +276,8 @@ def _ntt(x, size=None, modulus=None, forward=True, scaled=True):
         modulus = m*size + 1
     m = (modulus - 1) // size
 
-    if not size >= len(x):
-        raise ValueError(f"Argument `size` must be at least the length of the input which is {len(x)}, not {size}.")
+    if not size >= length:
+        raise ValueError(f"Argument `size` must be at least the length of the input which is {length}, not {size}.")
     if not is_prime(modulus):
         raise ValueError(f"Argument `modulus` must be prime, {modulus} is not.")
     if not (modulus - 1) % size == 0:
@@ -258,18 +286,46 @@ def _ntt(x, size=None, modulus=None, forward=True, scaled=True):
         raise ValueError(f"Argument `modulus` must be at least the max value of the input which is {np.max(x)}, not {modulus}.")
 
     field = Field(modulus)  # The prime field GF(p)
-    xx = field.Zeros(size)
-    xx[0:len(x)] = x  # Potentially zero-pad the input to length `size`
 
-    g = primitive_root(modulus)  # A generator of the multiplicative group of GF(p)
-    omega = field(g)**m if forward else field(g)**-m  # A primitive N-th root of unity in GF(p)
-    v = field.Vandermonde(omega, size, size)
+    # Move the transform axis last and flatten the remaining axes into a batch of sequences
+    x = np.moveaxis(x, axis, -1)
+    batch_shape = x.shape[:-1]
+    xx = field.Zeros((int(np.prod(batch_shape, dtype=np.int64)), size))
+    xx[:, 0:length] = x.reshape(-1, length)  # Potentially zero-pad the input to length `size`
+
+    # The radix of each Cooley-Tukey stage, which are the prime factors of N (with multiplicity)
+    if size > 1:
+        p, e = factors(size)
+        radices = np.repeat(np.array(p, dtype=np.int64), e)
+    else:
+        radices = np.array([], dtype=np.int64)
+    twiddles = _twiddles(field, size, forward)
 
-    # Transform x into y with the NTT by matrix multiplying x with the Vandermonde matrix of primitive N-th root of unity `omega`
-    y = v @ xx
+    # Transform x into y with the NTT using the twiddles, which are powers of the primitive N-th root of unity `omega`
+    y = field._ntt(xx, twiddles, radices)
 
     # Scale the inverse NTT such that x = INTT(NTT(x))
     if not forward and scaled:
         y /= field(size)
 
+    y = y.reshape(batch_shape + (size,))
+    y = np.moveaxis(y, -1, axis)
+
     return y
+
+
+@functools.lru_cache(maxsize=64)
+def _twiddles(field, size, forward):
+    """
+    Returns the twiddle factors ω^i for 0 <= i < N, where ω is a primitive N-th root of unity in GF(p). The
+    inverse transform uses ω^-1.
+    """
+    p = field.characteristic
+    m = (p - 1) // size
+    g = primitive_root(p)  # A generator of the multiplicative group of GF(p)
+    omega = field(g)**m if forward else field(g)**-m  # A primitive N-th root of unity in GF(p)
+
+    twiddles = omega ** np.arange(0, size, dtype=field.dtypes[-1])
+    twiddles.flags.writeable = False
+
+    return twiddles
@@ -5,6 +5,7 @@ import bisect
 import functools
 import itertools
 import math
+import os
 import random
 from typing import Tuple, List, Optional
 
@@ -22,11 +23,132 @@ __all__ = [
     "is_prime", "is_composite", "is_prime_power", "is_perfect_power", "is_smooth", "is_powersmooth",
 ]
 
-# Global variables to store the prime lookup table (will generate a larger list after defining the `primes()` function)
-PRIMES = [2, 3, 5, 7]
-MAX_K = len(PRIMES)  # The max prime index (1-indexed)
+# Global variables to store the prime lookup table. The table is an array of all primes up to MAX_N and grows on demand
+# using a segmented sieve (see `_grow_primes()`). It is initially small so that importing the library is cheap.
+PRIMES = np.array([2, 3, 5, 7], dtype=np.int64)
+MAX_K = PRIMES.size  # The max prime index (1-indexed)
 MAX_N = 10  # The max value for which all primes <= N are contained in the lookup table
 
+# Functions that query the lookup table for a single value, like `next_prime()`, only grow the table up to this limit.
+# Beyond it, they test candidates with `is_prime()`.
+LOOKUP_LIMIT = 10_000_000
+
+# The number of integers sieved at once in the segmented sieve
+SEGMENT_SIZE = 2**20
+
+# An optional .npy file that persists the prime lookup table across processes. It is memory-mapped when loaded.
+PRIMES_CACHE_ENV = "GALOIS_PRIMES_CACHE"
+
+
+###############################################################################
+# Prime lookup table
+###############################################################################
+
+def _sieve_segment(low: int, high: int, base_primes: np.ndarray) -> np.ndarray:
+    """
+    Returns the primes in [low, high) using the Sieve of Eratosthenes. The base primes must contain all primes up to sqrt(high).
+    """
+    is_prime_ = np.ones(high - low, dtype=bool)
+    if low < 2:
+        is_prime_[0:2 - low] = False
+
+    for p in base_primes.tolist():
+        if p*p >= high:
+            break
+        # Mark `p*p, p*(p+1), ...` as composite. Smaller multiples of `p` have a smaller prime factor and are already marked.
+        first_multiple = max(p*p, ((low + p - 1) // p) * p)
+        is_prime_[first_multiple - low::p] = False
+
+    return np.nonzero(is_prime_)[0].astype(np.int64) + low
+
+
+# The first 250 primes, which are used to quickly rule out composites in `is_prime()`
+SMALL_PRIMES = _sieve_segment(0, 1584, np.array([2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37], dtype=np.int64)).tolist()
+
+
+def _grow_primes(n: int):
+    """
+    Extends the prime lookup table so that it contains all primes up to n.
+    """
+    global PRIMES, MAX_K, MAX_N
+    if n <= MAX_N:
+        return
+
+    _load_primes_cache()
+    if n <= MAX_N:
+        return
+
+    # Grow the table geometrically so that repeatedly requesting slightly larger primes has amortized linear cost
+    n = max(n, 2*MAX_N)
+
+    # The base primes needed to sieve up to n are all primes up to sqrt(n)
+    _grow_primes(isqrt(n))
+    base_primes = PRIMES[0:np.searchsorted(PRIMES, isqrt(n), side="right")]
+
+    segments = [PRIMES]
+    for low in range(MAX_N + 1, n + 1, SEGMENT_SIZE):
+        high = min(low + SEGMENT_SIZE, n + 1)
+        segments.append(_sieve_segment(low, high, base_primes))
+
+    PRIMES = np.concatenate(segments)
+    MAX_K = PRIMES.size
+    MAX_N = n
+
+    _save_primes_cache()
+
+
+def _grow_kth_prime(k: int):
+    """
+    Extends the prime lookup table so that it contains at least the first k primes.
+    """
+    while MAX_K < k:
+        if k < 6:
+            n = 13
+        else:
+            # Rosser's theorem gives the upper bound p_k < k*(ln(k) + ln(ln(k))) for k >= 6
+            n = int(k * (math.log(k) + math.log(math.log(k)))) + 1
+        _grow_primes(max(n, MAX_N + 1))
+
+
+def _load_primes_cache():
+    """
+    Replaces the prime lookup table with the one persisted in the cache file, if it is larger. The cached array is memory-mapped read-only.
+    """
+    global PRIMES, MAX_K, MAX_N
+    path = os.environ.get(PRIMES_CACHE_ENV, None)
+    if not path or not os.path.exists(path):
+        return
+
+    try:
+        array = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return
+
+    # The cached array is the prime lookup table with MAX_N appended
+    if array.ndim == 1 and array.dtype == np.int64 and array.size > 1 and array[-1] > MAX_N:
+        PRIMES = array[0:-1]
+        MAX_K = PRIMES.size
+        MAX_N = int(array[-1])
+
+
+def _save_primes_cache():
+    """
+    Persists the prime lookup table to the cache file, if one is specified.
+    """
+    path = os.environ.get(PRIMES_CACHE_ENV, None)
+    if not path:
+        return
+
+    # Write to a temporary file and then atomically replace the cache so concurrent processes never read a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.append(PRIMES, MAX_N))
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 
 ###############################################################################
 # Prime generation
@@ -49,7 +171,11 @@ def primes(n: int) -> List[int]:
 
     Notes
     -----
-    This function implements the Sieve of Eratosthenes to efficiently find the primes.
+    This function implements a segmented Sieve of Eratosthenes to efficiently find the primes. The primes are stored in a
+    lookup table that grows as larger primes are requested, so subsequent calls only sieve the new range.
+
+    The lookup table may be persisted across processes by setting the `GALOIS_PRIMES_CACHE` environment variable to a
+    `.npy` file path. The cached table is memory-mapped when loaded and updated whenever the table grows.
 
     References
     ----------
@@ -62,53 +188,12 @@ def primes(n: int) -> List[int]:
         galois.primes(19)
         galois.primes(20)
     """
-    global PRIMES, MAX_K, MAX_N
     if not isinstance(n, (int, np.integer)):
         raise TypeError(f"Argument `n` must be an integer, not {type(n)}.")
 
-    if n <= MAX_N:
-        # Return a subset of the pre-computed global primes list
-        return PRIMES[0:bisect.bisect_right(PRIMES, n)]
-
-    N_odd = int(math.ceil(n/2)) - 1  # Number of odd integers (including n) to check starting at 3, i.e. skip 1
-    composite = np.zeros(N_odd, dtype=bool)  # Indices correspond to integers 3,5,7,9,...
-
-    # We only need to test integers for compositeness up to sqrt(n) because at that point the
-    # integers above sqrt(n) have already been marked by the multiples of earlier primes
-    max_composite = isqrt(n)  # Python 3.8 has math.isqrt(). Use this until the supported Python versions are bumped.
-    max_composite_idx = (max_composite - 3)//2
-
-    for i in range(0, max_composite_idx + 1):
-        if not composite[i]:
-            prime = i*2 + 3  # Convert index back to integer value
-
-            # We want to mark `2*prime, 3*prime, 4*prime, ...` as composite. We don't need to mark the
-            # even multiples because they're not in the composite array (which only has odds). So we'll
-            # mark `3*prime, 5*prime, ...`
-
-            delta = prime  # A delta of `2*prime` converted to an index of the odd composite array, i.e. `2*prime//2`
-            first_multiple = i + delta  # First odd multiple of the prime, i.e. `3*prime`
-
-            # Mark multiples of the prime that are odd (and in the composite array) as composite
-            composite[first_multiple::delta] = True
-
-    prime_idxs = np.where(composite == False)[0]  # pylint: disable=singleton-comparison
-    p = (prime_idxs*2 + 3).tolist()  # Convert indices back to odd integers
-    p.insert(0, 2)  # Add the only even prime, 2
-
-    # Replace the global primes lookup table with the newly-created, larger list
-    PRIMES = p
-    MAX_K = len(PRIMES)
-    MAX_N = n
-
-    return p
+    _grow_primes(n)
 
-
-# TODO: Don't build a large lookup table at import time. Instead, use the progressively-growing nature of PRIMES.
-# Generate a prime lookup table for efficient lookup in other algorithms
-PRIMES = primes(10_000_000)
-MAX_K = len(PRIMES)
-MAX_N = 10_000_000
+    return PRIMES[0:np.searchsorted(PRIMES, n, side="right")].tolist()
 
 
 @set_module("galois")
@@ -136,10 +221,12 @@ def kth_prime(k: int) -> int:
     """
     if not isinstance(k, (int, np.integer)):
         raise TypeError(f"Argument `k` must be an integer, not {type(k)}.")
-    if not 1 <= k <= MAX_K:
-        raise ValueError(f"Argument `k` is out of range of the prime lookup table. The lookup table only contains the first {MAX_K} primes (up to {MAX_N}).")
+    if not k >= 1:
+        raise ValueError(f"Argument `k` must be at least 1, not {k}.")
+
+    _grow_kth_prime(k)
 
-    return PRIMES[k - 1]
+    return int(PRIMES[k - 1])
 
 
 @set_module("galois")
@@ -171,8 +258,9 @@ def prev_prime(n: int) -> int:
         raise ValueError("There are no primes less than 2.")
 
     # Directly use lookup table
-    if n <= MAX_N:
-        return PRIMES[bisect.bisect_right(PRIMES, n) - 1]
+    if n <= LOOKUP_LIMIT:
+        _grow_primes(n)
+        return int(PRIMES[np.searchsorted(PRIMES, n, side="right") - 1])
 
     # TODO: Make this faster using wheel factorization
     n = n - 1 if n % 2 == 0 else n  # The next possible prime (which is odd)
@@ -211,8 +299,11 @@ def next_prime(n: int) -> int:
         raise TypeError(f"Argument `n` must be an integer, not {type(n)}.")
 
     # Directly use lookup table
-    if n < PRIMES[-1]:
-        return PRIMES[bisect.bisect_right(PRIMES, n)]
+    if n < LOOKUP_LIMIT:
+        _grow_primes(n)
+        k = np.searchsorted(PRIMES, n, side="right")  # The number of primes p <= n
+        _grow_kth_prime(k + 1)
+        return int(PRIMES[k])
 
     # TODO: Make this faster using wheel factorization
     n = n + 1 if n % 2 == 0 else n + 2  # The next possible prime (which is odd)
@@ -540,6 +631,9 @@ def miller_rabin_primality_test(n: int, a: int = 2, rounds: int = 1) -> bool:
     if not rounds >= 1:
         raise ValueError(f"Argument `rounds` must be at least 1, not {rounds}.")
 
+    # The subsequent rounds use the first primes as witnesses
+    _grow_kth_prime(rounds)
+
     # Write (n - 1) = 2^s * r, for odd r
     r, s = n - 1, 0
     while r % 2 == 0:
@@ -559,7 +653,7 @@ def miller_rabin_primality_test(n: int, a: int = 2, rounds: int = 1) -> bool:
             if y != n - 1:
                 return False  # a is a strong witness to the compositness of n
 
-        a = PRIMES[t]
+        a = int(PRIMES[t])
 
     return True  # n is a probable prime
 
@@ -1332,7 +1426,7 @@ def is_prime(n: int) -> bool:
 
     # Test n against the first few primes. If n is a multiple of them, it cannot be prime. This is very fast
     # and can quickly rule out many composites.
-    for p in PRIMES[0:250]:
+    for p in SMALL_PRIMES:
         if n == p:
             return True
         elif n % p == 0:
@@ -0,0 +1,503 @@
+"""
+A module that contains sparse matrices over Galois fields and a sparse linear system solver.
+"""
+from typing import Tuple, Optional, Union
+
+import numba
+import numpy as np
+
+from ._fields import FieldClass, FieldArray
+from ._lfsr import berlekamp_massey
+from ._overrides import set_module
+
+__all__ = ["SparseMatrix"]
+
+# The maximum number of Wiedemann iterations on the residual before the system is declared singular
+WIEDEMANN_MAX_ITERATIONS = 16
+
+
+@set_module("galois")
+class SparseMatrix:
+    r"""
+    A sparse matrix over a Galois field in compressed sparse row (CSR) format.
+
+    Only the non-zero elements are stored. The non-zero values of row :math:`i` are `data[indptr[i]:indptr[i + 1]]`, in
+    increasing order of their columns `indices[indptr[i]:indptr[i + 1]]`. Matrix-vector and matrix-matrix products with dense
+    :obj:`galois.FieldArray` operands use the field's JIT-compiled arithmetic and cost :math:`O(\textrm{nnz})` field operations
+    per column.
+
+    Parameters
+    ----------
+    array : galois.FieldArray
+        A dense 2-D matrix to convert. Use :func:`COO` to construct a large matrix from its non-zero entries instead.
+
+    Examples
+    --------
+    Construct a sparse matrix from its non-zero entries and multiply it with a dense vector.
+
+    .. ipython:: python
+
+        GF = galois.GF(31)
+        A = galois.SparseMatrix.COO(GF([3, 5, 7, 11]), [0, 0, 2, 3], [1, 3, 2, 0], (4, 4)); A
+        A.toarray()
+        x = GF([1, 2, 3, 4])
+        A @ x
+        A.toarray() @ x
+
+    Solve a sparse linear system.
+
+    .. ipython:: python
+
+        A = galois.SparseMatrix.Random(GF, (8, 8), 3, seed=1); A
+        b = GF.Random(8, seed=2)
+        x = A.solve(b); x
+        np.array_equal(A @ x, b)
+    """
+    __slots__ = ["_data", "_indices", "_indptr", "_shape"]
+
+    def __init__(self, array: FieldArray):
+        if not isinstance(array, FieldArray):
+            raise TypeError(f"Argument `array` must be a Galois field array, not {type(array)}.")
+        if not array.ndim == 2:
+            raise ValueError(f"Argument `array` must be 2-D, not {array.ndim}-D.")
+
+        rows, cols = np.nonzero(array.view(np.ndarray))
+        self._data = array[rows, cols]
+        self._indices = cols.astype(np.int64)
+        self._indptr = _indptr(rows.astype(np.int64), array.shape[0])
+        self._shape = array.shape
+
+    @classmethod
+    def _from_csr(cls, data, indices, indptr, shape):
+        """
+        Constructs a sparse matrix from its CSR arrays without copying or verifying them.
+        """
+        obj = object.__new__(cls)
+        obj._data = data
+        obj._indices = indices
+        obj._indptr = indptr
+        obj._shape = tuple(int(s) for s in shape)
+        return obj
+
+    ###############################################################################
+    # Alternate constructors
+    ###############################################################################
+
+    @classmethod
+    def COO(
+        cls,
+        data: FieldArray,
+        rows: Union[np.ndarray, list],
+        cols: Union[np.ndarray, list],
+        shape: Tuple[int, int]
+    ) -> "SparseMatrix":
+        r"""
+        Constructs a sparse matrix from coordinate (COO) format, where `A[rows[i], cols[i]] = data[i]`.
+
+        Parameters
+        ----------
+        data : galois.FieldArray
+            The 1-D array of values.
+        rows : numpy.ndarray, list
+            The row index of each value.
+        cols : numpy.ndarray, list
+            The column index of each value.
+        shape : tuple
+            The shape `(m, n)` of the matrix.
+
+        Returns
+        -------
+        galois.SparseMatrix
+            The sparse matrix. The values of repeated coordinates are summed and zero values are dropped.
+        """
+        if not isinstance(data, FieldArray):
+            raise TypeError(f"Argument `data` must be a Galois field array, not {type(data)}.")
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        if not (data.ndim == 1 and data.shape == rows.shape == cols.shape):
+            raise ValueError(f"Arguments `data`, `rows`, and `cols` must be 1-D with the same length, not {data.shape}, {rows.shape}, and {cols.shape}.")
+        if not (len(shape) == 2 and shape[0] >= 0 and shape[1] >= 0):
+            raise ValueError(f"Argument `shape` must be a 2-tuple of non-negative integers, not {shape}.")
+        m, n = int(shape[0]), int(shape[1])
+        if rows.size > 0 and not (0 <= np.min(rows) and np.max(rows) < m and 0 <= np.min(cols) and np.max(cols) < n):
+            raise ValueError(f"Arguments `rows` and `cols` must be valid indices into a matrix with shape {(m, n)}.")
+
+        # Sort the entries by row and then column, and sum the values of repeated coordinates
+        idxs = np.lexsort((cols, rows))
+        rows, cols, data = rows[idxs], cols[idxs], data[idxs]
+        if rows.size > 0:
+            starts = np.flatnonzero(np.concatenate(([True], (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1]))))
+            if starts.size < rows.size:
+                data = np.add.reduceat(data, starts)
+                rows, cols = rows[starts], cols[starts]
+            nonzero = data.view(np.ndarray) != 0
+            rows, cols, data = rows[nonzero], cols[nonzero], data[nonzero]
+
+        return cls._from_csr(data, cols, _indptr(rows, m), (m, n))
+
+    @classmethod
+    def Random(
+        cls,
+        field: FieldClass,
+        shape: Tuple[int, int],
+        row_weight: int,
+        seed: Optional[Union[int, np.random.Generator]] = None
+    ) -> "SparseMatrix":
+        r"""
+        Constructs a random sparse matrix with `row_weight` non-zero values in each row.
+
+        Parameters
+        ----------
+        field : galois.FieldClass
+            The Galois field of the matrix.
+        shape : tuple
+            The shape `(m, n)` of the matrix.
+        row_weight : int
+            The number of non-zero values in each row, at most :math:`n`. Their columns are distinct and chosen uniformly at random.
+        seed : int, numpy.random.Generator, optional
+            Non-negative integer used to initialize the PRNG. The default is `None` which means that unpredictable entropy will
+            be pulled from the OS to be used as the seed. A :obj:`numpy.random.Generator` can also be passed.
+
+        Returns
+        -------
+        galois.SparseMatrix
+            The random sparse matrix.
+        """
+        if not isinstance(field, FieldClass):
+            raise TypeError(f"Argument `field` must be a Galois field class, not {type(field)}.")
+        m, n = int(shape[0]), int(shape[1])
+        if not 0 <= row_weight <= n:
+            raise ValueError(f"Argument `row_weight` must be between 0 and {n}, not {row_weight}.")
+        rng = np.random.default_rng(seed)
+
+        if 2*row_weight > n:
+            # The rows are dense, so take the first columns of random permutations
+            cols = np.argsort(rng.random((m, n)), axis=1)[:,:row_weight]
+            cols.sort(axis=1)
+        else:
+            # Draw the columns of each row with replacement, and draw again for the rows with repeated columns
+            cols = rng.integers(0, n, size=(m, row_weight), dtype=np.int64)
+            cols.sort(axis=1)
+            repeated = np.any(cols[:,1:] == cols[:,:-1], axis=1)
+            while np.any(repeated):
+                new_cols = rng.integers(0, n, size=(np.count_nonzero(repeated), row_weight), dtype=np.int64)
+                new_cols.sort(axis=1)
+                cols[repeated] = new_cols
+                repeated = np.any(cols[:,1:] == cols[:,:-1], axis=1)
+
+        data = field.Random(m * row_weight, low=1, seed=rng)
+        indptr = np.arange(0, m*row_weight + 1, max(row_weight, 1), dtype=np.int64) if row_weight > 0 else np.zeros(m + 1, dtype=np.int64)
+
+        return cls._from_csr(data, cols.astype(np.int64).ravel(), indptr, (m, n))
+
+    ###############################################################################
+    # Properties
+    ###############################################################################
+
+    @property
+    def field(self) -> FieldClass:
+        """
+        galois.FieldClass: The Galois field of the matrix.
+        """
+        return type(self._data)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """
+        tuple: The shape `(m, n)` of the matrix.
+        """
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        """
+        int: The number of stored non-zero values.
+        """
+        return self._data.size
+
+    @property
+    def data(self) -> FieldArray:
+        """
+        galois.FieldArray: The non-zero values, ordered by row and then column.
+        """
+        return self._data
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        numpy.ndarray: The column index of each non-zero value.
+        """
+        return self._indices
+
+    @property
+    def indptr(self) -> np.ndarray:
+        """
+        numpy.ndarray: The length-:math:`m + 1` row pointers. The values of row `i` are `data[indptr[i]:indptr[i + 1]]`.
+        """
+        return self._indptr
+
+    @property
+    def T(self) -> "SparseMatrix":
+        """
+        galois.SparseMatrix: The transpose of the matrix.
+        """
+        m, n = self._shape
+        rows = np.repeat(np.arange(m, dtype=np.int64), np.diff(self._indptr))
+        idxs = np.argsort(self._indices, kind="stable")
+        return SparseMatrix._from_csr(self._data[idxs], rows[idxs], _indptr(self._indices[idxs], n), (n, m))
+
+    ###############################################################################
+    # Conversion
+    ###############################################################################
+
+    def toarray(self) -> FieldArray:
+        """
+        Converts the sparse matrix into a dense :obj:`galois.FieldArray`.
+        """
+        A = self.field.Zeros(self._shape, dtype=self._data.dtype)
+        rows = np.repeat(np.arange(self._shape[0], dtype=np.int64), np.diff(self._indptr))
+        A[rows, self._indices] = self._data
+        return A
+
+    ###############################################################################
+    # Arithmetic
+    ###############################################################################
+
+    # Make NumPy defer to __rmatmul__() for `x @ A`, where x is a Galois field array
+    __array_ufunc__ = None
+
+    def _matmul(self, X):
+        field = self.field
+        if not type(X) is field:
+            raise TypeError(f"Operation 'matmul' requires the dense operand to be a {field.name} array, not {type(X)}.")
+        if not X.ndim in [1, 2]:
+            raise ValueError(f"Operation 'matmul' requires the dense operand to be 1-D or 2-D, not {X.ndim}-D.")
+        if not X.shape[0] == self._shape[1]:
+            raise ValueError(f"Operation 'matmul' requires the last dimension of A to match the first dimension of X, not {self._shape} and {X.shape}.")
+
+        Y = field._sparse_matmul(self._indptr, self._indices, self._data, X.reshape(X.shape[0], -1).astype(self._data.dtype))
+        return Y.reshape((self._shape[0],) + X.shape[1:]).astype(X.dtype)
+
+    def __matmul__(self, other):
+        if not isinstance(other, FieldArray):
+            return NotImplemented
+        return self._matmul(other)
+
+    def __rmatmul__(self, other):
+        if not isinstance(other, FieldArray):
+            return NotImplemented
+        # x A = (A^T x^T)^T
+        return self.T._matmul(other.T).T
+
+    def __repr__(self):
+        return f"SparseMatrix(shape={self._shape}, nnz={self.nnz}, field={self.field.name})"
+
+    ###############################################################################
+    # Linear systems
+    ###############################################################################
+
+    def solve(self, b: FieldArray, seed: Optional[Union[int, np.random.Generator]] = None) -> FieldArray:
+        r"""
+        Solves the linear system :math:`\mathbf{A} \mathbf{x} = \mathbf{b}` for a square, non-singular sparse matrix :math:`\mathbf{A}`.
+
+        Parameters
+        ----------
+        b : galois.FieldArray
+            The length-:math:`n` right-hand side.
+        seed : int, numpy.random.Generator, optional
+            Non-negative integer used to initialize the PRNG of the Wiedemann algorithm. The default is `None` which means that
+            unpredictable entropy will be pulled from the OS to be used as the seed. A :obj:`numpy.random.Generator` can also be passed.
+
+        Returns
+        -------
+        galois.FieldArray
+            The solution :math:`\mathbf{x}`.
+
+        Notes
+        -----
+        A structured elimination pass first solves, without fill-in, every unknown that is the only remaining unknown of some row.
+        This repeats until no such row is left. Sparse systems like LDPC parity checks often reduce substantially, or entirely.
+
+        The remaining system of size :math:`d` is solved with the Wiedemann algorithm. It computes the sequence
+        :math:`s_k = \mathbf{u}^T \mathbf{A}^k \mathbf{b}` for a random :math:`\mathbf{u}` and :math:`0 \le k < 2d`. The
+        Berlekamp-Massey algorithm finds its minimal polynomial :math:`f(x) = \sum_j f_j x^j`, from which
+        :math:`\mathbf{x} = -f_0^{-1} \sum_{j \ge 1} f_j \mathbf{A}^{j-1} \mathbf{b}`. If :math:`f(x)` only annihilates part of the
+        Krylov space, which is likely over small fields, the algorithm is repeated on the residual. Only :math:`O(n)` vectors are
+        stored, and the :math:`\mathbf{A}` products cost :math:`O(d \cdot \textrm{nnz})`.
+
+        Raises
+        ------
+        numpy.linalg.LinAlgError
+            If :math:`\mathbf{A}` is singular and no solution was found.
+        """
+        field = self.field
+        if not type(b) is field:
+            raise TypeError(f"Argument `b` must be a {field.name} array, not {type(b)}.")
+        m, n = self._shape
+        if not m == n:
+            raise np.linalg.LinAlgError(f"The sparse matrix must be square, not {self._shape}.")
+        if not b.shape == (n,):
+            raise np.linalg.LinAlgError(f"Argument `b` must have shape {(n,)}, not {b.shape}.")
+        rng = np.random.default_rng(seed)
+        b = b.astype(self._data.dtype)
+
+        # Solve the unknowns found by structured elimination, level by level. The unknowns of a level only depend on the
+        # unknowns of the earlier levels, and the unsolved unknowns of x are zero, so A[rows] @ x sums only the solved terms.
+        AT = self.T
+        pivot_rows, pivot_cols, pivot_idxs, level_starts = _peel(self._indptr, self._indices, AT._indptr, AT._indices)
+        x = field.Zeros(n, dtype=b.dtype)
+        for start, stop in zip(level_starts[:-1], level_starts[1:]):
+            rows, cols = pivot_rows[start:stop], pivot_cols[start:stop]
+            r = b[rows] - self._rows(rows) @ x
+            x[cols] = r / self._data[pivot_idxs[start:stop]]
+
+        # Solve the remaining core system with the Wiedemann algorithm
+        core_rows = np.setdiff1d(np.arange(n), pivot_rows)
+        core_cols = np.setdiff1d(np.arange(n), pivot_cols)
+        if core_rows.size > 0:
+            # The unsolved rows and columns of a non-singular matrix are equal in number
+            A_rest = self._rows(core_rows)
+            r = b[core_rows] - A_rest @ x
+            A_core = A_rest._columns(core_cols)
+            x[core_cols] = _wiedemann(A_core, r, rng)
+
+        if not np.array_equal(self @ x, b):
+            raise np.linalg.LinAlgError("The sparse matrix is singular.")
+
+        return x
+
+    def _rows(self, rows):
+        """
+        Returns the sparse matrix of the given rows.
+        """
+        starts, stops = self._indptr[rows], self._indptr[rows + 1]
+        lengths = stops - starts
+        idxs = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(np.sum(lengths), dtype=np.int64)
+        indptr = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        return SparseMatrix._from_csr(self._data[idxs], self._indices[idxs], indptr, (rows.size, self._shape[1]))
+
+    def _columns(self, cols):
+        """
+        Returns the sparse matrix of the given increasing columns, dropping the values in the other columns.
+        """
+        new_index = np.full(self._shape[1], -1, dtype=np.int64)
+        new_index[cols] = np.arange(cols.size, dtype=np.int64)
+        keep = new_index[self._indices] >= 0
+        rows = np.repeat(np.arange(self._shape[0], dtype=np.int64), np.diff(self._indptr))[keep]
+        return SparseMatrix._from_csr(self._data[keep], new_index[self._indices[keep]], _indptr(rows, self._shape[0]), (self._shape[0], cols.size))
+
+
+def _indptr(rows, m):
+    """
+    Returns the CSR row pointers of the increasing row indices of the non-zero values.
+    """
+    return np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=m)))).astype(np.int64)
+
+
+def _wiedemann(A, b, rng):
+    """
+    Solves the square sparse system A x = b with the Wiedemann algorithm, iterating on the residual.
+    """
+    field = A.field
+    if not A.shape[0] == A.shape[1]:
+        raise np.linalg.LinAlgError("The sparse matrix is singular.")
+    d = A.shape[0]
+    x = field.Zeros(d, dtype=b.dtype)
+    r = b.copy()
+
+    for _ in range(WIEDEMANN_MAX_ITERATIONS):
+        if np.count_nonzero(r.view(np.ndarray)) == 0:
+            return x
+
+        # The sequence s_k = u^T A^k r
+        u = field.Random(d, seed=rng, dtype=b.dtype)
+        s = field.Zeros(2*d, dtype=b.dtype)
+        v = r
+        for k in range(2*d):
+            s[k] = np.dot(u, v)
+            v = A @ v
+
+        # The minimal polynomial f(x) of the sequence, with ascending coefficients f_0, ..., f_L
+        f = berlekamp_massey(s, config="galois").coeffs[::-1]
+        if f[0] == 0:
+            continue
+
+        # y = -1/f_0 sum_{j >= 1} f_j A^(j-1) r
+        y = field.Zeros(d, dtype=b.dtype)
+        v = r
+        for j in range(1, f.size):
+            y += f[j] * v
+            if j < f.size - 1:
+                v = A @ v
+        y *= -np.reciprocal(f[0])
+
+        x += y
+        r = b - A @ x
+
+    if np.count_nonzero(r.view(np.ndarray)) == 0:
+        return x
+
+    raise np.linalg.LinAlgError("The sparse matrix is singular.")
+
+
+@numba.jit(nopython=True, cache=True)
+def _peel(INDPTR, INDICES, T_INDPTR, T_INDICES):  # pragma: no cover
+    """
+    Structured elimination of the square sparse matrix with CSR arrays (INDPTR, INDICES) and transposed CSR arrays (T_INDPTR,
+    T_INDICES). A row with exactly one unsolved column solves that column, which is then removed from the other rows.
+
+    Returns the pivot rows, columns, and indices into the CSR values in the order they are solved, and the start of each level
+    of pivots. The pivots of a level only depend on the pivots of the earlier levels.
+    """
+    m = INDPTR.size - 1
+    n = T_INDPTR.size - 1
+    weight = INDPTR[1:] - INDPTR[:-1]
+    row_done = np.zeros(m, dtype=np.bool_)
+    col_done = np.zeros(n, dtype=np.bool_)
+
+    pivot_rows = np.zeros(min(m, n), dtype=np.int64)
+    pivot_cols = np.zeros(min(m, n), dtype=np.int64)
+    pivot_idxs = np.zeros(min(m, n), dtype=np.int64)
+    level_starts = np.zeros(min(m, n) + 1, dtype=np.int64)
+    N_pivots = 0
+    N_levels = 0
+
+    frontier = np.flatnonzero(weight == 1)
+    while frontier.size > 0:
+        level_starts[N_levels] = N_pivots
+        N_levels += 1
+        start = N_pivots
+
+        for r in frontier:
+            if row_done[r] or weight[r] != 1:
+                continue
+            # The row's unsolved column may have been solved by another row of this level
+            idx = -1
+            for t in range(INDPTR[r], INDPTR[r + 1]):
+                if not col_done[INDICES[t]]:
+                    idx = t
+                    break
+            if idx == -1:
+                continue
+            row_done[r] = True
+            col_done[INDICES[idx]] = True
+            pivot_rows[N_pivots] = r
+            pivot_cols[N_pivots] = INDICES[idx]
+            pivot_idxs[N_pivots] = idx
+            N_pivots += 1
+
+        # Remove the solved columns from the other rows, which become the next level's candidates
+        candidates = [np.int64(0) for _ in range(0)]
+        for p in range(start, N_pivots):
+            c = pivot_cols[p]
+            for t in range(T_INDPTR[c], T_INDPTR[c + 1]):
+                r = T_INDICES[t]
+                if not row_done[r]:
+                    weight[r] -= 1
+                    if weight[r] == 1:
+                        candidates.append(r)
+        frontier = np.array(candidates, dtype=np.int64)
+
+    level_starts[N_levels] = N_pivots
+
+    return pivot_rows[:N_pivots], pivot_cols[:N_pivots], pivot_idxs[:N_pivots], level_starts[:N_levels + 1]
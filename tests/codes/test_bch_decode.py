@@ -47,6 +47,21 @@ def test_exceptions():
         bch.decode(GF.Random(n - 1))
 
 
+@pytest.mark.parametrize("size", CODES)
+def test_packed(size):
+    n, k = size[0], size[1]
+    N = 100
+    bch = galois.BCH(n, k)
+    M = galois.GF2.Random((N, k))
+    C = bch.encode(M)
+    E, N_errors = random_errors(galois.GF2, N, n, bch.t)
+    R = C + E
+
+    DEC_M, N_corr = bch.decode(galois.GF2Packed(R), errors=True)
+    assert type(DEC_M) is galois.GF2Packed
+    assert np.array_equal(DEC_M.unpack(), M)
+    assert np.array_equal(N_corr, N_errors)
+
 class TestSystematic:
     @pytest.mark.parametrize("size", CODES)
     def test_all_correctable(self, size):
@@ -47,6 +47,28 @@ def test_exceptions():
         bch.detect(GF.Random(n - 1))
 
 
+@pytest.mark.parametrize("size", CODES)
+def test_packed(size):
+    n, k = size[0], size[1]
+    N = 100
+    bch = galois.BCH(n, k)
+    M = galois.GF2.Random((N, k))
+    C = bch.encode(M)
+    E, N_errors = random_errors(galois.GF2, N, n, bch.d - 1)
+    R = C + E
+
+    detected = bch.detect(galois.GF2Packed(R))
+    assert type(detected) is np.ndarray
+    assert np.array_equal(detected, N_errors > 0)
+
+    # Shortened codes
+    detected = bch.detect(galois.GF2Packed(R[:, 1:]))
+    assert np.array_equal(detected, bch.detect(R[:, 1:]))
+
+    detected = bch.detect(galois.GF2Packed(R[0]))
+    assert detected == (N_errors[0] > 0)
+
+
 class TestSystematic:
     @pytest.mark.parametrize("size", CODES)
     def test_no_errors(self, size):
@@ -450,3 +450,21 @@ class Test_n31_k21_shortened:
         C = bch.encode(self.M.view(np.ndarray), parity_only=True)
         assert type(C) is np.ndarray
         assert np.array_equal(C, C_truth[:, -(self.n - self.k):])
+
+
+@pytest.mark.parametrize("size", [(15, 7), (63, 39), (127, 64), (255, 223)])
+def test_packed(size):
+    n, k = size[0], size[1]
+    for systematic in [True, False]:
+        bch = galois.BCH(n, k, systematic=systematic)
+        m = galois.GF2.Random((10, k))
+        c = bch.encode(galois.GF2Packed(m))
+        assert type(c) is galois.GF2Packed
+        assert np.array_equal(c.unpack(), bch.encode(m))
+        if systematic:
+            c = bch.encode(galois.GF2Packed(m), parity_only=True)
+            assert np.array_equal(c.unpack(), bch.encode(m, parity_only=True))
+
+            # Shortened codes
+            c = bch.encode(galois.GF2Packed(m[:, 3:]))
+            assert np.array_equal(c.unpack(), bch.encode(m[:, 3:]))
@@ -45,6 +45,31 @@ def test_exceptions():
         rs.decode(GF.Random(n - 1))
 
 
+@pytest.mark.parametrize("mode,parallel", [("jit-calculate", False), ("jit-lookup", True), ("jit-calculate", True)])
+@pytest.mark.parametrize("size", [(15, 9, 1), (16, 10, 2), (26, 20, 3)])
+def test_compile_modes(size, mode, parallel, monkeypatch):
+    n, k, c = size[0], size[1], size[2]
+    N = 100
+    rs = galois.ReedSolomon(n, k, c=c)
+    GF = rs.field
+    M = GF.Random((N, k))
+    C = rs.encode(M)
+    E, N_errors = random_errors(GF, N, n, rs.t + 1)
+    R = C + E
+    DEC_M, N_corr = rs.decode(R, errors=True)
+
+    # Use the multithreaded decoder even for these small inputs
+    monkeypatch.setattr(galois._fields._ufuncs, "PARALLEL_MIN_SIZE", 1)
+    GF.compile(mode, parallel=parallel)
+    try:
+        DEC_M_2, N_corr_2 = rs.decode(R, errors=True)
+        assert type(DEC_M_2) is GF
+        assert np.array_equal(DEC_M_2, DEC_M)
+        assert np.array_equal(N_corr_2, N_corr)
+    finally:
+        GF.compile("auto")
+
+
 class TestSystematic:
     @pytest.mark.parametrize("size", CODES)
     def test_all_correctable(self, size):
@@ -50,6 +50,155 @@ def test_multiply(field_multiply):
     assert z.dtype == dtype
 
 
+def test_add_multiply_non_contiguous(field_multiply):
+    GF, X, Y, Z = field_multiply["GF"], field_multiply["X"], field_multiply["Y"], field_multiply["Z"]
+    dtype = random.choice(GF.dtypes)
+    x = np.stack([X, X]).astype(dtype).transpose(2, 0, 1)
+    y = np.stack([Y, Y]).astype(dtype).transpose(2, 0, 1)
+
+    z = x * y
+    assert np.array_equal(z, np.stack([Z, Z]).transpose(2, 0, 1))
+    assert type(z) is GF
+    assert z.dtype == dtype
+
+    z = x + y - y
+    assert np.array_equal(z, x)
+    assert type(z) is GF
+    assert z.dtype == dtype
+
+
+def test_multiply_scalar_by_large_array(field_multiply):
+    GF, X, Y, Z = field_multiply["GF"], field_multiply["X"], field_multiply["Y"], field_multiply["Z"]
+    dtype = random.choice(GF.dtypes)
+    i = random.randint(0, X.shape[0] - 1)
+    reps = -(-2048 // Y.shape[1])  # Large enough to use the scalar's product tables in GF(2^m)
+    x = X[i, 0].astype(dtype)
+    y = np.tile(Y[i, :], (reps, 1)).astype(dtype)
+
+    z = x * y
+    assert np.array_equal(z, np.tile(Z[i, :], (reps, 1)))
+    assert type(z) is GF
+    assert z.dtype == dtype
+
+    z = y.T * x
+    assert np.array_equal(z, np.tile(Z[i, :], (reps, 1)).T)
+    assert type(z) is GF
+    assert z.dtype == dtype
+
+
+def test_multiply_scalar_by_large_array_out(field_multiply):
+    GF, X, Y, Z = field_multiply["GF"], field_multiply["X"], field_multiply["Y"], field_multiply["Z"]
+    dtype = random.choice(GF.dtypes)
+    i = random.randint(0, X.shape[0] - 1)
+    reps = -(-2048 // Y.shape[1])
+    x = X[i, 0].astype(dtype)
+    y = np.tile(Y[i, :], (reps, 1)).astype(dtype)
+
+    z = GF.Zeros(y.shape, dtype=dtype)
+    np.multiply(x, y, out=z)
+    assert np.array_equal(z, np.tile(Z[i, :], (reps, 1)))
+
+    np.multiply(y, x, out=y)
+    assert np.array_equal(y, np.tile(Z[i, :], (reps, 1)))
+
+
+def test_multiply_accumulate(field_multiply):
+    GF, X, Y, Z = field_multiply["GF"], field_multiply["X"], field_multiply["Y"], field_multiply["Z"]
+    dtype = random.choice(GF.dtypes)
+    i = random.randint(0, X.shape[0] - 1)
+    for reps in [1, -(-2048 // Y.shape[1])]:
+        c = X[i, 0].astype(dtype)
+        x = np.tile(Y[i, :], (reps, 1)).astype(dtype)
+        y = GF.Random(x.shape, dtype=dtype)
+        y_plus_cx = y + np.tile(Z[i, :], (reps, 1))
+
+        z = GF.multiply_accumulate(y, c, x)
+        assert z is y
+        assert np.array_equal(y, y_plus_cx)
+        assert y.dtype == dtype
+
+
+def test_multiply_accumulate_exceptions():
+    GF = galois.GF(2**8)
+    with pytest.raises(TypeError):
+        GF.multiply_accumulate(GF.Zeros(4), 3, galois.GF(2**4).Random(4))
+    with pytest.raises(ValueError):
+        GF.multiply_accumulate(GF.Zeros(4), 3, GF.Random(5))
+    with pytest.raises(ValueError):
+        GF.multiply_accumulate(GF.Zeros(4), GF([1, 2]), GF.Random(4))
+
+
+def test_multiply_scalar_by_large_array_gf2m_product_tables(monkeypatch):
+    # Multiplying two arrays with the same field and dtype must still reach GF(2^m)'s product tables
+    GF = galois.GF(2**8)
+    x = GF(3)
+    y = GF.Random(2048)
+    calls = []
+    scalar_multiply = GF._scalar_multiply
+    monkeypatch.setattr(GF, "_scalar_multiply", lambda *args, **kwargs: calls.append(args) or scalar_multiply(*args, **kwargs))
+
+    z = x * y
+    assert len(calls) == 1
+    assert np.array_equal(z, GF._ufunc("multiply")(3, y.view(np.ndarray)))
+    assert type(z) is GF
+
+
+def test_add_out(field_add):
+    GF, X, Y, Z = field_add["GF"], field_add["X"], field_add["Y"], field_add["Z"]
+    # Every dtype is tested because GF(p) arrays of narrow dtypes use native NumPy arithmetic and the others use the ufuncs
+    for dtype in GF.dtypes:
+        x = X.astype(dtype)
+        y = Y.astype(dtype)
+
+        z = GF.Zeros(Z.shape, dtype=dtype)
+        np.add(x, y, out=z)
+        assert np.array_equal(z, Z)
+
+        np.add(x, y, out=x)
+        assert np.array_equal(x, Z)
+        assert x.dtype == dtype
+
+
+def test_subtract_out(field_subtract):
+    GF, X, Y, Z = field_subtract["GF"], field_subtract["X"], field_subtract["Y"], field_subtract["Z"]
+    for dtype in GF.dtypes:
+        x = X.astype(dtype)
+        y = Y.astype(dtype)
+
+        z = GF.Zeros(Z.shape, dtype=dtype)
+        np.subtract(x, y, out=z)
+        assert np.array_equal(z, Z)
+
+        np.subtract(x, y, out=x)
+        assert np.array_equal(x, Z)
+        assert x.dtype == dtype
+
+
+def test_multiply_out(field_multiply):
+    GF, X, Y, Z = field_multiply["GF"], field_multiply["X"], field_multiply["Y"], field_multiply["Z"]
+    for dtype in GF.dtypes:
+        x = X.astype(dtype)
+        y = Y.astype(dtype)
+
+        z = GF.Zeros(Z.shape, dtype=dtype)
+        np.multiply(x, y, out=z)
+        assert np.array_equal(z, Z)
+
+        np.multiply(x, y, out=x)
+        assert np.array_equal(x, Z)
+        assert x.dtype == dtype
+
+
+def test_additive_inverse_out(field_additive_inverse):
+    GF, X, Z = field_additive_inverse["GF"], field_additive_inverse["X"], field_additive_inverse["Z"]
+    for dtype in GF.dtypes:
+        x = X.astype(dtype)
+
+        z = GF.Zeros(Z.shape, dtype=dtype)
+        np.negative(x, out=z)
+        assert np.array_equal(z, Z)
+
+
 def test_divide(field_divide):
     GF, X, Y, Z = field_divide["GF"], field_divide["X"], field_divide["Y"], field_divide["Z"]
     dtype = random.choice(GF.dtypes)
@@ -171,13 +320,41 @@ def test_square(field_power):
 def test_log(field_log):
     GF, X, Z = field_log["GF"], field_log["X"], field_log["Z"]
     dtype = random.choice(GF.dtypes)
-    if GF.order > 2**16:  # TODO: Skip slow log() for very large fields
-        return
     x = X.astype(dtype)
     z = np.log(x)
     assert np.array_equal(z, Z)
 
 
+@pytest.mark.parametrize("GF", [galois.GF(2**32), galois.GF(2**61 - 1), galois.GF(3**5, compile="jit-calculate")])
+def test_log_pohlig_hellman(GF):
+    alpha = GF(GF.primitive_element)
+    x = GF.Random((10, 10), low=1, seed=1)
+    z = np.log(x)
+    assert z.shape == x.shape
+    assert np.all((0 <= z) & (z < GF.order - 1))
+    assert np.array_equal(alpha ** z, x)
+    assert GF._discrete_log_tables is not None
+
+    z = np.log(x[0,0])
+    assert np.ndim(z) == 0
+    assert alpha ** z == x[0,0]
+    assert np.log(alpha) == 1
+    assert np.log(GF(1)) == 0
+
+
+def test_log_large_prime_factor():
+    # p - 1 = 2q for the prime q ~ 2^30, which needs a capped baby-step table and many giant steps
+    GF = galois.GF(2147483783)
+    alpha = GF(GF.primitive_element)
+    x = GF.Random(10, low=1, seed=1)
+    assert np.array_equal(alpha ** np.log(x), x)
+
+    # The prime factors 2^127 - 1 and ~2^45 of p^m - 1 are too large, so the discrete logarithm fails fast
+    for GF in [galois.GF(2**127), galois.GF(70368744181907)]:
+        with pytest.raises(NotImplementedError):
+            np.log(GF.Random(10, low=1, seed=1))
+
+
 # class TestArithmeticNonField:
 
 
@@ -20,10 +20,6 @@ def test_additive_order(field_additive_order):
 
 def test_multiplicative_order(field_multiplicative_order):
     GF, X, Z = field_multiplicative_order["GF"], field_multiplicative_order["X"], field_multiplicative_order["Z"]
-    if GF.dtypes[-1] == np.object_:
-        # FIXME: Skipping large fields because they're too slow
-        return
-
     dtype = random.choice(GF.dtypes)
     x = X.astype(dtype)
     z = x.multiplicative_order()
@@ -84,22 +80,55 @@ def test_minimal_poly_element(field_minimal_poly_element):
         A.minimal_poly()
 
 
-# def test_minimal_poly_matrix(field_minimal_poly_matrix):
-#     GF, X, Z = field_minimal_poly_matrix["GF"], field_minimal_poly_matrix["X"], field_minimal_poly_matrix["Z"]
+def test_characteristic_poly_matrix_large():
+    GF = galois.GF(2**8)
+    A = GF.Random((100, 100), seed=1)
+    poly = A.characteristic_poly()
+    assert poly.degree == 100
+    assert poly.coeffs[1] == -np.trace(A)
+    assert poly.coeffs[-1] == np.linalg.det(-A)
+    # The characteristic polynomial annihilates A (Cayley-Hamilton)
+    assert np.all(poly(A, elementwise=False) == 0)
+
+
+def test_minimal_poly_matrix(field_characteristic_poly_matrix):
+    GF, X, Z = field_characteristic_poly_matrix["GF"], field_characteristic_poly_matrix["X"], field_characteristic_poly_matrix["Z"]
+
+    for i in range(len(X)):
+        dtype = random.choice(GF.dtypes)
+        xi = X[i].astype(dtype)
+        zi = xi.minimal_poly()
+        assert zi.coeffs[0] == 1
+        assert np.all(zi(xi, elementwise=False) == 0)
+        # The minimal polynomial divides the characteristic polynomial
+        assert Z[i] % zi == 0
+        # No polynomial of smaller degree annihilates the matrix, so I, A, ..., A^(d-1) are linearly independent
+        powers = np.stack([np.linalg.matrix_power(xi, k).flatten() for k in range(zi.degree)])
+        assert np.linalg.matrix_rank(powers) == zi.degree
+
+    # Only 2-D square arrays are allowed
+    with pytest.raises(ValueError):
+        A = GF.Random((2,3))
+        A.minimal_poly()
+
+
+def test_minimal_poly_matrix_structured():
+    GF = galois.GF(7)
+    I = GF.Identity(4)
+    assert I.minimal_poly() == galois.Poly([1, -1], field=GF)
+    assert I.characteristic_poly() == galois.Poly([1, -1], field=GF)**4
+    assert GF.Zeros((4, 4)).minimal_poly() == galois.Poly.Identity(GF)
 
-#     for i in range(len(X)):
-#         dtype = random.choice(GF.dtypes)
-#         xi = X[i].astype(dtype)
-#         zi = xi.minimal_poly()
-#         assert zi == Z[i]
+    # A block diagonal matrix with a 2x2 Jordan block and a repeated eigenvalue has a minimal polynomial of degree 3
+    A = GF([[2, 1, 0, 0], [0, 2, 0, 0], [0, 0, 2, 0], [0, 0, 0, 3]])
+    assert A.minimal_poly() == galois.Poly.Roots([2, 2, 3], field=GF)
+    assert A.characteristic_poly() == galois.Poly.Roots([2, 2, 2, 3], field=GF)
 
-#     # Only 2-D square arrays are allowed
-#     with pytest.raises(ValueError):
-#         A = GF.Random(5)
-#         A.minimal_poly()
-#     with pytest.raises(ValueError):
-#         A = GF.Random((2,3))
-#         A.minimal_poly()
+    GF = galois.GF(2**8)
+    A = GF.Random((100, 100), seed=1)
+    poly = A.minimal_poly()
+    assert np.all(poly(A, elementwise=False) == 0)
+    assert A.characteristic_poly() % poly == 0
 
 
 def test_field_trace(field_trace):
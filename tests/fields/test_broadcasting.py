@@ -90,6 +90,5 @@ def check_results(field, shape1, shape2, shape_result):
     assert z.shape == a.shape
 
     # Test np.log ufunc
-    if field.order <= 2**16:  # TODO: Skip slow log() for very large fields
-        z = np.log(b)
-        assert z.shape == b.shape
+    z = np.log(b)
+    assert np.shape(z) == b.shape
@@ -45,7 +45,7 @@ ATTRIBUTES = [
     "irreducible_poly", "is_primitive_poly", "primitive_element", "primitive_elements",
     "is_prime_field", "is_extension_field", "prime_subfield",
     "dtypes", "display_mode", "properties",
-    "ufunc_mode", "ufunc_modes",
+    "ufunc_mode", "ufunc_modes", "ufunc_target",
 ]
 
 @pytest.mark.parametrize("attribute", ATTRIBUTES)
@@ -87,3 +87,102 @@ def test_is_primitive_poly():
     poly = galois.conway_poly(3, 101)
     GF = galois.GF(3**101, irreducible_poly=poly, primitive_element="x", verify=False)
     assert GF.is_primitive_poly == True
+
+
+@pytest.mark.parametrize("order", [2**8, 3**3, 31])
+def test_lookup_table_cache(order, tmp_path, monkeypatch):
+    monkeypatch.setenv("GALOIS_LOOKUP_TABLE_CACHE", str(tmp_path))
+    GF = galois.GF(order, compile="jit-lookup")
+    EXP, LOG, ZECH_LOG = GF._EXP.copy(), GF._LOG.copy(), GF._ZECH_LOG.copy()
+
+    # Rebuilding the lookup tables saves them to the cache directory
+    monkeypatch.setattr(GF, "_EXP", np.array([], dtype=np.int64))
+    GF._build_lookup_tables()
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Loading the lookup tables from the cache directory produces the same tables
+    monkeypatch.setattr(GF, "_EXP", np.array([], dtype=np.int64))
+    monkeypatch.setattr(GF, "_LOG", np.array([], dtype=np.int64))
+    monkeypatch.setattr(GF, "_ZECH_LOG", np.array([], dtype=np.int64))
+    assert GF._load_lookup_tables()
+    assert np.array_equal(GF._EXP, EXP)
+    assert np.array_equal(GF._LOG, LOG)
+    assert np.array_equal(GF._ZECH_LOG, ZECH_LOG)
+
+
+@pytest.mark.parametrize("order,dtype", [(2**7, np.int8), (2**8, np.int16), (3**5, np.int16), (2**16, np.int32), (31, np.int8)])
+def test_lookup_table_dtype(order, dtype):
+    GF = galois.GF(order, compile="jit-lookup")
+    assert GF._EXP.dtype == GF._LOG.dtype == GF._ZECH_LOG.dtype == dtype
+
+
+@pytest.mark.parametrize("order", [2**8, 3**3, 31])
+def test_lookup_table_mmap(order, tmp_path, monkeypatch):
+    monkeypatch.setenv("GALOIS_LOOKUP_TABLE_CACHE", str(tmp_path))
+    monkeypatch.setenv("GALOIS_LOOKUP_TABLE_MMAP", "1")
+    GF = galois.GF(order, compile="jit-lookup")
+    EXP, LOG, ZECH_LOG = GF._EXP.copy(), GF._LOG.copy(), GF._ZECH_LOG.copy()
+    A = GF.Random((6, 6))
+    A_rre = A.row_reduce()
+
+    # Rebuilding the lookup tables saves them to the cache directory and memory-maps them read-only
+    monkeypatch.setattr(GF, "_EXP", np.array([], dtype=np.int64))
+    monkeypatch.setattr(GF, "_LOG", np.array([], dtype=np.int64))
+    monkeypatch.setattr(GF, "_ZECH_LOG", np.array([], dtype=np.int64))
+    GF._build_lookup_tables()
+    assert not GF._EXP.flags.writeable
+    assert np.array_equal(GF._EXP, EXP)
+    assert np.array_equal(GF._LOG, LOG)
+    assert np.array_equal(GF._ZECH_LOG, ZECH_LOG)
+
+    # The JIT-compiled functions that are passed the tables accept the read-only tables
+    assert np.array_equal(A.row_reduce(), A_rre)
+
+
+@pytest.mark.parametrize("order,irreducible_poly,primitive_element", [(2**8, None, None), (2**8, 283, 19), (3**5, None, None), (7**3, 643, 244), (31, None, None)])
+def test_lookup_tables(order, irreducible_poly, primitive_element):
+    GF = galois.GF(order, irreducible_poly=irreducible_poly, primitive_element=primitive_element, compile="jit-lookup")
+    GF_calculate = galois.GF(order, irreducible_poly=irreducible_poly, primitive_element=primitive_element, compile="jit-calculate")
+    alpha = GF_calculate.primitive_element
+    i = np.arange(order - 1)
+    assert np.array_equal(GF._EXP[0:order - 1], alpha ** i)
+    assert np.array_equal(GF._EXP[order - 1:2*order - 1], GF._EXP[0:order])
+    assert np.array_equal(GF._LOG[GF._EXP[0:order - 1]], i)
+    one_plus = (GF_calculate(1) + alpha ** i).view(np.ndarray)
+    assert np.array_equal(GF._ZECH_LOG[0:order - 1], GF._LOG[one_plus])
+
+
+def test_lookup_tables_not_primitive():
+    # x is not a multiplicative generator of GF(2^8) with the AES irreducible polynomial
+    with pytest.raises(RuntimeError):
+        galois.GF(2**8, irreducible_poly=0x11b, primitive_element=2, verify=False, compile="jit-lookup")
+
+
+@pytest.mark.parametrize("order,mode", [(2, "jit-calculate"), (2**8, "jit-lookup"), (2**8, "jit-calculate"), (3**5, "jit-lookup"), (31, "jit-calculate")])
+def test_compile_parallel(order, mode, monkeypatch):
+    GF = galois.GF(order, compile=mode)
+    x = GF.Random((10, 300))
+    y = GF.Random((10, 300), low=1)
+    A = GF.Random((5, 10))
+    p = galois.Poly.Random(5, field=GF)
+    results = [x + y, x - y, x * y, x / y, -x, x ** 3, x * y[0, 0], A @ x, np.convolve(x[0], y[0]), p(x), divmod(galois.Poly(x[0]), p)]
+
+    # Use the multithreaded ufuncs and functions even for these small inputs
+    monkeypatch.setattr(galois._fields._ufuncs, "PARALLEL_MIN_SIZE", 1)
+    GF.compile(mode, parallel=True)
+    try:
+        assert GF.ufunc_target == "parallel"
+        results_parallel = [x + y, x - y, x * y, x / y, -x, x ** 3, x * y[0, 0], A @ x, np.convolve(x[0], y[0]), p(x), divmod(galois.Poly(x[0]), p)]
+        for result, result_parallel in zip(results, results_parallel):
+            assert np.array_equal(result, result_parallel)
+    finally:
+        GF.compile("auto")
+    assert GF.ufunc_target == "cpu"
+
+
+def test_compile_parallel_exceptions():
+    GF = galois.GF(2**100)
+    with pytest.raises(TypeError):
+        galois.GF(2**8).compile("jit-lookup", parallel=1)
+    with pytest.raises(ValueError):
+        GF.compile("python-calculate", parallel=True)
@@ -36,6 +36,27 @@ class TestView:
             with pytest.raises(ValueError):
                 a = v.view(field)
 
+    def test_view_without_verification(self, field):
+        for dtype in field.dtypes:
+            v = np.array([[0, 1], [1, 0]], dtype=dtype)
+            for w in [v, v.T, v[:, 0]]:
+                a = field._view(w)
+                assert type(a) is field
+                assert a.dtype == dtype
+                assert np.array_equal(a, w)
+                if dtype != np.object_ and (w.flags.c_contiguous or w.flags.f_contiguous):
+                    assert np.shares_memory(a, w)
+
+            # The values aren't verified by the trusted view, but still are by view casting
+            if dtype != np.object_ and field.order > np.iinfo(dtype).max:
+                continue
+            v = np.array([0, 1, 0, field.order], dtype=dtype)
+            for w in [v, v[::2], v[1::2]]:
+                a = field._view(w)
+                assert np.array_equal(a.view(np.ndarray), w)
+            with pytest.raises(ValueError):
+                a = v.view(field)
+
 
 class TestAsType:
     def test_valid_dtypes(self, field):
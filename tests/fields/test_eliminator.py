@@ -0,0 +1,102 @@
+"""
+A pytest module to test the incremental Gaussian eliminator.
+"""
+import pytest
+import numpy as np
+
+import galois
+
+
+def test_exceptions():
+    GF = galois.GF(2**8)
+    with pytest.raises(TypeError):
+        galois.IncrementalEliminator(GF, 4.0)
+    with pytest.raises(TypeError):
+        galois.IncrementalEliminator(GF, 4, payload_size=2.0)
+    with pytest.raises(ValueError):
+        galois.IncrementalEliminator(GF, 0)
+    with pytest.raises(ValueError):
+        galois.IncrementalEliminator(GF, 4, payload_size=-1)
+
+    d = galois.IncrementalEliminator(GF, 4, payload_size=2)
+    with pytest.raises(TypeError):
+        d.add(galois.GF(31).Random(4), GF.Random(2))
+    with pytest.raises(ValueError):
+        d.add(GF.Random(5), GF.Random(2))
+    with pytest.raises(TypeError):
+        d.add(GF.Random(4))
+    with pytest.raises(ValueError):
+        d.add(GF.Random(4), GF.Random(3))
+    with pytest.raises(ValueError):
+        d.add(GF.Random((2, 4)), GF.Random(2))
+
+    d = galois.IncrementalEliminator(GF, 4)
+    with pytest.raises(ValueError):
+        d.add(GF.Random(4), GF.Random(2))
+
+
+def test_decode(field):
+    n, k = 6, 5
+    symbols = field.Random((n, k))
+    d = galois.IncrementalEliminator(field, n, payload_size=k)
+    assert d.rank == 0
+    assert not d.is_complete
+
+    while not d.is_complete:
+        rank = d.rank
+        c = field.Random(n)
+        innovative = d.add(c, c @ symbols)
+        assert d.rank == rank + innovative
+
+        # The basis is the reduced row echelon form of the rows added so far
+        basis = d.basis
+        assert basis.shape == (d.rank, n + k)
+        assert np.array_equal(basis[:,:n].row_reduce(), basis[:,:n])
+        assert np.array_equal(basis[:,n:], basis[:,:n] @ symbols)
+
+    assert np.all(d.is_decoded)
+    indices, payloads = d.decoded()
+    assert np.array_equal(indices, np.arange(n))
+    assert type(payloads) is field
+    assert np.array_equal(payloads, symbols)
+
+    # Once the rank is full, no row is innovative
+    c = field.Random(n)
+    assert not d.add(c, c @ symbols)
+
+
+def test_partial_decode():
+    GF = galois.GF(2**8)
+    symbols = GF.Random((4, 3))
+    d = galois.IncrementalEliminator(GF, 4, payload_size=3)
+
+    # Systematic packets decode their symbol immediately
+    assert d.add(GF([0, 0, 5, 0]), GF(5) * symbols[2])
+    assert d.is_decoded.tolist() == [False, False, True, False]
+    indices, payloads = d.decoded()
+    assert indices.tolist() == [2]
+    assert np.array_equal(payloads, symbols[2:3])
+
+    assert d.add(GF([1, 1, 0, 0]), symbols[0] + symbols[1])
+    assert d.is_decoded.tolist() == [False, False, True, False]
+    assert not d.add(GF([3, 3, 0, 0]), GF(3) * (symbols[0] + symbols[1]))
+    assert d.rank == 2
+    assert np.array_equal(d.pivots, [0, 2])
+
+    assert d.add(GF([0, 1, 7, 0]), symbols[1] + GF(7) * symbols[2])
+    assert d.is_decoded.tolist() == [True, True, True, False]
+    indices, payloads = d.decoded()
+    assert np.array_equal(payloads, symbols[0:3])
+
+
+def test_add_rows():
+    GF = galois.GF(31)
+    C = GF.Random((8, 4))
+    C[3] = C[0] + C[1]
+    d = galois.IncrementalEliminator(GF, 4)
+    innovative = d.add(C)
+    assert innovative.dtype == bool
+    assert innovative.shape == (8,)
+    assert not innovative[3]
+    assert d.rank == np.linalg.matrix_rank(C)
+    assert np.array_equal(d.basis, C.row_reduce()[:d.rank])
@@ -0,0 +1,73 @@
+"""
+A pytest module to test bit-packed GF(2) arrays.
+"""
+import pytest
+import numpy as np
+
+import galois
+
+SHAPES = [(1,), (63,), (64,), (65,), (3, 130), (2, 3, 200)]
+
+
+def test_exceptions():
+    with pytest.raises(ValueError):
+        galois.GF2Packed(1)
+    with pytest.raises(ValueError):
+        galois.GF2Packed([0, 1, 2])
+    x = galois.GF2Packed(galois.GF2.Random(10))
+    with pytest.raises(TypeError):
+        x + galois.GF2.Random(10)
+    with pytest.raises(ValueError):
+        x + galois.GF2Packed(galois.GF2.Random(11))
+    with pytest.raises(ValueError):
+        galois.GF2Packed(galois.GF2.Random((2, 10))) @ galois.GF2Packed(galois.GF2.Random((11, 3)))
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_pack_unpack(shape):
+    x = galois.GF2.Random(shape)
+    p = galois.GF2Packed(x)
+    assert p.shape == shape
+    assert p.words.dtype == np.uint64
+    assert p.words.shape == shape[:-1] + ((shape[-1] + 63) // 64,)
+    assert p.nbytes == 8 * p.words.size
+    y = p.unpack()
+    assert type(y) is galois.GF2
+    assert np.array_equal(y, x)
+    assert galois.GF2Packed(x.view(np.ndarray)) == p
+    assert galois.GF2Packed(x.tolist()) == p
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_arithmetic(shape):
+    x = galois.GF2.Random(shape)
+    y = galois.GF2.Random(shape)
+    px, py = galois.GF2Packed(x), galois.GF2Packed(y)
+    assert np.array_equal((px + py).unpack(), x + y)
+    assert np.array_equal((px - py).unpack(), x - y)
+    assert np.array_equal((px ^ py).unpack(), x + y)
+    assert np.array_equal((px * py).unpack(), x * y)
+    assert np.array_equal((px & py).unpack(), x * y)
+    assert np.array_equal((-px).unpack(), -x)
+
+
+@pytest.mark.parametrize("shape", [((5, 10), (10, 7)), ((4, 130), (130, 65)), ((70,), (70, 200)), ((1, 1), (1, 1))])
+def test_matmul(shape):
+    A = galois.GF2.Random(shape[0])
+    B = galois.GF2.Random(shape[1])
+    C = galois.GF2Packed(A) @ galois.GF2Packed(B)
+    assert type(C) is galois.GF2Packed
+    assert C.shape == (A @ B).shape
+    assert np.array_equal(C.unpack(), A @ B)
+
+
+def test_indexing():
+    x = galois.GF2.Random((4, 5, 100))
+    p = galois.GF2Packed(x)
+    assert len(p) == 4
+    assert np.array_equal(p[1].unpack(), x[1])
+    assert np.array_equal(p[1:3, 2].unpack(), x[1:3, 2])
+    assert np.array_equal(p[..., 10:80].unpack(), x[..., 10:80])
+    assert np.array_equal(p[:, :, 70].unpack(), x[:, :, 70])
+    assert p[2, 3, 99] == x[2, 3, 99]
+    assert type(p[2, 3, 99]) is galois.GF2
@@ -235,24 +235,87 @@ def test_matmul_2d_2d(field):
     assert array_equal(A @ B, np.matmul(A, B))
 
 
-# def test_matmul_nd_2d(field):
-#     A = field.Random((2,3,4), dtype=dtype)
-#     B = field.Random((4,3), dtype=dtype)
-#     C = A @ B
-#     assert array_equal(C[0,0,0], np.sum(A[0,0,:] * B[:,0]))  # Spot check
-#     assert C.shape == (2,3,3)
-#     assert type(C) is field
-#     assert array_equal(A @ B, np.matmul(A, B))
-
-
-# def test_matmul_nd_nd(field):
-#     A = field.Random((2,3,4), dtype=dtype)
-#     B = field.Random((2,4,3), dtype=dtype)
-#     C = A @ B
-#     assert array_equal(C[0,0,0], np.sum(A[0,0,:] * B[0,:,0]))  # Spot check
-#     assert C.shape == (2,3,3)
-#     assert type(C) is field
-#     assert array_equal(A @ B, np.matmul(A, B))
+def test_matmul_2d_2d_wide(field):
+    dtype = random.choice(field.dtypes)
+    A = field.Random((3,4), dtype=dtype)
+    B = field.Random((4,300), dtype=dtype)
+    C = A @ B
+    assert C[0,0] == np.sum(A[0,:] * B[:,0])  # Spot check
+    assert C[2,299] == np.sum(A[2,:] * B[:,299])  # Spot check
+    assert C.shape == (3,300)
+    assert type(C) is field
+    assert C.dtype == dtype
+    assert array_equal(A @ B, np.matmul(A, B))
+
+
+def test_matmul_nd_1d(field):
+    dtype = random.choice(field.dtypes)
+    A = field.Random((2,3,4), dtype=dtype)
+    B = field.Random(4, dtype=dtype)
+    C = A @ B
+    assert C[1,2] == np.sum(A[1,2,:] * B)  # Spot check
+    assert C.shape == (2,3)
+    assert type(C) is field
+    assert C.dtype == dtype
+    assert array_equal(A @ B, np.matmul(A, B))
+
+
+def test_matmul_nd_2d(field):
+    dtype = random.choice(field.dtypes)
+    A = field.Random((2,3,4), dtype=dtype)
+    B = field.Random((4,3), dtype=dtype)
+    C = A @ B
+    assert C[0,0,0] == np.sum(A[0,0,:] * B[:,0])  # Spot check
+    assert C.shape == (2,3,3)
+    assert type(C) is field
+    assert C.dtype == dtype
+    assert array_equal(A @ B, np.matmul(A, B))
+
+
+def test_matmul_nd_nd(field):
+    dtype = random.choice(field.dtypes)
+    A = field.Random((2,3,4), dtype=dtype)
+    B = field.Random((2,4,3), dtype=dtype)
+    C = A @ B
+    assert C[1,2,0] == np.sum(A[1,2,:] * B[1,:,0])  # Spot check
+    assert C.shape == (2,3,3)
+    assert type(C) is field
+    assert C.dtype == dtype
+    assert array_equal(A @ B, np.matmul(A, B))
+    assert array_equal(C[1], A[1] @ B[1])
+
+
+def test_matmul_nd_nd_broadcast(field):
+    dtype = random.choice(field.dtypes)
+    A = field.Random((2,1,3,4), dtype=dtype)
+    B = field.Random((5,4,3), dtype=dtype)
+    C = A @ B
+    assert C.shape == (2,5,3,3)
+    assert type(C) is field
+    assert C.dtype == dtype
+    assert array_equal(C[1,4], A[1,0] @ B[4])
+
+    with pytest.raises(ValueError):
+        field.Random((2,3,4), dtype=dtype) @ field.Random((3,4,3), dtype=dtype)
+
+
+@pytest.mark.parametrize("order", [2097143, 2147483629, 36893488147419103183])
+def test_prime_field_products_exact(order):
+    # Prime field products are computed in float64 over blocks of the summation, and over 16-bit limbs for large primes
+    GF = galois.GF(order)
+    K = 5_000 if order < 2**21 else 100
+    A = GF.Random((3, K))
+    B = GF.Random((K, 4))
+    x = GF.Random(K)
+    A_int = A.view(np.ndarray).astype(object)
+    B_int = B.view(np.ndarray).astype(object)
+    x_int = x.view(np.ndarray).astype(object)
+
+    assert np.array_equal(A @ B, (A_int @ B_int) % order)
+    assert np.array_equal(np.dot(A, x), np.dot(A_int, x_int) % order)
+    assert np.array_equal(np.inner(A, B.T), np.inner(A_int, B_int.T) % order)
+    assert np.vdot(x, x) == np.vdot(x_int, x_int) % order
+    assert np.array_equal(np.convolve(x, x[0:50]), np.convolve(x_int, x_int[0:50]) % order)
 
 
 def full_rank_matrix(field, n, dtype):
@@ -264,6 +327,143 @@ def full_rank_matrix(field, n, dtype):
     return A
 
 
+def full_rank_matrices(field, shape, n, dtype):
+    A = field.Zeros(shape + (n,n), dtype=dtype)
+    for idx in np.ndindex(*shape):
+        A[idx] = full_rank_matrix(field, n, dtype)
+    return A
+
+
+def test_matrix_inverse_stacked(field):
+    dtype = random.choice(field.dtypes)
+    A = full_rank_matrices(field, (2,3), 4, dtype)
+    A_inv = np.linalg.inv(A)
+    assert type(A_inv) is field
+    assert A_inv.dtype == dtype
+    assert A_inv.shape == (2,3,4,4)
+    for idx in np.ndindex(2, 3):
+        assert array_equal(A_inv[idx], np.linalg.inv(A[idx]))
+
+    A[1,2,0,:] = A[1,2,1,:]
+    with pytest.raises(np.linalg.LinAlgError):
+        np.linalg.inv(A)
+
+
+@pytest.mark.parametrize("n", [2, 3, 5])
+def test_matrix_determinant_stacked(field, n):
+    dtype = random.choice(field.dtypes)
+    A = field.Random((2,3,n,n), dtype=dtype)
+    A[0,0] = 0
+    d = np.linalg.det(A)
+    assert type(d) is field
+    assert d.shape == (2,3)
+    for idx in np.ndindex(2, 3):
+        assert d[idx] == np.linalg.det(A[idx])
+
+
+def test_matrix_solve_stacked(field):
+    dtype = random.choice(field.dtypes)
+    A = full_rank_matrices(field, (2,3), 4, dtype)
+
+    b = field.Random((2,3,4), dtype=dtype)
+    x = np.linalg.solve(A, b)
+    assert type(x) is field
+    assert x.shape == (2,3,4)
+    for idx in np.ndindex(2, 3):
+        assert array_equal(A[idx] @ x[idx], b[idx])
+
+    # The stacks of matrices are broadcast
+    B = field.Random((1,3,4,2), dtype=dtype)
+    X = np.linalg.solve(A, B)
+    assert X.shape == (2,3,4,2)
+    for idx in np.ndindex(2, 3):
+        assert array_equal(A[idx] @ X[idx], B[(0,) + idx[1:]])
+
+    # A single vector has too few dimensions, like in NumPy 1.x, so it's broadcast to a stack of vectors instead
+    b = field.Random(4, dtype=dtype)
+    with pytest.raises(np.linalg.LinAlgError):
+        np.linalg.solve(A, b)
+    x = np.linalg.solve(A, np.broadcast_to(b, A.shape[:-1]))
+    assert x.shape == (2,3,4)
+    for idx in np.ndindex(2, 3):
+        assert array_equal(A[idx] @ x[idx], b)
+
+    # With A of shape (k, n, n), b of shape (k, n) is a stack of k vectors, not one (k, n) matrix, even when k = n
+    A = full_rank_matrices(field, (4,), 4, dtype)
+    b = field.Random((4,4), dtype=dtype)
+    x = np.linalg.solve(A, b)
+    assert x.shape == (4,4)
+    for i in range(4):
+        assert array_equal(A[i] @ x[i], b[i])
+
+
+def test_lu_factor_exceptions():
+    GF = galois.GF(2**8)
+    with pytest.raises(TypeError):
+        GF.lu_factor(galois.GF(31).Random((3,3)))
+    with pytest.raises(np.linalg.LinAlgError):
+        GF.lu_factor(GF.Random((3,4)))
+    with pytest.raises(np.linalg.LinAlgError):
+        GF.lu_factor(GF([[1, 2], [1, 2]]))
+
+    LU = GF.lu_factor(GF([[1, 2], [3, 4]]))
+    with pytest.raises(TypeError):
+        LU.solve(galois.GF(31)([1, 2]))
+    with pytest.raises(np.linalg.LinAlgError):
+        LU.solve(GF([1, 2, 3]))
+    with pytest.raises(np.linalg.LinAlgError):
+        LU.solve(GF.Random((3, 2)))
+
+
+def test_lu_factor(field):
+    dtype = random.choice(field.dtypes)
+    A = full_rank_matrix(field, 5, dtype)
+    LU = field.lu_factor(A)
+    assert LU.field is field
+    assert array_equal(LU.P @ LU.L @ LU.U, A)
+    assert LU.det() == np.linalg.det(A)
+
+    b = field.Random(5, dtype=dtype)
+    x = LU.solve(b)
+    assert type(x) is field
+    assert x.dtype == dtype
+    assert array_equal(x, np.linalg.solve(A, b))
+
+    B = field.Random((5,7), dtype=dtype)
+    X = LU.solve(B)
+    assert X.shape == (5,7)
+    assert array_equal(A @ X, B)
+
+    B = field.Random((2,3,5,4), dtype=dtype)
+    X = LU.solve(B)
+    assert X.shape == (2,3,5,4)
+    assert array_equal(A @ X, B)
+
+
+def test_lu_factor_cache():
+    GF = galois.GF(31)
+    A = GF([[1, 2], [3, 4]])
+    assert GF.lu_factor(A, cache=True) is GF.lu_factor(A.copy(), cache=True)
+    assert GF.lu_factor(A) is not GF.lu_factor(A)
+    assert GF.lu_factor(A, cache=True) is not GF.lu_factor(GF([[1, 2], [3, 5]]), cache=True)
+    assert GF.lu_factor(A, cache=True) is not galois.GF(37).lu_factor(galois.GF(37)(A), cache=True)
+
+    # The cached factorization can't be modified through its arrays
+    with pytest.raises(ValueError):
+        GF.lu_factor(A, cache=True).lu[0,0] = 0
+
+
+def test_matrix_rank_stacked(field):
+    dtype = random.choice(field.dtypes)
+    A = field.Random((4,5,6), dtype=dtype)
+    A[1,2,:] = 0
+    A[2,:,0] = A[2,:,1]
+    A[3] = 0
+    rank = np.linalg.matrix_rank(A)
+    assert rank.shape == (4,)
+    assert rank.tolist() == [np.linalg.matrix_rank(A[i]) for i in range(4)]
+
+
 ###############################################################################
 # Tests against Sage test vectors
 ###############################################################################
@@ -301,6 +501,49 @@ def test_row_reduce(field_row_reduce):
         assert type(z) is GF
 
 
+def test_row_reduce_gf2_large():
+    # GF(2) matrices are row reduced on packed words with the Method of Four Russians, so test sizes spanning several words
+    GF = galois.GF2
+    m, n, r = 150, 200, 130
+    B = np.concatenate((GF.Identity(r), GF.Random((m - r, r))), axis=0)
+    C = np.concatenate((GF.Identity(r), GF.Random((r, n - r))), axis=1)
+    A = (B @ C)[np.random.permutation(m),:][:,np.random.permutation(n)]
+    assert np.linalg.matrix_rank(A) == r
+
+    A_rre = A.row_reduce()
+    assert type(A_rre) is GF
+    assert np.all(A_rre[r:,:] == 0)
+    pivots = [np.nonzero(A_rre[i,:])[0][0] for i in range(r)]
+    assert pivots == sorted(pivots)
+    assert np.array_equal(A_rre[:,pivots], np.concatenate((GF.Identity(r), GF.Zeros((m - r, r))), axis=0))
+    assert np.linalg.matrix_rank(np.concatenate((A, A_rre), axis=0)) == r
+
+    A = full_rank_matrix(GF, 150, np.uint8)
+    assert np.array_equal(A @ np.linalg.inv(A), GF.Identity(150))
+    b = GF.Random(150)
+    assert np.array_equal(A @ np.linalg.solve(A, b), b)
+
+
+@pytest.mark.parametrize("order", [31, 2**8, 3**5])
+def test_gaussian_elimination_ufunc_modes(order):
+    # The lookup and explicit calculation elimination kernels must agree
+    GF = galois.GF(order)
+    A = GF.Random((30, 40))
+    A[:,5] = 0
+    A[:,7] = A[:,3] + A[:,4]
+    B = full_rank_matrix(GF, 20, GF.dtypes[0])
+
+    results = []
+    for ufunc_mode in GF.ufunc_modes:
+        GF.compile(ufunc_mode)
+        results.append((A.row_reduce(), B.plu_decompose(), np.linalg.det(B), np.linalg.inv(B)))
+    GF.compile("auto")
+
+    for result in results[1:]:
+        for x, y in zip(results[0], result):
+            assert np.array_equal(np.array(x, dtype=np.int64), np.array(y, dtype=np.int64))
+
+
 def test_lu_decompose_exceptions():
     GF = galois.GF(2**8)
     with pytest.raises(ValueError):
@@ -355,7 +598,7 @@ def test_matrix_inverse_exceptions():
         A = GF.Random(5)
         np.linalg.inv(A)
     with pytest.raises(np.linalg.LinAlgError):
-        A = GF.Random((2,2,2))
+        A = GF.Random((2,2,3))
         np.linalg.inv(A)
 
 
@@ -376,7 +619,7 @@ def test_matrix_determinant_exceptions():
         A = GF.Random(5)
         np.linalg.det(A)
     with pytest.raises(np.linalg.LinAlgError):
-        A = GF.Random((2,2,2))
+        A = GF.Random((2,2,3))
         np.linalg.det(A)
 
 
@@ -30,6 +30,20 @@ def test_copy(field):
     assert d is not a
 
 
+def test_getitem_scalar(field):
+    dtype = random.choice(field.dtypes)
+    a = field.Random((2,3), dtype=dtype)
+    b = a[1,2]
+    assert type(b) is field
+    assert b.dtype == dtype
+    assert b.shape == ()
+    assert b == a.view(np.ndarray)[1,2]
+
+    # The scalar is a copy of the element, not a view into the array
+    b += field(1)
+    assert b == field(a.view(np.ndarray)[1,2]) + field(1)
+
+
 def test_shape(field):
     dtype = random.choice(field.dtypes)
     shape = ()
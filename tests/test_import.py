@@ -0,0 +1,29 @@
+"""
+A pytest module to test the lazy import of the library.
+"""
+import importlib
+import subprocess
+import sys
+
+import galois
+
+
+def test_import_does_not_import_numba():
+    code = "import sys; import galois; assert galois.is_prime(2**61 - 1); assert 'numba' not in sys.modules and 'galois._fields' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_names():
+    for module, names in galois._LAZY_SUBMODULES.items():
+        mod = importlib.import_module(f"galois.{module}")
+        public = getattr(mod, "__all__", None) or [name for name, value in vars(mod).items() if not name.startswith("_") and not isinstance(value, type(galois))]
+        assert sorted(names) == sorted(public)
+        for name in names:
+            assert getattr(galois, name) is getattr(mod, name)
+
+
+def test_dir():
+    assert set(galois.__all__) <= set(dir(galois))
+    for name in galois.__all__:
+        assert hasattr(galois, name)
+    assert not hasattr(galois, "_not_a_submodule")
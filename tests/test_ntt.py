@@ -24,6 +24,8 @@ def test_ntt_exceptions():
         galois.ntt([1, 2, 3, 4], size=6.0)
     with pytest.raises(TypeError):
         galois.ntt([1, 2, 3, 4], modulus=3*256 + 1.0)
+    with pytest.raises(TypeError):
+        galois.ntt([1, 2, 3, 4], axis=0.0)
 
     with pytest.raises(ValueError):
         GF = galois.GF(2**8)  # Invalid field for NTTs
@@ -32,6 +34,8 @@ def test_ntt_exceptions():
         galois.ntt([1, 2, 3, 4], size=3)
     with pytest.raises(ValueError):
         galois.ntt([1, 2, 3, 40], modulus=13)
+    with pytest.raises(ValueError):
+        galois.ntt([1, 2, 3, 4], axis=1)
 
 
 @pytest.mark.parametrize(["x", "p", "X"], NTT_LUTS)
@@ -116,3 +120,50 @@ def test_intt_unscaled(x, p, X):
     x_test = galois.intt(GF(X), scaled=False)
     assert isinstance(x_test, GF)
     assert np.array_equal(x_test, x)
+
+
+def _ntt_vandermonde(x, p, forward=True):
+    """
+    The O(N^2) reference NTT computed with a Vandermonde matrix.
+    """
+    GF = galois.GF(p)
+    N = x.size
+    m = (p - 1) // N
+    g = galois.primitive_root(p)
+    omega = GF(g)**m if forward else GF(g)**-m
+    return GF.Vandermonde(omega, N, N) @ GF(x)
+
+
+@pytest.mark.parametrize(["p", "N"], [(17, 16), (13, 12), (37, 9), (97, 96), (7681, 512), (2**64 - 2**32 + 1, 12)])
+def test_ntt_mixed_radix(p, N):
+    GF = galois.GF(p)
+    x = GF.Random(N)
+
+    X = galois.ntt(x)
+    assert isinstance(X, GF)
+    assert np.array_equal(X, _ntt_vandermonde(x, p))
+
+    x_test = galois.intt(X)
+    assert isinstance(x_test, GF)
+    assert np.array_equal(x_test, x)
+
+
+def test_ntt_axis():
+    GF = galois.GF(13)
+    x = GF.Random((3, 4, 6))
+
+    X = galois.ntt(x, axis=1)
+    assert isinstance(X, GF)
+    assert X.shape == (3, 4, 6)
+    for i in range(3):
+        for k in range(6):
+            assert np.array_equal(X[i,:,k], galois.ntt(x[i,:,k]))
+
+    X = galois.ntt(x, size=12, axis=-1)
+    assert X.shape == (3, 4, 12)
+    for i in range(3):
+        for j in range(4):
+            assert np.array_equal(X[i,j,:], galois.ntt(x[i,j,:], size=12))
+
+    x_test = galois.intt(galois.ntt(x, axis=0), axis=0)
+    assert np.array_equal(x_test, x)
@@ -25,8 +25,6 @@ def test_kth_prime_exceptions():
         galois.kth_prime(20.0)
     with pytest.raises(ValueError):
         galois.kth_prime(0)
-    with pytest.raises(ValueError):
-        galois.kth_prime(galois._prime.MAX_K + 1)
 
 
 def test_kth_prime(kth_prime):
@@ -35,6 +33,33 @@ def test_kth_prime(kth_prime):
         assert galois.kth_prime(X[i]) == Z[i]
 
 
+def test_kth_prime_grows_lookup_table():
+    k = galois._prime.MAX_K + 1
+    p = galois.kth_prime(k)
+    assert isinstance(p, int)
+    assert galois._prime.MAX_K >= k
+    assert p == galois.next_prime(galois.kth_prime(k - 1))
+
+
+def test_primes_lookup_table_cache(tmp_path, monkeypatch):
+    path = str(tmp_path / "primes.npy")
+    monkeypatch.setenv("GALOIS_PRIMES_CACHE", path)
+    monkeypatch.setattr(galois._prime, "PRIMES", np.array([2, 3, 5, 7], dtype=np.int64))
+    monkeypatch.setattr(galois._prime, "MAX_K", 4)
+    monkeypatch.setattr(galois._prime, "MAX_N", 10)
+
+    p = galois.primes(10_000)
+    assert np.array_equal(np.load(path)[0:-1], galois._prime.PRIMES)
+    assert np.load(path)[-1] == galois._prime.MAX_N
+
+    # A fresh lookup table is loaded from the cache file
+    monkeypatch.setattr(galois._prime, "PRIMES", np.array([2, 3, 5, 7], dtype=np.int64))
+    monkeypatch.setattr(galois._prime, "MAX_K", 4)
+    monkeypatch.setattr(galois._prime, "MAX_N", 10)
+    assert galois.primes(10_000) == p
+    assert isinstance(galois._prime.PRIMES, np.memmap)
+
+
 def test_prev_prime_exceptions():
     with pytest.raises(TypeError):
         galois.prev_prime(20.0)
@@ -262,6 +287,15 @@ def test_miller_rabin_primality_test_exceptions():
         galois.miller_rabin_primality_test(13, rounds=0)
 
 
+def test_miller_rabin_primality_test_grows_lookup_table(monkeypatch):
+    # The witnesses after the first round are read from the prime lookup table, which starts with only a few primes
+    monkeypatch.setattr(galois._prime, "PRIMES", np.array([2, 3, 5, 7], dtype=np.int64))
+    monkeypatch.setattr(galois._prime, "MAX_K", 4)
+    monkeypatch.setattr(galois._prime, "MAX_N", 10)
+    assert galois.miller_rabin_primality_test(65521, rounds=10) is True
+    assert galois.is_prime(2**31 - 1)
+
+
 def test_miller_rabin_primality_test():
     primes = random.choices(galois.primes(10_000_000), k=10)
     assert [galois.miller_rabin_primality_test(p) for p in primes] == [True,]*len(primes)
@@ -0,0 +1,154 @@
+"""
+A pytest module to test sparse matrices over Galois fields.
+"""
+import pytest
+import numpy as np
+
+import galois
+
+FIELDS = [
+    galois.GF2,
+    galois.GF(31),
+    galois.GF(31, compile="jit-calculate"),
+    galois.GF(2**8),
+    galois.GF(2**8, compile="jit-calculate"),
+    galois.GF(3**5),
+    galois.GF(2**61 - 1),
+]
+
+
+def nonsingular_sparse_matrix(GF, n, row_weight, seed):
+    """
+    Returns a random sparse matrix with a non-zero diagonal that has full rank. Over GF(2), `row_weight` must be even so
+    the rows have odd weight, otherwise A @ 1 = 0.
+    """
+    while True:
+        R = galois.SparseMatrix.Random(GF, (n, n), row_weight, seed=seed)
+        rows = np.concatenate((np.repeat(np.arange(n), row_weight), np.arange(n)))
+        cols = np.concatenate((R.indices, np.arange(n)))
+        A = galois.SparseMatrix.COO(np.concatenate((R.data, GF.Random(n, low=1, seed=seed))), rows, cols, (n, n))
+        if np.linalg.matrix_rank(A.toarray()) == n:
+            return A
+        seed += 1
+
+
+def test_exceptions():
+    GF = galois.GF(31)
+    with pytest.raises(TypeError):
+        galois.SparseMatrix(np.eye(3, dtype=int))
+    with pytest.raises(ValueError):
+        galois.SparseMatrix(GF.Random(3))
+    with pytest.raises(TypeError):
+        galois.SparseMatrix.COO([1, 2], [0, 1], [0, 1], (2, 2))
+    with pytest.raises(ValueError):
+        galois.SparseMatrix.COO(GF([1, 2]), [0, 1], [0], (2, 2))
+    with pytest.raises(ValueError):
+        galois.SparseMatrix.COO(GF([1, 2]), [0, 2], [0, 1], (2, 2))
+    with pytest.raises(TypeError):
+        galois.SparseMatrix.Random(31, (2, 2), 1)
+    with pytest.raises(ValueError):
+        galois.SparseMatrix.Random(GF, (2, 2), 3)
+
+    A = galois.SparseMatrix(GF.Random((3, 4)))
+    with pytest.raises(TypeError):
+        A @ galois.GF(37).Random(4)
+    with pytest.raises(ValueError):
+        A @ GF.Random(3)
+    with pytest.raises(ValueError):
+        A @ GF.Random((4, 2, 2))
+    with pytest.raises(np.linalg.LinAlgError):
+        A.solve(GF.Random(3))
+
+    A = galois.SparseMatrix(GF.Identity(3))
+    with pytest.raises(TypeError):
+        A.solve(galois.GF(37).Random(3))
+    with pytest.raises(np.linalg.LinAlgError):
+        A.solve(GF.Random(4))
+
+
+def test_coo():
+    GF = galois.GF(7)
+    A = galois.SparseMatrix.COO(GF([3, 4, 2, 5, 6]), [2, 0, 2, 1, 0], [1, 3, 1, 0, 3], (3, 4))
+    assert A.shape == (3, 4)
+    assert A.field is GF
+    # The repeated coordinates sum to 3 + 2 = 5 and 4 + 6 = 3, and zeros are dropped
+    assert A.nnz == 3
+    assert np.array_equal(A.indptr, [0, 1, 2, 3])
+    assert np.array_equal(A.indices, [3, 0, 1])
+    assert np.array_equal(A.data, [3, 5, 5])
+    assert np.array_equal(A.toarray(), [[0, 0, 0, 3], [5, 0, 0, 0], [0, 5, 0, 0]])
+
+    A = galois.SparseMatrix.COO(GF([1, 6]), [1, 1], [2, 2], (3, 4))
+    assert A.nnz == 0
+    assert np.array_equal(A.toarray(), GF.Zeros((3, 4)))
+
+
+@pytest.mark.parametrize("GF", FIELDS)
+def test_conversion(GF):
+    D = GF.Random((5, 7))
+    D[D == 1] = 0
+    A = galois.SparseMatrix(D)
+    assert A.nnz == np.count_nonzero(D.view(np.ndarray))
+    assert type(A.toarray()) is GF
+    assert np.array_equal(A.toarray(), D)
+    assert np.array_equal(A.T.toarray(), D.T)
+    assert np.array_equal(A.T.T.toarray(), D)
+
+    A = galois.SparseMatrix.Random(GF, (20, 30), 4, seed=1)
+    assert np.all(np.diff(A.indptr) == 4)
+    assert np.count_nonzero(A.toarray().view(np.ndarray)) == 80
+
+
+@pytest.mark.parametrize("GF", FIELDS)
+def test_matmul(GF):
+    A = galois.SparseMatrix.Random(GF, (20, 30), 4, seed=1)
+    D = A.toarray()
+
+    x = GF.Random(30)
+    y = A @ x
+    assert type(y) is GF
+    assert np.array_equal(y, D @ x)
+
+    X = GF.Random((30, 5))
+    assert np.array_equal(A @ X, D @ X)
+
+    x = GF.Random(20)
+    assert np.array_equal(x @ A, x @ D)
+    X = GF.Random((5, 20))
+    assert np.array_equal(X @ A, X @ D)
+
+
+@pytest.mark.parametrize("GF", FIELDS)
+def test_solve_structured_elimination(GF):
+    # A permuted triangular matrix is solved entirely by structured elimination
+    n = 50
+    rng = np.random.default_rng(1)
+    D = np.triu(GF.Random((n, n), seed=2)) * (GF.Random((n, n), seed=3) == 0)
+    D[np.arange(n), np.arange(n)] = GF.Random(n, low=1, seed=4)
+    D = GF(D)[rng.permutation(n),:][:,rng.permutation(n)]
+    A = galois.SparseMatrix(D)
+    x = GF.Random(n)
+    b = D @ x
+    assert np.array_equal(A.solve(b), x)
+
+
+@pytest.mark.parametrize("GF", FIELDS)
+def test_solve_wiedemann(GF):
+    n = 40
+    A = nonsingular_sparse_matrix(GF, n, 4, seed=1)
+    x = GF.Random(n)
+    b = A @ x
+    y = A.solve(b, seed=2)
+    assert type(y) is GF
+    assert np.array_equal(y, x)
+
+
+def test_solve_singular():
+    GF = galois.GF(2**8)
+    D = GF.Random((6, 6), low=1)
+    D[5] = D[0] + D[1]
+    A = galois.SparseMatrix(D)
+    b = GF.Random(6)
+    b[5] = b[0] + b[1] + GF(1)
+    with pytest.raises(np.linalg.LinAlgError):
+        A.solve(b, seed=1)